@@ -4,7 +4,6 @@ import os
 import asyncio
 from pathlib import Path
 import sys
-import json
 import time
 
 import typer
@@ -43,83 +42,27 @@ async def _prepare_runtime(workspace_root: Path, agent_name: str):
     return runtime, agent_id
 
 
-async def _stream_ollama_chat(
-    endpoint: str, model: str, messages: list[Message]
-) -> None:
-    url = f"{endpoint.rstrip('/')}/api/chat"
-    payload = {
-        "model": model,
-        "messages": [{"role": m.role, "content": m.content} for m in messages],
-        "stream": True,
-    }
+async def _stream_chat(
+    manager: IModelManager,
+    spec: ModelSpec,
+    messages: list[Message],
+    timeout: float | None = None,
+) -> str:
+    """Stream a reply from a model manager to stdout and return the full text."""
+    model_id = await manager.load_model(spec)
+    parts: list[str] = []
     try:
-        import httpx  # local import to avoid hard dep in non-stream paths
-
-        async with httpx.AsyncClient(timeout=None) as client:
-            async with client.stream("POST", url, json=payload) as resp:
-                resp.raise_for_status()
-                async for line in resp.aiter_lines():
-                    if not line:
-                        continue
-                    try:
-                        data = json.loads(line)
-                        content = data.get("message", {}).get("content") or data.get(
-                            "delta"
-                        )
-                        if content:
-                            sys.stdout.write(str(content))
-                            sys.stdout.flush()
-                    except Exception:
-                        # Write raw if malformed
-                        sys.stdout.write(line)
-                        sys.stdout.flush()
-        sys.stdout.write("\n")
-        sys.stdout.flush()
-    except Exception as exc:  # noqa: BLE001
-        rprint(f"[red]Error (Ollama stream):[/red] {exc}")
-        raise
-
-
-async def _stream_lmstudio_chat(
-    endpoint: str, model: str, messages: list[Message]
-) -> None:
-    url = f"{endpoint.rstrip('/')}/chat/completions"
-    payload = {
-        "model": model,
-        "messages": [{"role": m.role, "content": m.content} for m in messages],
-        "stream": True,
-    }
-    try:
-        import httpx  # local import to avoid hard dep in non-stream paths
-
-        async with httpx.AsyncClient(timeout=None) as client:
-            async with client.stream("POST", url, json=payload) as resp:
-                resp.raise_for_status()
-                async for line in resp.aiter_lines():
-                    if not line:
-                        continue
-                    if line.startswith("data: "):
-                        line = line[len("data: ") :]
-                    if line.strip() == "[DONE]":
-                        break
-                    try:
-                        data = json.loads(line)
-                        delta = (
-                            (data.get("choices") or [{}])[0].get("delta") or {}
-                        ).get("content") or (
-                            (data.get("choices") or [{}])[0].get("message") or {}
-                        ).get("content")
-                        if delta:
-                            sys.stdout.write(str(delta))
-                            sys.stdout.flush()
-                    except Exception:
-                        sys.stdout.write(line)
-                        sys.stdout.flush()
+        async for chunk in manager.stream_chat(model_id, messages, timeout=timeout):
+            if chunk.content:
+                parts.append(chunk.content)
+                sys.stdout.write(chunk.content)
+                sys.stdout.flush()
         sys.stdout.write("\n")
         sys.stdout.flush()
     except Exception as exc:  # noqa: BLE001
-        rprint(f"[red]Error (LM Studio stream):[/red] {exc}")
+        rprint(f"[red]Error ({spec.provider} stream):[/red] {exc}")
         raise
+    return "".join(parts)
 
 
 @app.command()
@@ -223,6 +166,29 @@ def chat(
         display = f"{agent} ({use_provider}:{use_model})"
         return ident, display
 
+    def _direct_manager() -> IModelManager:
+        if use_provider == "ollama":
+            return OllamaModelManager(
+                endpoint=endpoints.get(
+                    "ollama", os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+                )
+            )
+        return LMStudioModelManager(
+            endpoint=endpoints.get(
+                "lmstudio", os.environ.get("LMSTUDIO_HOST", "http://localhost:1234/v1")
+            )
+        )
+
+    def _direct_spec() -> ModelSpec:
+        if not use_model:
+            raise ValueError("Model not set")
+        return ModelSpec(
+            model_id=use_model,
+            provider=use_provider,
+            model_name=use_model,
+            memory_requirement_gb=0.0,
+        )  # type: ignore[arg-type]
+
     def _print_response(text: str) -> None:
         # Normalize and ensure string
         try:
@@ -270,18 +236,9 @@ def chat(
         try:
             if use_direct_model:
                 if stream:
-                    if use_provider == "ollama":
-                        endpoint = endpoints.get(
-                            "ollama",
-                            os.environ.get("OLLAMA_HOST", "http://localhost:11434"),
-                        )
-                        await _stream_ollama_chat(endpoint, str(use_model), [msg])  # type: ignore[arg-type]
-                    else:
-                        endpoint = endpoints.get(
-                            "lmstudio",
-                            os.environ.get("LMSTUDIO_HOST", "http://localhost:1234/v1"),
-                        )
-                        await _stream_lmstudio_chat(endpoint, str(use_model), [msg])  # type: ignore[arg-type]
+                    await _stream_chat(
+                        _direct_manager(), _direct_spec(), [msg], timeout=timeout
+                    )
                 else:
                     manager: IModelManager | None = None
                     if use_provider == "ollama":
@@ -432,26 +389,13 @@ def chat(
                     if use_direct_model:
                         conversation.append(msg)
                         if stream:
-                            if use_provider == "ollama":
-                                endpoint = endpoints.get(
-                                    "ollama",
-                                    os.environ.get(
-                                        "OLLAMA_HOST", "http://localhost:11434"
-                                    ),
-                                )
-                                await _stream_ollama_chat(
-                                    endpoint, str(use_model), conversation
-                                )  # type: ignore[arg-type]
-                            else:
-                                endpoint = endpoints.get(
-                                    "lmstudio",
-                                    os.environ.get(
-                                        "LMSTUDIO_HOST", "http://localhost:1234/v1"
-                                    ),
-                                )
-                                await _stream_lmstudio_chat(
-                                    endpoint, str(use_model), conversation
-                                )  # type: ignore[arg-type]
+                            text = await _stream_chat(
+                                _direct_manager(),
+                                _direct_spec(),
+                                conversation,
+                                timeout=timeout,
+                            )
+                            conversation.append(Message(content=text, role="assistant"))
                         else:
                             manager: IModelManager | None = None
                             if use_provider == "ollama":
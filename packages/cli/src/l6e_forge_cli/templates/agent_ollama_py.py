@@ -3,12 +3,14 @@ from __future__ import annotations
 AGENT_OLLAMA_PY = """
 from __future__ import annotations
 
+from typing import Any, AsyncIterator
+
 from l6e_forge.types.config import AgentConfig
 from l6e_forge.types.core import AgentContext, AgentResponse, Message
 from l6e_forge.types.error import HealthStatus
 from l6e_forge.runtime.base import IRuntime
 from l6e_forge.models.managers.ollama import IModelManager, OllamaModelManager
-from l6e_forge.types.model import ModelSpec
+from l6e_forge.types.model import ModelSpec, StreamingChunk
 from l6e_forge.core.agents.base import IAgent
 from l6e_forge.prompt import PromptBuilder
 
@@ -29,6 +31,17 @@ class Agent(IAgent):
         pass
 
     async def handle_message(self, message: Message, context: AgentContext) -> AgentResponse:
+        manager, model_id, prompt_msg = await self._prepare(message, context)
+        chat = await manager.chat(model_id, [prompt_msg])
+        return AgentResponse(content=chat.message.content, agent_id=self.name, response_time=0.0)
+
+    async def handle_message_stream(self, message: Message, context: AgentContext) -> AsyncIterator[StreamingChunk]:
+        # Same prompt as handle_message, but tokens are yielded as the model produces them
+        manager, model_id, prompt_msg = await self._prepare(message, context)
+        async for chunk in manager.stream_chat(model_id, [prompt_msg]):
+            yield chunk
+
+    async def _prepare(self, message: Message, context: AgentContext) -> tuple[IModelManager, Any, Message]:
         # Recall and store memory around the conversation
         try:
             mm = self.runtime.get_memory_manager()  # type: ignore[attr-defined]
@@ -75,9 +88,7 @@ class Agent(IAgent):
             extra_vars={"user_input": message.content, "recall": recall},
             k_limit=8,
         )
-        prompt_msg = Message(role="user", content=rendered)
-        chat = await manager.chat(model_id, [prompt_msg])
-        return AgentResponse(content=chat.message.content, agent_id=self.name, response_time=0.0)
+        return manager, model_id, Message(role="user", content=rendered)
 
     async def can_handle(self, message: Message, context: AgentContext) -> bool:
         return True
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Protocol, TYPE_CHECKING
+from typing import Any, AsyncIterator, Protocol, TYPE_CHECKING
 
 from l6e_forge.types.agent import Capability
 from l6e_forge.types.config import AgentConfig
 from l6e_forge.types.core import AgentContext, AgentResponse, Message
 from l6e_forge.types.error import HealthStatus
+from l6e_forge.types.model import StreamingChunk
 from l6e_forge.types.tool import ToolSpec
 
 if TYPE_CHECKING:
@@ -68,3 +69,17 @@ class IAgent(Protocol):
         If provided, this takes precedence over `get_result_processor_name` and env defaults.
         """
         ...
+
+
+class IStreamingAgent(Protocol):
+    """Optional capability: agents that can stream their reply token by token.
+
+    The runtime looks for ``handle_message_stream`` and falls back to
+    ``handle_message`` (emitting the whole reply as one chunk) when it is absent.
+    """
+
+    def handle_message_stream(
+        self, message: Message, context: AgentContext
+    ) -> AsyncIterator[StreamingChunk]:
+        """Yield reply chunks; the last chunk has ``is_complete=True``"""
+        ...
@@ -1,6 +1,7 @@
 from typing import Any, Dict, List, Optional, Protocol, Tuple
 
 from l6e_forge.types.error import HealthStatus
+from l6e_forge.types.memory import MetadataFilter
 
 
 class IMemoryBackend(Protocol):
@@ -44,6 +45,24 @@ class IMemoryBackend(Protocol):
         """
         ...
 
+    async def upsert_many(
+        self,
+        namespace: str,
+        points: List[Tuple[str, List[float], str, Dict[str, Any] | None]],
+        collection: str,
+        *,
+        ttl_seconds: Optional[int] = None,
+        wait: bool = True,
+    ) -> None:
+        """Insert or update many (key, embedding, content, metadata) points at once.
+
+        Backends SHOULD write the whole list in a single request and raise on
+        failure so bulk callers can account for the affected points. With
+        ``wait=False`` a backend MAY return before the write is applied;
+        bulk callers only wait on their final batch.
+        """
+        ...
+
     async def query(
         self,
         namespace: str,
@@ -51,10 +70,30 @@ class IMemoryBackend(Protocol):
         collection: str,
         *,
         limit: int = 10,
+        filters: Optional[MetadataFilter] = None,
     ) -> List[Tuple[str, float, Any]]:
         """Return list of (key, score, item) tuples sorted by score desc.
 
         The third element (item) is backend-specific and may expose content/metadata.
         Namespace MAY use the override form "collection::namespace" where supported.
+        ``filters`` restricts candidates by metadata before ranking, so up to
+        ``limit`` matching items are returned; see :data:`MetadataFilter`.
+        """
+        ...
+
+    async def query_many(
+        self,
+        queries: List[Tuple[str, str, int]],
+        query_embedding: List[float],
+        *,
+        filters: Optional[MetadataFilter] = None,
+    ) -> List[List[Tuple[str, float, Any]]]:
+        """Run several (namespace, collection, limit) searches with one shared embedding.
+
+        ``filters`` applies to every search in the batch.
+
+        Returns one result list per entry in ``queries``, in the same order, each
+        shaped like the output of :meth:`query`. Backends SHOULD answer the whole
+        batch in a single pass or round-trip.
         """
         ...
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from l6e_forge.types.memory import MetadataFilter
+
+RANGE_OPS = ("gt", "gte", "lt", "lte")
+OPS = ("eq", "in", *RANGE_OPS)
+
+
+@dataclass(frozen=True)
+class Condition:
+    field: str
+    op: str
+    value: Any
+
+
+def parse_filter(filters: Optional[MetadataFilter]) -> List[Condition]:
+    """Normalize a :data:`MetadataFilter` into ANDed conditions.
+
+    Raises ValueError for unknown operators or values that cannot be matched.
+    """
+    out: List[Condition] = []
+    for field_name, spec in (filters or {}).items():
+        if isinstance(spec, dict):
+            if not spec:
+                raise ValueError(f"Empty filter for field '{field_name}'")
+            for op, value in spec.items():
+                if op not in OPS:
+                    raise ValueError(
+                        f"Unknown filter operator '{op}' for field '{field_name}'"
+                    )
+                out.append(_condition(field_name, op, value))
+        elif isinstance(spec, (list, tuple, set, frozenset)):
+            out.append(_condition(field_name, "in", spec))
+        else:
+            out.append(_condition(field_name, "eq", spec))
+    return out
+
+
+def _condition(field_name: str, op: str, value: Any) -> Condition:
+    if op == "in":
+        if not isinstance(value, (list, tuple, set, frozenset)):
+            raise ValueError(f"'in' filter on '{field_name}' needs a list")
+        values = tuple(value)
+        for v in values:
+            _require_scalar(field_name, v)
+        return Condition(field_name, op, values)
+    if op in RANGE_OPS:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"'{op}' filter on '{field_name}' needs a number")
+        return Condition(field_name, op, float(value))
+    _require_scalar(field_name, value)
+    return Condition(field_name, op, value)
+
+
+def _require_scalar(field_name: str, value: Any) -> None:
+    if value is not None and not isinstance(value, (str, int, float, bool)):
+        raise ValueError(
+            f"Filter value for '{field_name}' must be a string, number or bool"
+        )
+
+
+def _key(value: Any) -> Hashable:
+    # Keep True distinct from 1 so bool fields do not match numeric filters
+    return (bool, value) if isinstance(value, bool) else value
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def flatten(
+    metadata: Optional[Dict[str, Any]], prefix: str = ""
+) -> Iterator[Tuple[str, Any]]:
+    """Yield (dotted field, scalar) pairs; list fields yield one pair per element."""
+    for k, v in (metadata or {}).items():
+        name = f"{prefix}{k}"
+        if isinstance(v, dict):
+            yield from flatten(v, f"{name}.")
+        elif isinstance(v, (list, tuple, set, frozenset)):
+            for element in v:
+                if element is None or isinstance(element, (str, int, float, bool)):
+                    yield name, element
+        elif v is None or isinstance(v, (str, int, float, bool)):
+            yield name, v
+
+
+class MetadataIndex:
+    """Inverted index over item metadata, evaluated into row bitmasks.
+
+    Equality and membership use per-field postings (value -> rows). Numeric
+    fields are also kept as a float64 column (NaN when absent) so range filters
+    are one vectorized comparison. Rows are the owning matrix's row numbers.
+    """
+
+    def __init__(self, capacity: int = 0) -> None:
+        self._postings: Dict[str, Dict[Hashable, Set[int]]] = {}
+        self._numeric: Dict[str, np.ndarray] = {}
+        self._capacity = capacity
+
+    def grow(self, capacity: int) -> None:
+        for name, col in self._numeric.items():
+            wider = np.full(capacity, np.nan, dtype=np.float64)
+            wider[: col.shape[0]] = col
+            self._numeric[name] = wider
+        self._capacity = capacity
+
+    def rebuild(self, metadatas: List[Optional[Dict[str, Any]]], capacity: int) -> None:
+        """Re-index after rows were renumbered (compaction or re-sorting)."""
+        self._postings = {}
+        self._numeric = {}
+        self._capacity = capacity
+        for row, metadata in enumerate(metadatas):
+            if metadata:
+                self.add(row, metadata)
+
+    def add(self, row: int, metadata: Optional[Dict[str, Any]]) -> None:
+        for name, value in flatten(metadata):
+            self._postings.setdefault(name, {}).setdefault(_key(value), set()).add(row)
+            if _is_number(value):
+                col = self._numeric.get(name)
+                if col is None:
+                    col = np.full(self._capacity, np.nan, dtype=np.float64)
+                    self._numeric[name] = col
+                # A list field keeps its first number for range filters
+                if math.isnan(col[row]):
+                    col[row] = float(value)
+
+    def remove(self, row: int, metadata: Optional[Dict[str, Any]]) -> None:
+        for name, value in flatten(metadata):
+            rows = self._postings.get(name, {}).get(_key(value))
+            if rows is not None:
+                rows.discard(row)
+                if not rows:
+                    del self._postings[name][_key(value)]
+            col = self._numeric.get(name)
+            if col is not None:
+                col[row] = np.nan
+
+    def mask(self, conditions: List[Condition], size: int) -> np.ndarray:
+        """Rows in ``[0, size)`` matching every condition."""
+        mask = np.ones(size, dtype=bool)
+        for cond in conditions:
+            mask &= self._match(cond, size)
+            if not mask.any():
+                break
+        return mask
+
+    def _match(self, cond: Condition, size: int) -> np.ndarray:
+        if cond.op in RANGE_OPS:
+            col = self._numeric.get(cond.field)
+            if col is None:
+                return np.zeros(size, dtype=bool)
+            values = col[:size]
+            with np.errstate(invalid="ignore"):
+                if cond.op == "gt":
+                    return values > cond.value
+                if cond.op == "gte":
+                    return values >= cond.value
+                if cond.op == "lt":
+                    return values < cond.value
+                return values <= cond.value
+        wanted = cond.value if cond.op == "in" else (cond.value,)
+        postings = self._postings.get(cond.field, {})
+        out = np.zeros(size, dtype=bool)
+        for value in wanted:
+            rows = postings.get(_key(value))
+            if rows:
+                out[np.fromiter(rows, dtype=np.int64, count=len(rows))] = True
+        return out
+
+
+def to_qdrant_must(
+    conditions: List[Condition], payload_key: str = "metadata"
+) -> List[Dict[str, Any]]:
+    """Translate conditions into Qdrant ``filter.must`` clauses on the payload."""
+    clauses: List[Dict[str, Any]] = []
+    ranges: Dict[str, Dict[str, float]] = {}
+    for cond in conditions:
+        key = f"{payload_key}.{cond.field}"
+        if cond.op == "eq":
+            clauses.append({"key": key, "match": {"value": cond.value}})
+        elif cond.op == "in":
+            clauses.append({"key": key, "match": {"any": list(cond.value)}})
+        else:
+            ranges.setdefault(key, {})[cond.op] = cond.value
+    clauses.extend({"key": key, "range": r} for key, r in ranges.items())
+    return clauses
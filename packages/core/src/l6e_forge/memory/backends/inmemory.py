@@ -1,49 +1,562 @@
 from __future__ import annotations
 
-import math
+import asyncio
+import dataclasses
+import heapq
+import itertools
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from l6e_forge.memory.backends.base import IMemoryBackend
+from l6e_forge.memory.backends.filters import Condition, MetadataIndex, parse_filter
+from l6e_forge.memory.backends.ivf import IVFConfig, IVFPartition
+from l6e_forge.memory.backends.quantization import Float32Codec, Int8Codec, make_codec
+from l6e_forge.memory.backends.snapshot import (
+    NamespaceSnapshot,
+    read_snapshot,
+    write_snapshot,
+)
 from l6e_forge.types.error import HealthStatus
+from l6e_forge.types.memory import MetadataFilter
 
 
-def _cosine_similarity(a: List[float], b: List[float]) -> float:
-    if not a or not b or len(a) != len(b):
-        return 0.0
-    dot = sum(x * y for x, y in zip(a, b))
-    na = math.sqrt(sum(x * x for x in a))
-    nb = math.sqrt(sum(y * y for y in b))
-    if na == 0.0 or nb == 0.0:
-        return 0.0
-    return dot / (na * nb)
+def _normalize(embedding: Sequence[float]) -> np.ndarray:
+    """Return the embedding as a contiguous float32 unit vector (zeros stay zero)."""
+    vec = np.asarray(embedding, dtype=np.float32).reshape(-1)
+    norm = float(np.linalg.norm(vec))
+    if norm > 0.0:
+        vec = vec / norm
+    return np.ascontiguousarray(vec, dtype=np.float32)
 
 
 @dataclass
 class _VecItem:
-    embedding: List[float]
     content: str
     metadata: Dict[str, Any]
     created_at: float
     ttl_s: Optional[int]
 
 
+class _NamespaceIndex:
+    """Row-major matrix of pre-normalized embeddings for one namespace.
+
+    Rows hold the codec's encoding of each vector: float32 by default, or int8
+    codes for about a quarter of the memory.
+
+    Rows are addressed through a key -> row map. Removed rows are tombstoned and
+    reclaimed by compaction once they make up at least half of the used rows, so
+    a query is a single matrix-vector product over a contiguous block. With an
+    IVF partition attached, rows are kept grouped by list and a query only scores
+    the probed lists.
+    """
+
+    _MIN_CAPACITY = 64
+    _MIN_TOMBSTONES_TO_COMPACT = 32
+    # Filtered searches score matching rows directly below this many matches
+    _MAX_FILTERED_GATHER = 100_000
+
+    def __init__(self, dim: int, codec: Float32Codec | Int8Codec | None = None) -> None:
+        self.dim = dim
+        self._codec = codec or Float32Codec(dim)
+        self._matrix = self._empty(self._MIN_CAPACITY)
+        self._live = np.zeros(self._MIN_CAPACITY, dtype=bool)
+        self._expires_at = np.full(self._MIN_CAPACITY, np.inf, dtype=np.float64)
+        self._keys: List[Optional[str]] = []
+        self._items: List[Optional[_VecItem]] = []
+        self._rows: Dict[str, int] = {}
+        self._size = 0  # rows in use, including tombstones
+        self._tombstones = 0
+        self._ivf: Optional[IVFPartition] = None
+        self._meta = MetadataIndex(self._MIN_CAPACITY)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        matrix: np.ndarray,
+        keys: List[str],
+        items: List[_VecItem],
+        codec: Float32Codec | Int8Codec | None = None,
+    ) -> "_NamespaceIndex":
+        """Adopt a float32 ``matrix`` (possibly a read-only memmap).
+
+        With the float32 codec the matrix is used without copying; other codecs
+        encode it into private memory.
+        """
+        count = len(keys)
+        index = cls.__new__(cls)
+        index.dim = int(matrix.shape[1])
+        index._codec = codec or Float32Codec(index.dim)
+        if index._codec.name != Float32Codec.name:
+            matrix = index._codec.encode(matrix)
+        index._matrix = matrix
+        index._live = np.ones(count, dtype=bool)
+        index._expires_at = np.array(
+            [i.created_at + i.ttl_s if i.ttl_s is not None else np.inf for i in items],
+            dtype=np.float64,
+        )
+        index._keys = list(keys)
+        index._items = list(items)
+        index._rows = {k: r for r, k in enumerate(keys)}
+        index._size = count
+        index._tombstones = 0
+        index._ivf = None
+        index._meta = MetadataIndex()
+        index._meta.rebuild([i.metadata for i in items], count)
+        return index
+
+    def export(self) -> Tuple[np.ndarray, List[str], List[_VecItem]]:
+        """Copy of the live rows with their keys and items, in row order."""
+        live_rows = self._live_rows().tolist()
+        matrix = np.ascontiguousarray(
+            self._codec.decode(self._matrix[live_rows]), dtype=np.float32
+        )
+        keys = [self._keys[r] for r in live_rows]
+        items = [self._items[r] for r in live_rows]
+        return matrix, keys, items  # type: ignore[return-value]
+
+    def _live_rows(self) -> np.ndarray:
+        return np.flatnonzero(self._live[: self._size])
+
+    def _empty(self, capacity: int) -> np.ndarray:
+        return np.zeros((capacity, self._codec.width), dtype=self._codec.dtype)
+
+    def _vectors(self, rows: np.ndarray) -> np.ndarray:
+        """Float32 vectors of ``rows`` (decoded when the index is quantized)."""
+        return self._codec.decode(self._matrix[rows])
+
+    def _ensure_writable(self) -> None:
+        # Snapshot-loaded matrices are read-only memmaps; copy on first write
+        if not self._matrix.flags.writeable:
+            self._matrix = np.array(self._matrix)
+
+    def _grow(self) -> None:
+        capacity = self._matrix.shape[0] * 2
+        matrix = self._empty(capacity)
+        matrix[: self._size] = self._matrix[: self._size]
+        live = np.zeros(capacity, dtype=bool)
+        live[: self._size] = self._live[: self._size]
+        expires_at = np.full(capacity, np.inf, dtype=np.float64)
+        expires_at[: self._size] = self._expires_at[: self._size]
+        self._matrix, self._live, self._expires_at = matrix, live, expires_at
+        self._meta.grow(capacity)
+
+    def upsert(self, key: str, vector: np.ndarray, item: _VecItem) -> None:
+        expires_at = item.created_at + item.ttl_s if item.ttl_s is not None else np.inf
+        row = self._rows.get(key)
+        if row is not None and self._ivf is not None and row < self._ivf.indexed:
+            # The row sits in its old list's slice; re-add it to the tail instead
+            del self._rows[key]
+            self._tombstone(row)
+            row = None
+        if row is None:
+            if self._size == self._matrix.shape[0]:
+                self._grow()
+            row = self._size
+            self._size += 1
+            self._rows[key] = row
+            self._keys.append(key)
+            self._items.append(item)
+        else:
+            old = self._items[row]
+            self._meta.remove(row, old.metadata if old is not None else None)
+            self._items[row] = item
+        self._meta.add(row, item.metadata)
+        self._ensure_writable()
+        self._matrix[row] = self._codec.encode(vector[None, :])[0]
+        self._live[row] = True
+        self._expires_at[row] = expires_at
+
+    def _tombstone(self, row: int) -> None:
+        item = self._items[row]
+        if item is not None:
+            self._meta.remove(row, item.metadata)
+        self._live[row] = False
+        self._expires_at[row] = np.inf
+        if self._matrix.flags.writeable:
+            # Tombstones are masked at search time, so a shared memmap stays untouched
+            self._matrix[row] = 0
+        self._keys[row] = None
+        self._items[row] = None
+        self._tombstones += 1
+
+    def expire_key(self, key: str, expires_at: float) -> bool:
+        """Tombstone ``key`` if it still carries the given expiry time.
+
+        Returns False when the key was removed or re-upserted with a new expiry
+        since the expiry index entry was created.
+        """
+        row = self._rows.get(key)
+        if row is None or self._expires_at[row] != expires_at:
+            return False
+        del self._rows[key]
+        self._tombstone(row)
+        return True
+
+    def expiring(self) -> List[Tuple[str, float]]:
+        """(key, expires_at) for every live row that has a TTL."""
+        n = self._size
+        rows = np.flatnonzero(self._live[:n] & np.isfinite(self._expires_at[:n]))
+        return [
+            (key, float(self._expires_at[r]))
+            for r in rows.tolist()
+            if (key := self._keys[r]) is not None
+        ]
+
+    def maybe_compact(self) -> None:
+        if (
+            self._tombstones >= self._MIN_TOMBSTONES_TO_COMPACT
+            and self._tombstones * 2 >= self._size
+        ) or not self._rows:
+            self.compact()
+
+    def set_ann(self, config: Optional[IVFConfig]) -> None:
+        """Attach (or with None, drop) an IVF partition; built on the next search."""
+        if config is None:
+            self._ivf = None
+        elif self._ivf is None:
+            self._ivf = IVFPartition(config)
+        elif dataclasses.replace(self._ivf.config, nprobe=config.nprobe) == config:
+            # nprobe is a query-time knob; keep the built partition
+            self._ivf.config = config
+        elif self._ivf.config != config:
+            self._ivf = IVFPartition(config)
+
+    def stats(self) -> Dict[str, Any]:
+        codec = self._codec
+        out: Dict[str, Any] = {
+            "items": len(self._rows),
+            "dim": self.dim,
+            "quantization": codec.name,
+            "bytes_per_vector": codec.bytes_per_vector,
+            "vector_bytes": int(self._matrix.nbytes),
+            "index": "flat",
+        }
+        ivf = self._ivf
+        if ivf is None:
+            return out
+        return out | {
+            "index": "ivf",
+            "ready": ivf.ready,
+            "nlist": ivf.nlist,
+            "nprobe": ivf.config.nprobe,
+            "indexed": ivf.indexed,
+            "tail": self._size - ivf.indexed if ivf.ready else self._size,
+            "builds": ivf.builds,
+        }
+
+    def compact(self) -> None:
+        """Drop tombstoned rows and shrink the matrix to fit the live rows."""
+        live_rows = np.flatnonzero(self._live[: self._size])
+        if self._ivf is not None:
+            self._ivf.on_compact(self._live[: self._size])
+        self._rearrange(live_rows)
+
+    def _rearrange(self, live_rows: np.ndarray) -> None:
+        """Rebuild storage holding exactly ``live_rows``, in the given order."""
+        count = int(live_rows.size)
+        capacity = self._MIN_CAPACITY
+        while capacity < count:
+            capacity *= 2
+        matrix = self._empty(capacity)
+        matrix[:count] = self._matrix[live_rows]
+        live = np.zeros(capacity, dtype=bool)
+        live[:count] = True
+        expires_at = np.full(capacity, np.inf, dtype=np.float64)
+        expires_at[:count] = self._expires_at[live_rows]
+        keys = [self._keys[r] for r in live_rows.tolist()]
+        items = [self._items[r] for r in live_rows.tolist()]
+        self._matrix, self._live, self._expires_at = matrix, live, expires_at
+        self._keys, self._items = keys, items
+        self._rows = {k: i for i, k in enumerate(keys) if k is not None}
+        self._size = count
+        self._tombstones = 0
+        self._meta.rebuild([i.metadata if i else None for i in items], capacity)
+
+    def search(
+        self,
+        query: np.ndarray,
+        limit: int,
+        conditions: Optional[List[Condition]] = None,
+    ) -> List[Tuple[str, float, _VecItem]]:
+        n = self._size
+        k = min(limit, len(self._rows))
+        if k <= 0:
+            return []
+        allowed: Optional[np.ndarray] = None
+        if conditions:
+            # Filter first so top-k is taken over matching rows only
+            allowed = self._meta.mask(conditions, n) & self._live[:n]
+            matches = np.flatnonzero(allowed)
+            if matches.size == 0:
+                return []
+            if matches.size <= self._MAX_FILTERED_GATHER:
+                scores = self._codec.scores(self._matrix[matches], query)
+                return self._top(scores, matches, 0, k)
+        ivf = self._ivf
+        if ivf is not None and ivf.needs_build(n, len(self._rows)):
+            self._rearrange(ivf.build(self._vectors, self._live_rows()))
+            n = self._size
+        if ivf is not None and ivf.ready:
+            spans = ivf.ranges(query, n)
+        else:
+            spans = [(0, n)]
+        rows: Optional[np.ndarray] = None  # None: candidates are rows start..end
+        start, end = spans[0]
+        if len(spans) == 1:
+            scores = self._codec.scores(self._matrix[start:end], query)
+            if allowed is not None:
+                scores[~allowed[start:end]] = -np.inf
+            elif self._tombstones:
+                scores[~self._live[start:end]] = -np.inf
+        else:
+            scores = np.concatenate(
+                [self._codec.scores(self._matrix[a:b], query) for a, b in spans]
+            )
+            rows = np.concatenate([np.arange(a, b) for a, b in spans])
+            if allowed is not None:
+                scores[~allowed[rows]] = -np.inf
+            elif self._tombstones:
+                scores[~self._live[rows]] = -np.inf
+        return self._top(scores, rows, start, k)
+
+    def _top(
+        self, scores: np.ndarray, rows: Optional[np.ndarray], start: int, k: int
+    ) -> List[Tuple[str, float, _VecItem]]:
+        """Best ``k`` of ``scores``; candidate i is ``rows[i]`` or ``start + i``."""
+        m = scores.shape[0]
+        k = min(k, m)
+        if k <= 0:
+            return []
+        if k < m:
+            top = np.argpartition(scores, m - k)[m - k :]
+        else:
+            top = np.arange(m)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        out: List[Tuple[str, float, _VecItem]] = []
+        for pos in top.tolist():
+            row = start + pos if rows is None else int(rows[pos])
+            key = self._keys[row]
+            item = self._items[row]
+            score = float(scores[pos])
+            if key is None or item is None or score == -np.inf:
+                continue
+            out.append((key, score, item))
+        return out
+
+
 class InMemoryVectorStore(IMemoryBackend):
-    """Simple in-memory vector store with per-namespace collections.
+    """In-memory vector store with per-namespace collections.
+
+    Each namespace is kept as a contiguous float32 matrix of L2-normalized rows,
+    so a similarity search is one matrix-vector product plus a partial top-k
+    selection. Not durable; intended for local development and tests.
+
+    Items with a TTL are tracked in a min-heap ordered by expiry time. A
+    background reaper pops due entries every ``reap_interval_s`` seconds,
+    tombstones them and compacts the namespace, so memory is reclaimed even in
+    namespaces that are never queried. Queries only peek at the heap top, so the
+    hot path has no per-item time checks.
+
+    ``ann`` enables an approximate IVF-flat index for every namespace with at
+    least ``ann.min_rows`` items; :meth:`configure_namespace` overrides it per
+    namespace. Smaller namespaces keep the exact scan.
 
-    Not for production use. Provides basic upsert and similarity search.
+    ``quantization="int8"`` stores each vector as int8 codes plus a per-vector
+    scale (``dim + 4`` bytes instead of ``4 * dim``); :meth:`stats` reports the
+    bytes per vector.
     """
 
-    def __init__(self, default_ttl_seconds: Optional[int] = None) -> None:
-        self._namespaces: Dict[str, Dict[str, _VecItem]] = {}
+    def __init__(
+        self,
+        default_ttl_seconds: Optional[int] = None,
+        *,
+        reap_interval_s: float = 30.0,
+        ann: Optional[IVFConfig] = None,
+        quantization: str = "float32",
+    ) -> None:
+        make_codec(quantization, 1)  # fail fast on unknown names
+        self._quantization = quantization
+        self._namespaces: Dict[str, _NamespaceIndex] = {}
         self._default_ttl = default_ttl_seconds
+        self._ann = ann
+        self._ann_overrides: Dict[str, Optional[IVFConfig]] = {}
+        self.reap_interval_s = reap_interval_s
+        # (expires_at, seq, namespace, key); stale entries are skipped when popped
+        self._expiry: List[Tuple[float, int, str, str]] = []
+        self._seq = itertools.count()
+        self._reaper: Optional[asyncio.Task[None]] = None
+        self._reaped = 0
 
     async def connect(self) -> None:
         return None
 
     async def disconnect(self) -> None:
+        self.stop_reaper()
         self._namespaces.clear()
+        self._expiry.clear()
+
+    # ---- Expiry ----
+    def reap_expired(self, now: Optional[float] = None) -> int:
+        """Drop every item whose TTL has elapsed; returns how many were removed."""
+        now = time.time() if now is None else now
+        heap = self._expiry
+        touched: Dict[str, _NamespaceIndex] = {}
+        removed = 0
+        while heap and heap[0][0] < now:
+            expires_at, _seq, ns_name, key = heapq.heappop(heap)
+            index = self._namespaces.get(ns_name)
+            if index is not None and index.expire_key(key, expires_at):
+                touched[ns_name] = index
+                removed += 1
+        for ns_name, index in touched.items():
+            if len(index) == 0:
+                del self._namespaces[ns_name]
+            else:
+                index.maybe_compact()
+        self._reaped += removed
+        return removed
+
+    def start_reaper(self) -> None:
+        """Run :meth:`reap_expired` periodically on the running loop."""
+        loop = asyncio.get_running_loop()
+        task = self._reaper
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        self._reaper = loop.create_task(self._reap_loop())
+
+    def stop_reaper(self) -> None:
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+
+    async def _reap_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.reap_interval_s)
+            try:
+                self.reap_expired()
+            except Exception:
+                pass
+
+    def _track_expiry(self, ns_name: str, key: str, item: _VecItem) -> None:
+        if item.ttl_s is None:
+            return
+        heapq.heappush(
+            self._expiry, (item.created_at + item.ttl_s, next(self._seq), ns_name, key)
+        )
+        # Re-upserts leave stale heap entries behind; rebuild when they dominate
+        if len(self._expiry) > max(1024, 2 * self._item_count()):
+            self._rebuild_expiry()
+        self.start_reaper()
+
+    def _item_count(self) -> int:
+        return sum(len(index) for index in self._namespaces.values())
+
+    def _rebuild_expiry(self) -> None:
+        heap = []
+        for ns_name, index in self._namespaces.items():
+            for key, expires_at in index.expiring():
+                heap.append((expires_at, next(self._seq), ns_name, key))
+        heapq.heapify(heap)
+        self._expiry = heap
+
+    # ---- Indexing ----
+    def configure_namespace(
+        self,
+        namespace: str,
+        collection: str = "default",
+        *,
+        ann: Optional[IVFConfig],
+    ) -> None:
+        """Use ``ann`` (None for exact search) for one namespace."""
+        ns_name = self._resolve_namespace(namespace, collection)
+        self._ann_overrides[ns_name] = ann
+        index = self._namespaces.get(ns_name)
+        if index is not None:
+            index.set_ann(ann)
+
+    def _new_index(self, ns_name: str, index: _NamespaceIndex) -> _NamespaceIndex:
+        index.set_ann(self._ann_overrides.get(ns_name, self._ann))
+        return index
+
+    # ---- Snapshots ----
+    async def save_snapshot(self, path: str | Path) -> Path:
+        """Write every namespace to ``path``; returns the manifest path.
+
+        Live rows are copied on the event loop so the snapshot is consistent;
+        the file writes run in a worker thread.
+        """
+        self.reap_expired()
+        snapshots: List[NamespaceSnapshot] = []
+        for ns_name, index in self._namespaces.items():
+            if len(index) == 0:
+                continue
+            matrix, keys, items = index.export()
+            snapshots.append(
+                NamespaceSnapshot(
+                    name=ns_name,
+                    matrix=matrix,
+                    keys=keys,
+                    contents=[i.content for i in items],
+                    metadata=[i.metadata for i in items],
+                    created_at=[i.created_at for i in items],
+                    ttl_s=[i.ttl_s for i in items],
+                )
+            )
+        return await asyncio.to_thread(write_snapshot, Path(path), snapshots)
+
+    async def load_snapshot(self, path: str | Path, *, mmap: bool = True) -> int:
+        """Replace the store's contents with a snapshot; returns the item count.
+
+        With ``mmap`` (default) vectors stay in the snapshot files and are paged
+        in on demand, so loading is near-instant and worker processes share the
+        page cache. A namespace is copied into private memory on its first write.
+        """
+        snapshots = await asyncio.to_thread(read_snapshot, Path(path), mmap=mmap)
+        namespaces: Dict[str, _NamespaceIndex] = {}
+        for snap in snapshots:
+            items = [
+                _VecItem(content=c, metadata=m or {}, created_at=t, ttl_s=ttl)
+                for c, m, t, ttl in zip(
+                    snap.contents, snap.metadata, snap.created_at, snap.ttl_s
+                )
+            ]
+            codec = make_codec(self._quantization, int(snap.matrix.shape[1]))
+            namespaces[snap.name] = self._new_index(
+                snap.name,
+                _NamespaceIndex.from_arrays(snap.matrix, snap.keys, items, codec),
+            )
+        self._namespaces = namespaces
+        self._rebuild_expiry()
+        if self._expiry:
+            self.start_reaper()
+        return self._item_count()
+
+    def stats(self) -> Dict[str, Any]:
+        items = self._item_count()
+        vector_bytes = sum(
+            int(index._matrix.nbytes) for index in self._namespaces.values()
+        )
+        return {
+            "namespaces": len(self._namespaces),
+            "items": items,
+            "quantization": self._quantization,
+            "vector_bytes": vector_bytes,
+            # Includes spare capacity and tombstones, i.e. what the pods really hold
+            "bytes_per_vector": vector_bytes / items if items else 0.0,
+            "expiry_index": len(self._expiry),
+            "next_expiry": self._expiry[0][0] if self._expiry else None,
+            "reaped": self._reaped,
+            "indexes": {
+                ns_name: index.stats() for ns_name, index in self._namespaces.items()
+            },
+        }
 
     async def health_check(self, collection: str) -> HealthStatus:
         return HealthStatus(healthy=True, status="healthy")
@@ -69,17 +582,54 @@ class InMemoryVectorStore(IMemoryBackend):
         ttl_seconds: Optional[int] = None,
     ) -> None:
         # Prefer explicit collection if provided
-        if collection and "::" not in namespace:
-            namespace = f"{collection}::{namespace}"
-        _collection, ns_name = self._split_collection_namespace(namespace)
-        ns = self._namespaces.setdefault(ns_name, {})
-        ns[key] = _VecItem(
-            embedding=embedding,
+        ns_name = self._resolve_namespace(namespace, collection)
+        vector = _normalize(embedding)
+        index = self._namespaces.get(ns_name)
+        if index is None or (len(index) == 0 and index.dim != vector.shape[0]):
+            dim = vector.shape[0]
+            index = self._new_index(
+                ns_name, _NamespaceIndex(dim, make_codec(self._quantization, dim))
+            )
+            self._namespaces[ns_name] = index
+        if index.dim != vector.shape[0]:
+            raise ValueError(
+                f"Embedding dimension {vector.shape[0]} does not match namespace "
+                f"'{ns_name}' dimension {index.dim}"
+            )
+        item = _VecItem(
             content=content,
             metadata=metadata or {},
             created_at=time.time(),
             ttl_s=ttl_seconds if ttl_seconds is not None else self._default_ttl,
         )
+        index.upsert(key, vector, item)
+        self._track_expiry(ns_name, key, item)
+
+    async def upsert_many(
+        self,
+        namespace: str,
+        points: List[Tuple[str, List[float], str, Dict[str, Any] | None]],
+        collection: str = "default",
+        *,
+        ttl_seconds: Optional[int] = None,
+        wait: bool = True,
+    ) -> None:
+        for key, embedding, content, metadata in points:
+            await self.upsert(
+                namespace,
+                key,
+                embedding,
+                content,
+                collection,
+                metadata=metadata,
+                ttl_seconds=ttl_seconds,
+            )
+
+    def _resolve_namespace(self, namespace: str, collection: str) -> str:
+        if collection and "::" not in namespace:
+            namespace = f"{collection}::{namespace}"
+        _collection, ns_name = self._split_collection_namespace(namespace)
+        return ns_name
 
     async def query(
         self,
@@ -88,18 +638,39 @@ class InMemoryVectorStore(IMemoryBackend):
         collection: str = "default",
         *,
         limit: int = 10,
+        filters: Optional[MetadataFilter] = None,
     ) -> List[Tuple[str, float, _VecItem]]:
-        if collection and "::" not in namespace:
-            namespace = f"{collection}::{namespace}"
-        _collection, ns_name = self._split_collection_namespace(namespace)
-        ns = self._namespaces.get(ns_name) or {}
-        now = time.time()
-        results: List[Tuple[str, float, _VecItem]] = []
-        for key, item in list(ns.items()):
-            if item.ttl_s is not None and (now - item.created_at) > item.ttl_s:
-                del ns[key]
+        results = await self.query_many(
+            [(namespace, collection, limit)], query_embedding, filters=filters
+        )
+        return results[0]
+
+    async def query_many(
+        self,
+        queries: List[Tuple[str, str, int]],
+        query_embedding: List[float],
+        *,
+        filters: Optional[MetadataFilter] = None,
+    ) -> List[List[Tuple[str, float, _VecItem]]]:
+        # Normalize the shared query once and scan each namespace at most once,
+        # taking the largest limit requested for it.
+        conditions = parse_filter(filters)
+        query = _normalize(query_embedding)
+        ns_names = [self._resolve_namespace(ns, col) for ns, col, _limit in queries]
+        wanted: Dict[str, int] = {}
+        for ns_name, (_ns, _col, limit) in zip(ns_names, queries):
+            wanted[ns_name] = max(wanted.get(ns_name, 0), max(1, limit))
+        # Only items due since the last reap are dropped here; O(1) when none are
+        if self._expiry and self._expiry[0][0] < time.time():
+            self.reap_expired()
+        hits: Dict[str, List[Tuple[str, float, _VecItem]]] = {}
+        for ns_name, limit in wanted.items():
+            index = self._namespaces.get(ns_name)
+            if index is None or query.shape[0] != index.dim:
+                hits[ns_name] = []
                 continue
-            score = _cosine_similarity(query_embedding, item.embedding)
-            results.append((key, score, item))
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[: max(1, limit)]
+            hits[ns_name] = index.search(query, limit, conditions)
+        return [
+            hits[ns_name][: max(1, limit)]
+            for ns_name, (_ns, _col, limit) in zip(ns_names, queries)
+        ]
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+_ASSIGN_CHUNK = 4096
+
+
+@dataclass
+class IVFConfig:
+    """Settings for the inverted-file (IVF-flat) approximate index.
+
+    ``nlist`` defaults to about sqrt(n) lists, chosen at each (re)training.
+    Namespaces with fewer than ``min_rows`` live items are scanned exactly.
+    """
+
+    nlist: Optional[int] = None
+    nprobe: int = 16
+    min_rows: int = 10_000
+    # Re-sort once rows added since the last build exceed this share of indexed rows
+    rebuild_ratio: float = 0.1
+    # k-means runs on at most ``train_sample`` points per list
+    train_sample: int = 64
+    iters: int = 10
+    seed: int = 0
+
+
+def kmeans(data: np.ndarray, k: int, *, iters: int = 10, seed: int = 0) -> np.ndarray:
+    """Spherical k-means over unit rows; returns (k, dim) unit centroids."""
+    rng = np.random.default_rng(seed)
+    n = data.shape[0]
+    k = max(1, min(k, n))
+    centroids = data[rng.choice(n, size=k, replace=False)].copy()
+    for _ in range(iters):
+        assign = assign_lists(data, centroids)
+        counts = np.bincount(assign, minlength=k)
+        order = np.argsort(assign, kind="stable")
+        nonempty = np.flatnonzero(counts)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[nonempty]
+        sums = np.add.reduceat(data[order], starts, axis=0)
+        updated = centroids.copy()
+        updated[nonempty] = sums
+        # Reseed empty lists from random points so every list stays in use
+        empty = np.flatnonzero(counts == 0)
+        if empty.size:
+            updated[empty] = data[rng.choice(n, size=empty.size, replace=False)]
+        norms = np.linalg.norm(updated, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        centroids = (updated / norms).astype(np.float32)
+    return centroids
+
+
+def assign_lists(data: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Nearest centroid (by inner product) for every row, computed in chunks."""
+    out = np.empty(data.shape[0], dtype=np.int32)
+    for start in range(0, data.shape[0], _ASSIGN_CHUNK):
+        block = data[start : start + _ASSIGN_CHUNK] @ centroids.T
+        out[start : start + _ASSIGN_CHUNK] = np.argmax(block, axis=1)
+    return out
+
+
+class IVFPartition:
+    """Coarse quantizer over a matrix whose rows are grouped by list.
+
+    After :meth:`build`, rows ``[offsets[i], offsets[i + 1])`` belong to list
+    ``i`` and the first ``indexed`` rows are covered. Rows appended later form
+    an exactly scanned tail until the next build, which only assigns the tail
+    (centroids are retrained when the namespace has doubled). A query scores
+    the ``nprobe`` closest lists as contiguous slices, so no rows are gathered.
+    """
+
+    def __init__(self, config: IVFConfig) -> None:
+        self.config = config
+        self.centroids: Optional[np.ndarray] = None
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.indexed = 0
+        self.trained_on = 0
+        self.builds = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.centroids is not None
+
+    @property
+    def nlist(self) -> int:
+        return 0 if self.centroids is None else int(self.centroids.shape[0])
+
+    def needs_build(self, size: int, live: int) -> bool:
+        if live < self.config.min_rows:
+            return False
+        if self.centroids is None:
+            return True
+        tail = size - self.indexed
+        return tail > max(1, int(self.config.rebuild_ratio * self.indexed))
+
+    def build(
+        self, vectors: Callable[[np.ndarray], np.ndarray], live_rows: np.ndarray
+    ) -> np.ndarray:
+        """Return ``live_rows`` reordered by list; offsets describe the new order.
+
+        ``vectors`` maps row numbers to their float32 vectors.
+        """
+        cfg = self.config
+        n = int(live_rows.size)
+        retrain = self.centroids is None or n >= 2 * self.trained_on
+        if retrain:
+            nlist = cfg.nlist or int(np.clip(np.sqrt(n), 8, 4096))
+            sample = live_rows
+            limit = nlist * cfg.train_sample
+            if n > limit:
+                rng = np.random.default_rng(cfg.seed)
+                sample = np.sort(rng.choice(live_rows, size=limit, replace=False))
+            self.centroids = kmeans(
+                vectors(sample), nlist, iters=cfg.iters, seed=cfg.seed
+            )
+            self.trained_on = n
+            assign = np.empty(n, dtype=np.int32)
+            step = 16 * _ASSIGN_CHUNK  # bounds the decoded copy for quantized rows
+            for start in range(0, n, step):
+                chunk = live_rows[start : start + step]
+                assign[start : start + step] = assign_lists(
+                    vectors(chunk), self.centroids
+                )
+        else:
+            # Keep existing assignments and only place rows added since the last build
+            assert self.centroids is not None
+            prefix = self.list_of_rows()
+            assign = np.empty(n, dtype=np.int32)
+            in_prefix = live_rows < self.indexed
+            assign[in_prefix] = prefix[live_rows[in_prefix]]
+            tail_rows = live_rows[~in_prefix]
+            if tail_rows.size:
+                assign[~in_prefix] = assign_lists(vectors(tail_rows), self.centroids)
+        order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=self.nlist)
+        self.offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        self.indexed = n
+        self.builds += 1
+        return live_rows[order]
+
+    def list_of_rows(self) -> np.ndarray:
+        """List id of each of the first ``indexed`` rows."""
+        return np.repeat(np.arange(self.nlist, dtype=np.int32), np.diff(self.offsets))
+
+    def on_compact(self, live: np.ndarray) -> None:
+        """Shift list boundaries after compaction kept only rows where ``live``."""
+        if self.centroids is None:
+            return
+        keep = live[: self.indexed]
+        counts = np.bincount(self.list_of_rows()[keep], minlength=self.nlist)
+        self.offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        self.indexed = int(keep.sum())
+
+    def ranges(self, query: np.ndarray, size: int) -> List[Tuple[int, int]]:
+        """Row ranges to score for ``query``: probed lists plus the unindexed tail."""
+        assert self.centroids is not None
+        nprobe = max(1, min(self.config.nprobe, self.nlist))
+        sims = self.centroids @ query
+        if nprobe < self.nlist:
+            probe = np.argpartition(-sims, nprobe - 1)[:nprobe]
+        else:
+            probe = np.arange(self.nlist)
+        spans = sorted(
+            (int(self.offsets[i]), int(self.offsets[i + 1]))
+            for i in probe.tolist()
+            if self.offsets[i] < self.offsets[i + 1]
+        )
+        if self.indexed < size:
+            spans.append((self.indexed, size))
+        # Merge neighbouring lists into one slice to cut per-call overhead
+        merged: List[Tuple[int, int]] = []
+        for start, end in spans:
+            if merged and merged[-1][1] == start:
+                merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
@@ -6,7 +6,10 @@ from typing import Any, Dict, List, Optional, Tuple
 import httpx
 
 from l6e_forge.memory.backends.base import IMemoryBackend
+from l6e_forge.memory.backends.filters import Condition, parse_filter, to_qdrant_must
+from l6e_forge.runtime.http import HttpClientPool, get_http_pool
 from l6e_forge.types.error import HealthStatus
+from l6e_forge.types.memory import MetadataFilter
 
 
 class QdrantVectorStore(IMemoryBackend):
@@ -21,6 +24,7 @@ class QdrantVectorStore(IMemoryBackend):
         distance: str = "Cosine",
         api_key: str | None = None,
         timeout: float = 5.0,
+        http: HttpClientPool | None = None,
     ) -> None:
         self.endpoint = (
             endpoint or os.environ.get("QDRANT_URL") or "http://localhost:6333"
@@ -28,6 +32,9 @@ class QdrantVectorStore(IMemoryBackend):
         self.distance = distance  # "Cosine" | "Dot" | "Euclid"
         self.api_key = api_key or os.environ.get("QDRANT_API_KEY")
         self.timeout = timeout
+        self._http = http or get_http_pool()
+        # Collections already confirmed to exist; skips the GET on every write
+        self._known_collections: set[str] = set()
 
     def _headers(self) -> Dict[str, str]:
         h: Dict[str, str] = {"Content-Type": "application/json"}
@@ -41,27 +48,41 @@ class QdrantVectorStore(IMemoryBackend):
     async def disconnect(self) -> None:
         return None
 
+    def _client(self) -> httpx.AsyncClient:
+        return self._http.async_client(self.endpoint)
+
     async def health_check(self, collection: str = "default") -> HealthStatus:
         try:
             url = f"{self.endpoint}/collections/{collection}"
-            r = httpx.get(url, headers=self._headers(), timeout=self.timeout)
+            r = await self._client().get(
+                url, headers=self._headers(), timeout=self.timeout
+            )
             return HealthStatus(healthy=r.status_code == 200, status="healthy")
         except Exception:
             return HealthStatus(healthy=False, status="unhealthy")
 
-    def _ensure_collection(self, vector_size: int, collection: str = "default") -> None:
+    async def _ensure_collection(
+        self, vector_size: int, collection: str = "default"
+    ) -> None:
+        if collection in self._known_collections:
+            return
         try:
             url = f"{self.endpoint}/collections/{collection}"
-            r = httpx.get(url, headers=self._headers(), timeout=self.timeout)
+            r = await self._client().get(
+                url, headers=self._headers(), timeout=self.timeout
+            )
             if r.status_code == 200:
+                self._known_collections.add(collection)
                 return
             # Create collection
             payload = {
                 "vectors": {"size": vector_size, "distance": self.distance},
             }
-            httpx.put(
+            r = await self._client().put(
                 url, json=payload, headers=self._headers(), timeout=self.timeout
-            ).raise_for_status()
+            )
+            r.raise_for_status()
+            self._known_collections.add(collection)
         except Exception as e:
             # Best-effort in MVP
             from l6e_forge.logging import get_logger
@@ -96,7 +117,7 @@ class QdrantVectorStore(IMemoryBackend):
             namespace = f"{collection}::{namespace}"
         collection, ns = self._split_collection_namespace(namespace, collection)
         # Qdrant doesn't have namespaces; emulate by including ns in payload
-        self._ensure_collection(len(embedding), collection)
+        await self._ensure_collection(len(embedding), collection)
         payload = {
             "points": [
                 {
@@ -112,50 +133,145 @@ class QdrantVectorStore(IMemoryBackend):
         }
         try:
             url = f"{self.endpoint}/collections/{collection}/points?wait=true"
-            httpx.put(
+            r = await self._client().put(
                 url, json=payload, headers=self._headers(), timeout=self.timeout
-            ).raise_for_status()
+            )
+            r.raise_for_status()
         except Exception:
             pass
 
-    async def query(
+    async def upsert_many(
         self,
         namespace: str,
-        query_embedding: List[float],
+        points: List[Tuple[str, List[float], str, Dict[str, Any] | None]],
         collection: str = "default",
-        limit: int = 10,
-    ) -> List[Tuple[str, float, Any]]:
+        *,
+        ttl_seconds: Optional[int] = None,
+        wait: bool = True,
+    ) -> None:
+        if not points:
+            return
         if collection and "::" not in namespace:
             namespace = f"{collection}::{namespace}"
         collection, ns = self._split_collection_namespace(namespace, collection)
-        self._ensure_collection(len(query_embedding), collection)
+        await self._ensure_collection(len(points[0][1]), collection)
         payload = {
+            "points": [
+                {
+                    "id": key,
+                    "vector": embedding,
+                    "payload": {
+                        "content": content,
+                        "metadata": metadata or {},
+                        "namespace": ns,
+                    },
+                }
+                for key, embedding, content, metadata in points
+            ]
+        }
+        flag = "true" if wait else "false"
+        url = f"{self.endpoint}/collections/{collection}/points?wait={flag}"
+        # Unlike single upserts, bulk writes surface errors to the caller
+        r = await self._client().put(
+            url, json=payload, headers=self._headers(), timeout=self.timeout
+        )
+        r.raise_for_status()
+
+    def _search_request(
+        self,
+        ns: str,
+        query_embedding: List[float],
+        limit: int,
+        conditions: Optional[List[Condition]] = None,
+    ) -> Dict[str, Any]:
+        must: List[Dict[str, Any]] = [{"key": "namespace", "match": {"value": ns}}]
+        if conditions:
+            must.extend(to_qdrant_must(conditions))
+        return {
             "vector": query_embedding,
             "limit": max(1, limit),
             "with_payload": True,
-            "filter": {"must": [{"key": "namespace", "match": {"value": ns}}]},
+            "filter": {"must": must},
         }
+
+    @staticmethod
+    def _to_results(items: List[Dict[str, Any]]) -> List[Tuple[str, float, Any]]:
+        out: List[Tuple[str, float, Any]] = []
+        for it in items:
+            pid = str(it.get("id"))
+            score = float(it.get("score") or 0.0)
+            payload = it.get("payload") or {}
+            content = payload.get("content", "")
+            meta = payload.get("metadata", {})
+            out.append(
+                (
+                    pid,
+                    score,
+                    type("_QItem", (), {"content": content, "metadata": meta})(),
+                )
+            )
+        return out
+
+    async def query(
+        self,
+        namespace: str,
+        query_embedding: List[float],
+        collection: str = "default",
+        limit: int = 10,
+        filters: Optional[MetadataFilter] = None,
+    ) -> List[Tuple[str, float, Any]]:
+        conditions = parse_filter(filters)
+        if collection and "::" not in namespace:
+            namespace = f"{collection}::{namespace}"
+        collection, ns = self._split_collection_namespace(namespace, collection)
+        await self._ensure_collection(len(query_embedding), collection)
+        payload = self._search_request(ns, query_embedding, limit, conditions)
         try:
             url = f"{self.endpoint}/collections/{collection}/points/search"
-            r = httpx.post(
+            r = await self._client().post(
                 url, json=payload, headers=self._headers(), timeout=self.timeout
             )
             r.raise_for_status()
-            items = r.json().get("result") or []
-            out: List[Tuple[str, float, Any]] = []
-            for it in items:
-                pid = str(it.get("id"))
-                score = float(it.get("score") or 0.0)
-                payload = it.get("payload") or {}
-                content = payload.get("content", "")
-                meta = payload.get("metadata", {})
-                out.append(
-                    (
-                        pid,
-                        score,
-                        type("_QItem", (), {"content": content, "metadata": meta})(),
-                    )
-                )
-            return out
+            return self._to_results(r.json().get("result") or [])
         except Exception:
             return []
+
+    async def query_many(
+        self,
+        queries: List[Tuple[str, str, int]],
+        query_embedding: List[float],
+        *,
+        filters: Optional[MetadataFilter] = None,
+    ) -> List[List[Tuple[str, float, Any]]]:
+        conditions = parse_filter(filters)
+        # Group searches by target collection; each group is one batch request
+        by_collection: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        for pos, (namespace, collection, limit) in enumerate(queries):
+            collection = collection or "default"
+            if "::" not in namespace:
+                namespace = f"{collection}::{namespace}"
+            col, ns = self._split_collection_namespace(namespace, collection)
+            by_collection.setdefault(col, []).append(
+                (
+                    pos,
+                    self._search_request(ns, query_embedding, limit, conditions),
+                )
+            )
+        results: List[List[Tuple[str, float, Any]]] = [[] for _ in queries]
+        for col, searches in by_collection.items():
+            await self._ensure_collection(len(query_embedding), col)
+            try:
+                url = f"{self.endpoint}/collections/{col}/points/search/batch"
+                r = await self._client().post(
+                    url,
+                    json={"searches": [req for _pos, req in searches]},
+                    headers=self._headers(),
+                    timeout=self.timeout,
+                )
+                r.raise_for_status()
+                batches = r.json().get("result") or []
+            except Exception:
+                continue
+            for (pos, _req), items in zip(searches, batches):
+                results[pos] = self._to_results(items or [])
+        return results
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+SNAPSHOT_VERSION = 1
+MANIFEST = "manifest.json"
+_DATA_FILE = re.compile(r"[0-9a-f]{12}-\d{5}\.(npy|json)")
+
+
+@dataclass
+class NamespaceSnapshot:
+    """Live rows of one namespace: an (n, dim) float32 matrix and per-row data."""
+
+    name: str
+    matrix: np.ndarray
+    keys: List[str]
+    contents: List[str]
+    metadata: List[Dict[str, Any]]
+    created_at: List[float]
+    ttl_s: List[Optional[int]]
+
+
+def write_snapshot(path: Path, namespaces: List[NamespaceSnapshot]) -> Path:
+    """Write ``namespaces`` under ``path`` and return the manifest path.
+
+    Each namespace becomes a raw float32 ``.npy`` matrix plus a JSON sidecar with
+    keys, contents and metadata. Files carry a generation id and the manifest is
+    swapped in last with an atomic rename, so readers see either the old or the
+    new snapshot. Files of the previous generation are removed afterwards;
+    processes that still map them keep their pages until they unmap.
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    generation = uuid.uuid4().hex[:12]
+    entries: List[Dict[str, Any]] = []
+    for i, ns in enumerate(namespaces):
+        stem = f"{generation}-{i:05d}"
+        np.save(path / f"{stem}.npy", np.ascontiguousarray(ns.matrix, np.float32))
+        sidecar = {
+            "keys": ns.keys,
+            "contents": ns.contents,
+            "metadata": ns.metadata,
+            "created_at": ns.created_at,
+            "ttl_s": ns.ttl_s,
+        }
+        with (path / f"{stem}.json").open("w", encoding="utf-8") as f:
+            json.dump(sidecar, f, separators=(",", ":"), default=str)
+        entries.append(
+            {
+                "name": ns.name,
+                "dim": int(ns.matrix.shape[1]) if ns.matrix.ndim == 2 else 0,
+                "count": len(ns.keys),
+                "vectors": f"{stem}.npy",
+                "sidecar": f"{stem}.json",
+            }
+        )
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "generation": generation,
+        "namespaces": entries,
+    }
+    tmp = path / f"{MANIFEST}.{generation}.tmp"
+    tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(tmp, path / MANIFEST)
+    for stale in path.iterdir():
+        if _DATA_FILE.fullmatch(stale.name) and not stale.name.startswith(
+            f"{generation}-"
+        ):
+            stale.unlink(missing_ok=True)
+    return path / MANIFEST
+
+
+def read_snapshot(path: Path, *, mmap: bool = True) -> List[NamespaceSnapshot]:
+    """Read a snapshot written by :func:`write_snapshot`.
+
+    With ``mmap`` the matrices are read-only memory maps, so loading costs no
+    copy and the page cache is shared by every process mapping the same files.
+    """
+    path = Path(path)
+    manifest = json.loads((path / MANIFEST).read_text(encoding="utf-8"))
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot version {manifest.get('version')} in {path}"
+        )
+    out: List[NamespaceSnapshot] = []
+    for entry in manifest["namespaces"]:
+        matrix = np.load(path / entry["vectors"], mmap_mode="r" if mmap else None)
+        with (path / entry["sidecar"]).open("r", encoding="utf-8") as f:
+            sidecar = json.load(f)
+        if matrix.dtype != np.float32 or len(matrix) != len(sidecar["keys"]):
+            raise ValueError(f"Corrupt snapshot namespace '{entry['name']}' in {path}")
+        out.append(
+            NamespaceSnapshot(
+                name=entry["name"],
+                matrix=matrix,
+                keys=sidecar["keys"],
+                contents=sidecar["contents"],
+                metadata=sidecar["metadata"],
+                created_at=sidecar["created_at"],
+                ttl_s=sidecar["ttl_s"],
+            )
+        )
+    return out
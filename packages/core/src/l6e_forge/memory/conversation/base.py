@@ -1,9 +1,80 @@
-from typing import Protocol, List
+import base64
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Protocol, List, Sequence
 from l6e_forge.types.core import ConversationID
 
 from l6e_forge.types.core import Message
 
 
+@dataclass
+class MessagePage:
+    """One page of a conversation, oldest message first.
+
+    ``next_cursor`` continues in the direction that was requested (older pages for
+    ``before``/latest, newer pages for ``after``) and is None on the last page.
+    """
+
+    messages: List[Message] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def make_cursor(timestamp: datetime, message_id: uuid.UUID | str) -> str:
+    """Opaque keyset cursor for a ``(timestamp, message_id)`` position."""
+    raw = f"{timestamp.isoformat()}|{message_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def encode_cursor(message: Message) -> str:
+    return make_cursor(message.timestamp, message.message_id)
+
+
+# Sorts before every message; ``after=START_CURSOR`` yields the oldest page
+START_CURSOR = make_cursor(datetime(1, 1, 1, tzinfo=timezone.utc), uuid.UUID(int=0))
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        ts, message_id = raw.split("|", 1)
+        return datetime.fromisoformat(ts), message_id
+    except Exception as e:
+        raise ValueError(f"Invalid conversation cursor: {cursor!r}") from e
+
+
+def sort_key(timestamp: datetime, message_id: uuid.UUID | str) -> tuple[float, str]:
+    # Epoch seconds compare naive (local) and tz-aware timestamps alike
+    return (timestamp.timestamp(), str(message_id))
+
+
+def paginate(
+    messages: Sequence[Message],
+    limit: int = 50,
+    *,
+    before: str | None = None,
+    after: str | None = None,
+) -> MessagePage:
+    """Keyset-paginate an in-memory, chronologically ordered message list."""
+    if before is not None and after is not None:
+        raise ValueError("Pass at most one of 'before' and 'after'")
+    if limit <= 0:
+        return MessagePage()
+    items = sorted(messages, key=lambda m: sort_key(m.timestamp, m.message_id))
+    if after is not None:
+        bound = sort_key(*decode_cursor(after))
+        items = [m for m in items if sort_key(m.timestamp, m.message_id) > bound]
+        page = items[:limit]
+        more = len(items) > limit
+        return MessagePage(page, encode_cursor(page[-1]) if more else None)
+    if before is not None:
+        bound = sort_key(*decode_cursor(before))
+        items = [m for m in items if sort_key(m.timestamp, m.message_id) < bound]
+    page = items[-limit:]
+    more = len(items) > limit
+    return MessagePage(page, encode_cursor(page[0]) if more else None)
+
+
 class IConversationStore(Protocol):
     async def connect(self) -> None: ...
 
@@ -14,3 +85,17 @@ class IConversationStore(Protocol):
     async def get_messages(
         self, conversation_id: ConversationID, limit: int = 50
     ) -> List[Message]: ...
+
+    async def get_messages_page(
+        self,
+        conversation_id: ConversationID,
+        limit: int = 50,
+        *,
+        before: str | None = None,
+        after: str | None = None,
+    ) -> MessagePage:
+        """Keyset page of messages ordered by ``(timestamp, message_id)``.
+
+        Without a cursor the latest ``limit`` messages are returned.
+        """
+        ...
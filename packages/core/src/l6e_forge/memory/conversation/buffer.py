@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindBuffer(Generic[T]):
+    """Coalesces individual writes into batches flushed by a single writer.
+
+    A batch is flushed when ``max_batch_size`` items are pending or
+    ``flush_interval_ms`` after the first item arrived, whichever comes first.
+    ``put(item, wait=True)`` returns once the batch holding the item has been
+    written (group commit); ``wait=False`` returns immediately and a failed flush
+    only logs and counts the lost items. When ``max_pending`` items are already
+    waiting, ``put`` blocks on a flush (backpressure) instead of growing memory.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[T]], Awaitable[None]],
+        *,
+        max_batch_size: int = 256,
+        flush_interval_ms: float = 50.0,
+        max_pending: int = 10_000,
+        name: str = "write_behind",
+    ) -> None:
+        self._flush_fn = flush
+        self.max_batch_size = max(1, max_batch_size)
+        self.flush_interval_s = max(0.0, flush_interval_ms) / 1000.0
+        self.max_pending = max(self.max_batch_size, max_pending)
+        self.name = name
+        self._pending: List[tuple[T, Optional[asyncio.Future[None]]]] = []
+        self._inflight: List[T] = []
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._batches = 0
+        self._items = 0
+        self._failed_batches = 0
+        self._dropped = 0
+        self._last_batch_size = 0
+        self._flush_ms_total = 0.0
+        self._flush_ms_max = 0.0
+        self._last_flush_ms = 0.0
+
+    async def put(self, item: T, *, wait: bool = True) -> None:
+        self._bind_loop()
+        if len(self._pending) >= self.max_pending:
+            await self.flush()
+        fut: Optional[asyncio.Future[None]] = None
+        if wait:
+            fut = asyncio.get_running_loop().create_future()
+        self._pending.append((item, fut))
+        if len(self._pending) >= self.max_batch_size:
+            self._spawn_flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.flush_interval_s, self._spawn_flush
+            )
+        if fut is not None:
+            await fut
+
+    def unflushed(self) -> List[T]:
+        """Items accepted but not yet durably written (pending and in flight)."""
+        return [*self._inflight, *(item for item, _fut in self._pending)]
+
+    async def flush(self) -> None:
+        """Write everything pending now; batches are written in arrival order."""
+        async with self._lock:
+            self._cancel_timer()
+            while self._pending:
+                batch = self._pending[: self.max_batch_size]
+                del self._pending[: self.max_batch_size]
+                await self._write(batch)
+
+    async def aclose(self) -> None:
+        await self.flush()
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "in_flight": len(self._inflight),
+            "batches": self._batches,
+            "items": self._items,
+            "failed_batches": self._failed_batches,
+            "dropped": self._dropped,
+            "last_batch_size": self._last_batch_size,
+            "avg_batch_size": self._items / self._batches if self._batches else 0.0,
+            "last_flush_ms": self._last_flush_ms,
+            "avg_flush_ms": self._flush_ms_total / self._batches
+            if self._batches
+            else 0.0,
+            "max_flush_ms": self._flush_ms_max,
+        }
+
+    # ---- Internals ----
+    async def _write(
+        self, batch: List[tuple[T, Optional[asyncio.Future[None]]]]
+    ) -> None:
+        items = [item for item, _fut in batch]
+        self._inflight = items
+        start = time.perf_counter()
+        error: BaseException | None = None
+        try:
+            await self._flush_fn(items)
+        except Exception as exc:  # noqa: BLE001
+            error = exc
+        finally:
+            self._inflight = []
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        if error is None:
+            self._batches += 1
+            self._items += len(items)
+            self._last_batch_size = len(items)
+            self._last_flush_ms = elapsed_ms
+            self._flush_ms_total += elapsed_ms
+            self._flush_ms_max = max(self._flush_ms_max, elapsed_ms)
+        else:
+            self._failed_batches += 1
+            unacked = sum(1 for _item, fut in batch if fut is None)
+            self._dropped += unacked
+            logger.error(
+                f"{self.name}: flush of {len(items)} items failed "
+                f"({unacked} unacknowledged writes lost): {error}"
+            )
+        for _item, fut in batch:
+            if fut is None or fut.done():
+                continue
+            if error is None:
+                fut.set_result(None)
+            else:
+                fut.set_exception(error)
+        await self._record(len(items), elapsed_ms, error is None)
+
+    def _spawn_flush(self) -> None:
+        self._cancel_timer()
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Timers, locks and futures from a previous loop cannot be reused
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._timer = None
+            self._tasks = set()
+
+    async def _record(self, size: int, elapsed_ms: float, ok: bool) -> None:
+        try:
+            from l6e_forge.runtime.monitoring import get_monitoring
+
+            mon = get_monitoring()
+            tags = {"buffer": self.name, "status": "ok" if ok else "error"}
+            await mon.record_metric("write_flush_ms", elapsed_ms, tags=tags)
+            await mon.record_metric("write_batch_size", float(size), tags=tags)
+        except Exception:
+            pass
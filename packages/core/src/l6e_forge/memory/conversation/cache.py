@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional
+
+from l6e_forge.types.core import ConversationID, Message
+
+# Rough per-message bookkeeping cost (Message object, deque slot, datetime, UUIDs)
+_MESSAGE_OVERHEAD_BYTES = 400
+
+
+def message_size(message: Message) -> int:
+    """Approximate resident size of a message in bytes."""
+    size = _MESSAGE_OVERHEAD_BYTES + len(message.content.encode("utf-8"))
+    if message.metadata:
+        size += len(str(message.metadata))
+    return size
+
+
+class _Window:
+    __slots__ = ("messages", "bytes")
+
+    def __init__(self, window: int) -> None:
+        self.messages: deque[Message] = deque(maxlen=window)
+        self.bytes = 0
+
+
+class ConversationCache:
+    """Per-conversation ring buffers holding the most recent ``window`` messages.
+
+    A conversation enters the cache on its first read (one store query for the
+    latest ``window`` messages); after that, writes are appended in place and
+    reads up to ``window`` messages never touch the store. Idle conversations are
+    evicted least-recently-used first once the approximate size exceeds
+    ``max_bytes``.
+    """
+
+    def __init__(self, window: int = 50, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self.window = max(1, window)
+        self.max_bytes = max(0, max_bytes)
+        self._entries: "OrderedDict[str, _Window]" = OrderedDict()
+        # Writes that land while a conversation is being loaded from the store
+        self._loading: Dict[str, List[Message]] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self, conversation_id: ConversationID, limit: int
+    ) -> Optional[List[Message]]:
+        """Return the last ``limit`` messages, or None when the cache cannot answer."""
+        key = str(conversation_id)
+        entry = self._entries.get(key)
+        if entry is None or limit > self.window:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        if limit <= 0:
+            return []
+        msgs = entry.messages
+        return list(msgs)[-limit:] if limit < len(msgs) else list(msgs)
+
+    def append(self, conversation_id: ConversationID, message: Message) -> None:
+        """Write-through: extend a cached conversation; unknown ones stay cold."""
+        key = str(conversation_id)
+        pending = self._loading.get(key)
+        if pending is not None:
+            pending.append(message)
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        self._push(entry, message)
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def begin_load(self, conversation_id: ConversationID) -> None:
+        self._loading.setdefault(str(conversation_id), [])
+
+    def finish_load(
+        self, conversation_id: ConversationID, messages: List[Message]
+    ) -> None:
+        """Install the store's latest messages plus any writes seen while loading."""
+        key = str(conversation_id)
+        pending = self._loading.pop(key, [])
+        if key in self._entries:
+            return
+        seen = {m.message_id for m in messages}
+        entry = _Window(self.window)
+        for message in [*messages, *(m for m in pending if m.message_id not in seen)]:
+            self._push(entry, message)
+        self._entries[key] = entry
+        self._evict()
+
+    def abort_load(self, conversation_id: ConversationID) -> None:
+        self._loading.pop(str(conversation_id), None)
+
+    def discard(self, conversation_id: ConversationID) -> None:
+        entry = self._entries.pop(str(conversation_id), None)
+        if entry is not None:
+            self._bytes -= entry.bytes
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            "conversations": len(self._entries),
+            "messages": sum(len(e.messages) for e in self._entries.values()),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "window": self.window,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+        }
+
+    def _push(self, entry: _Window, message: Message) -> None:
+        msgs = entry.messages
+        if len(msgs) == msgs.maxlen:
+            dropped = message_size(msgs[0])
+            entry.bytes -= dropped
+            self._bytes -= dropped
+        msgs.append(message)
+        size = message_size(message)
+        entry.bytes += size
+        self._bytes += size
+
+    def _evict(self) -> None:
+        # Keep the most recently used conversation even if it alone exceeds the budget
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _key, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.bytes
+            self._evictions += 1
@@ -1,49 +1,199 @@
 import asyncpg
+import json
 import logging
-from typing import List
+import os
+from typing import Any, Callable, List, Literal
 from l6e_forge.types.core import ConversationID
 
 from l6e_forge.types.core import Message
-from .base import IConversationStore
+from .base import (
+    IConversationStore,
+    MessagePage,
+    decode_cursor,
+    encode_cursor,
+    sort_key,
+)
+from .buffer import WriteBehindBuffer
+from .schema import apply_migrations
 
 logger = logging.getLogger(__name__)
 
+Durability = Literal["sync", "async"]
+
+_INSERT_CONVERSATIONS = """
+    insert into forge.conversations (conversation_id, last_activity)
+    values ($1, $2)
+    on conflict (conversation_id) do update
+    set last_activity = greatest(forge.conversations.last_activity, excluded.last_activity)
+"""
+
+_INSERT_MESSAGES = """
+    insert into forge.messages (
+        conversation_id,
+        message_id,
+        role,
+        content,
+        timestamp,
+        metadata
+    ) values ($1, $2, $3, $4, $5, $6::jsonb)
+    on conflict (message_id) do nothing
+"""
+
+_SELECT_MESSAGES = """
+    select message_id, role, content, timestamp, metadata
+    from forge.messages
+    where conversation_id = $1 {keyset}
+    order by timestamp {order}, message_id {order}
+    limit {limit}
+"""
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+
 
 class PostgresConversationStore(IConversationStore):
-    def __init__(self, dsn: str) -> None:
+    """Conversation history in Postgres with write-behind batching.
+
+    Messages are buffered and written in batches (one ``executemany`` per table
+    inside a transaction) when ``flush_batch_size`` messages are pending or
+    ``flush_interval_ms`` has passed. With ``durability="sync"`` (default)
+    ``store_message`` returns once its batch is committed, so concurrent writers
+    share a commit; ``"async"`` acknowledges immediately and trades the last
+    unflushed batch on a crash for lower latency. Reads merge buffered messages
+    so callers always see their own writes.
+
+    History can be read page by page with :meth:`get_messages_page`, which seeks
+    on the ``(conversation_id, timestamp, message_id)`` index so each page costs
+    O(page) regardless of conversation length. Pending schema migrations are
+    applied on connect unless ``auto_migrate`` is off.
+
+    Settings fall back to ``AF_DB_POOL_MIN``, ``AF_DB_POOL_MAX``,
+    ``AF_DB_DURABILITY``, ``AF_DB_FLUSH_BATCH``, ``AF_DB_FLUSH_MS`` and
+    ``AF_DB_AUTO_MIGRATE``.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        min_pool_size: int | None = None,
+        max_pool_size: int | None = None,
+        durability: Durability | None = None,
+        flush_batch_size: int | None = None,
+        flush_interval_ms: float | None = None,
+        auto_migrate: bool | None = None,
+    ) -> None:
         self._dsn = dsn
         self._pool: asyncpg.Pool | None = None
+        self.min_pool_size = max(1, min_pool_size or _env_int("AF_DB_POOL_MIN", 2))
+        self.max_pool_size = max(
+            self.min_pool_size, max_pool_size or _env_int("AF_DB_POOL_MAX", 10)
+        )
+        mode = (durability or os.environ.get("AF_DB_DURABILITY") or "sync").lower()
+        if mode not in ("sync", "async"):
+            raise ValueError(f"Unknown durability mode: {mode}")
+        self.durability: Durability = mode  # type: ignore[assignment]
+        if auto_migrate is None:
+            auto_migrate = os.environ.get("AF_DB_AUTO_MIGRATE", "1").lower() not in (
+                "0",
+                "false",
+                "no",
+            )
+        self.auto_migrate = auto_migrate
+        self._buffer: WriteBehindBuffer[tuple[ConversationID, Message]] = (
+            WriteBehindBuffer(
+                self._write_batch,
+                max_batch_size=flush_batch_size or _env_int("AF_DB_FLUSH_BATCH", 256),
+                flush_interval_ms=flush_interval_ms
+                if flush_interval_ms is not None
+                else float(_env_int("AF_DB_FLUSH_MS", 20)),
+                name="postgres_messages",
+            )
+        )
 
     async def connect(self) -> None:
         if self._pool is None:
-            self._pool = await asyncpg.create_pool(self._dsn, min_size=1, max_size=5)
+            self._pool = await asyncpg.create_pool(
+                self._dsn, min_size=self.min_pool_size, max_size=self.max_pool_size
+            )
+            if self.auto_migrate:
+                await self.migrate()
+
+    async def migrate(self) -> List[str]:
+        """Apply pending schema migrations; best-effort when called from connect."""
+        if self._pool is None:
+            await self.connect()
+        assert self._pool is not None
+        try:
+            async with self._pool.acquire() as conn:
+                applied = await apply_migrations(conn)
+        except Exception as e:
+            # Restricted roles may not own the schema; the initdb scripts cover it
+            logger.warning(f"Skipping conversation schema migrations: {e}")
+            return []
+        if applied:
+            logger.info(f"Applied conversation schema migrations: {applied}")
+        return applied
+
+    async def close(self) -> None:
+        """Flush buffered writes and close the pool."""
+        await self._buffer.aclose()
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def flush(self) -> None:
+        await self._buffer.flush()
+
+    def stats(self) -> dict[str, Any]:
+        pool = self._pool
+        return {
+            "durability": self.durability,
+            "pool_min": self.min_pool_size,
+            "pool_max": self.max_pool_size,
+            "pool_size": pool.get_size() if pool is not None else 0,
+            "pool_idle": pool.get_idle_size() if pool is not None else 0,
+            **self._buffer.stats(),
+        }
 
     async def store_message(
         self, conversation_id: ConversationID, message: Message
     ) -> None:
+        await self._buffer.put(
+            (conversation_id, message), wait=self.durability == "sync"
+        )
+
+    async def _write_batch(self, batch: List[tuple[ConversationID, Message]]) -> None:
         if self._pool is None:
             await self.connect()
         assert self._pool is not None
-        async with self._pool.acquire() as conn:
-            await conn.execute(
-                """
-                insert into forge.messages (
-                    conversation_id,
-                    message_id,
-                    role,
-                    content,
-                    timestamp,
-                    metadata
-                ) values ($1, $2, $3, $4, $5, $6)
-                on conflict (message_id) do nothing
-                """,
+        # Parent rows first so the messages foreign key always holds
+        last_activity: dict[ConversationID, Any] = {}
+        for conversation_id, message in batch:
+            prev = last_activity.get(conversation_id)
+            if prev is None or message.timestamp.timestamp() > prev.timestamp():
+                last_activity[conversation_id] = message.timestamp
+        rows = [
+            (
                 conversation_id,
                 message.message_id,
                 message.role,
                 message.content,
                 message.timestamp,
-                message.metadata if hasattr(message, "metadata") else {},
+                json.dumps(getattr(message, "metadata", None) or {}, default=str),
             )
+            for conversation_id, message in batch
+        ]
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(
+                    _INSERT_CONVERSATIONS, list(last_activity.items())
+                )
+                await conn.executemany(_INSERT_MESSAGES, rows)
 
     async def get_messages(
         self, conversation_id: ConversationID, limit: int = 50
@@ -51,31 +201,96 @@ class PostgresConversationStore(IConversationStore):
         logger.info(
             f"Getting messages for conversation {conversation_id} with limit {limit}"
         )
+        page = await self.get_messages_page(conversation_id, limit)
+        return page.messages
+
+    async def get_messages_page(
+        self,
+        conversation_id: ConversationID,
+        limit: int = 50,
+        *,
+        before: str | None = None,
+        after: str | None = None,
+    ) -> MessagePage:
+        if before is not None and after is not None:
+            raise ValueError("Pass at most one of 'before' and 'after'")
+        if limit <= 0:
+            return MessagePage()
+        forward = after is not None
+        cursor = after if forward else before
+        args: List[Any] = [conversation_id]
+        keyset = ""
+        bound: tuple[float, str] | None = None
+        if cursor is not None:
+            ts, message_id = decode_cursor(cursor)
+            bound = sort_key(ts, message_id)
+            # Row comparison matches the index order, so this is a single range seek
+            op = ">" if forward else "<"
+            keyset = f"and (timestamp, message_id) {op} ($2, $3::uuid)"
+            args += [ts, message_id]
+        # One extra row tells whether another page exists
+        sql = _SELECT_MESSAGES.format(
+            keyset=keyset,
+            order="asc" if forward else "desc",
+            limit=f"${len(args) + 1}",
+        )
+        args.append(limit + 1)
         if self._pool is None:
             await self.connect()
         assert self._pool is not None
         async with self._pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                select message_id, role, content, timestamp
-                from forge.messages
-                where conversation_id = $1
-                order by timestamp desc
-                limit $2
-                """,
-                conversation_id,
-                limit,
-            )
-        # Return in chronological order
-        items: List[Message] = []
-        for r in reversed(rows):
-            items.append(
-                Message(
-                    content=r["content"],
-                    role=r["role"],
-                    timestamp=r["timestamp"],
-                    message_id=r["message_id"],
-                    conversation_id=conversation_id,
-                )
-            )
+            rows = await conn.fetch(sql, *args)
+        items = [self._row_to_message(conversation_id, r) for r in rows]
+        if not forward:
+            items.reverse()
+
+        # Read-your-writes: include matching messages still in the write buffer
+        def in_range(m: Message) -> bool:
+            if bound is None:
+                return True
+            key = sort_key(m.timestamp, m.message_id)
+            return key > bound if forward else key < bound
+
+        items = self._merge_unflushed(conversation_id, items, in_range)
+        more = len(items) > limit
+        if forward:
+            page = items[:limit]
+            return MessagePage(page, encode_cursor(page[-1]) if more else None)
+        page = items[-limit:]
+        return MessagePage(page, encode_cursor(page[0]) if more else None)
+
+    def _merge_unflushed(
+        self,
+        conversation_id: ConversationID,
+        items: List[Message],
+        in_range: Callable[[Message], bool],
+    ) -> List[Message]:
+        unflushed = [
+            m
+            for cid, m in self._buffer.unflushed()
+            if cid == conversation_id and in_range(m)
+        ]
+        if not unflushed:
+            return items
+        seen = {str(m.message_id) for m in items}
+        items = items + [m for m in unflushed if str(m.message_id) not in seen]
+        items.sort(key=lambda m: sort_key(m.timestamp, m.message_id))
         return items
+
+    @staticmethod
+    def _row_to_message(conversation_id: ConversationID, r: Any) -> Message:
+        metadata = r["metadata"]
+        if isinstance(metadata, str):
+            # asyncpg returns jsonb as text unless a type codec is registered
+            try:
+                metadata = json.loads(metadata)
+            except ValueError:
+                metadata = {}
+        return Message(
+            content=r["content"],
+            role=r["role"],
+            timestamp=r["timestamp"],
+            message_id=r["message_id"],
+            conversation_id=conversation_id,
+            metadata=metadata if isinstance(metadata, dict) else {},
+        )
@@ -1,6 +1,7 @@
-from typing import List
+from typing import AsyncIterator, List
 
 from l6e_forge.types.core import ConversationID, Message
+from l6e_forge.memory.conversation.base import START_CURSOR, MessagePage
 from l6e_forge.memory.managers.base import IMemoryManager
 
 
@@ -19,5 +20,49 @@ class ConversationHistoryProvider:
     ) -> List[Message]:
         return await self._memory_manager.get_conversation(conversation_id, limit)
 
+    async def get_page(
+        self,
+        conversation_id: ConversationID,
+        limit: int = 50,
+        *,
+        before: str | None = None,
+        after: str | None = None,
+    ) -> MessagePage:
+        return await self._memory_manager.get_conversation_page(
+            conversation_id, limit, before=before, after=after
+        )
+
+    async def iter_messages(
+        self,
+        conversation_id: ConversationID,
+        page_size: int = 100,
+        *,
+        newest_first: bool = False,
+    ) -> AsyncIterator[Message]:
+        """Walk the whole conversation one page at a time.
+
+        Oldest first by default; ``newest_first`` walks backwards from the latest
+        message, which lets summarizers stop early.
+        """
+        if newest_first:
+            page = await self.get_page(conversation_id, page_size)
+            while True:
+                for message in reversed(page.messages):
+                    yield message
+                if page.next_cursor is None:
+                    return
+                page = await self.get_page(
+                    conversation_id, page_size, before=page.next_cursor
+                )
+        page = await self.get_page(conversation_id, page_size, after=START_CURSOR)
+        while True:
+            for message in page.messages:
+                yield message
+            if page.next_cursor is None:
+                return
+            page = await self.get_page(
+                conversation_id, page_size, after=page.next_cursor
+            )
+
     async def append(self, conversation_id: ConversationID, message: Message) -> None:
         await self._memory_manager.store_conversation(conversation_id, message)
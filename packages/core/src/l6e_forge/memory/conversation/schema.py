@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Any, List, Tuple
+
+# Ordered (name, sql) pairs. Every statement is idempotent so the same files can
+# also be mounted into the Postgres container's docker-entrypoint-initdb.d.
+MIGRATIONS: List[Tuple[str, str]] = [
+    (
+        "0001_init",
+        """
+-- Create schema and tables for conversation/message persistence
+create schema if not exists forge;
+
+create table if not exists forge.conversations (
+  conversation_id uuid primary key,
+  agent_id text,
+  user_id text,
+  started_at timestamptz default now(),
+  last_activity timestamptz default now(),
+  message_count integer default 0
+);
+
+create table if not exists forge.messages (
+  message_id uuid primary key,
+  conversation_id uuid not null references forge.conversations(conversation_id) on delete cascade,
+  role text not null,
+  content text not null,
+  timestamp timestamptz not null default now(),
+  metadata jsonb default '{}'::jsonb
+);
+
+create index if not exists idx_messages_conversation_ts on forge.messages (conversation_id, timestamp desc);
+""".strip(),
+    ),
+    (
+        "0002_messages_keyset_index",
+        """
+-- Keyset pagination on (timestamp, message_id) within a conversation. The
+-- message_id tiebreaker makes the sort total, so a page is one index range scan.
+create index if not exists idx_messages_conversation_ts_id
+  on forge.messages (conversation_id, timestamp desc, message_id desc);
+
+-- Superseded by the index above (same leading columns)
+drop index if exists forge.idx_messages_conversation_ts;
+""".strip(),
+    ),
+]
+
+_LEDGER = """
+create schema if not exists forge;
+create table if not exists forge.schema_migrations (
+  name text primary key,
+  applied_at timestamptz not null default now()
+)
+"""
+
+# Arbitrary constant so concurrent processes apply migrations one at a time
+_LOCK_KEY = 0x6C36_6566
+
+
+async def apply_migrations(conn: Any) -> List[str]:
+    """Apply pending migrations on an asyncpg connection; returns their names."""
+    applied: List[str] = []
+    await conn.execute("select pg_advisory_lock($1)", _LOCK_KEY)
+    try:
+        await conn.execute(_LEDGER)
+        rows = await conn.fetch("select name from forge.schema_migrations")
+        done = {r["name"] for r in rows}
+        for name, sql in MIGRATIONS:
+            if name in done:
+                continue
+            async with conn.transaction():
+                await conn.execute(sql)
+                await conn.execute(
+                    "insert into forge.schema_migrations (name) values ($1)"
+                    " on conflict (name) do nothing",
+                    name,
+                )
+            applied.append(name)
+    finally:
+        await conn.execute("select pg_advisory_unlock($1)", _LOCK_KEY)
+    return applied
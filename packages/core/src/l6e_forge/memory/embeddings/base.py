@@ -13,3 +13,20 @@ class IEmbeddingProvider(Protocol):
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
         """Return embeddings for a list of strings."""
         ...
+
+
+class IAsyncEmbeddingProvider(Protocol):
+    """Non-blocking embedding provider interface.
+
+    Providers that talk to a model server over the network SHOULD implement this
+    alongside :class:`IEmbeddingProvider` so callers running on an event loop
+    never block on HTTP. The memory manager prefers these methods when present.
+    """
+
+    async def aembed(self, text: str) -> List[float]:
+        """Return vector embedding for a single string."""
+        ...
+
+    async def aembed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Return embeddings for a list of strings."""
+        ...
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional
+
+
+BatchEmbedFn = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-text embedding requests into batched calls.
+
+    Requests arriving within ``window_ms`` of the first pending one are sent
+    together through ``embed_batch`` (flushed early once ``max_batch_size`` is
+    reached). Identical texts, whether pending or already in flight, share a
+    single result instead of being embedded twice.
+    """
+
+    def __init__(
+        self,
+        embed_batch: BatchEmbedFn,
+        *,
+        window_ms: float = 5.0,
+        max_batch_size: int = 64,
+    ) -> None:
+        self._embed_batch = embed_batch
+        self._window_s = max(0.0, window_ms) / 1000.0
+        self._max_batch_size = max(1, max_batch_size)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: dict[str, asyncio.Future[List[float]]] = {}
+        self._inflight: dict[str, asyncio.Future[List[float]]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def embed(self, text: str) -> List[float]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # State from a previous event loop cannot be awaited here
+            self._loop = loop
+            self._pending, self._inflight, self._timer = {}, {}, None
+            self._tasks = set()
+        fut = self._inflight.get(text) or self._pending.get(text)
+        if fut is None:
+            fut = loop.create_future()
+            self._pending[text] = fut
+            if len(self._pending) >= self._max_batch_size:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self._window_s, self._flush)
+        # Shield so one cancelled caller does not cancel a result others share
+        return list(await asyncio.shield(fut))
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            self._inflight.update(batch)
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[str, asyncio.Future[List[float]]]) -> None:
+        texts = list(batch.keys())
+        try:
+            vectors = await self._embed_batch(texts)
+            if len(vectors) != len(texts):
+                raise RuntimeError(
+                    f"Embedding provider returned {len(vectors)} vectors for {len(texts)} inputs"
+                )
+            for text, vec in zip(texts, vectors):
+                fut = batch[text]
+                if not fut.done():
+                    fut.set_result(vec)
+        except asyncio.CancelledError:
+            for fut in batch.values():
+                fut.cancel()
+            raise
+        except Exception as exc:  # noqa: BLE001
+            for fut in batch.values():
+                if not fut.done():
+                    fut.set_exception(exc)
+                    # Mark retrieved so futures whose callers went away do not warn
+                    fut.exception()
+        finally:
+            for text in texts:
+                if self._inflight.get(text) is batch[text]:
+                    del self._inflight[text]
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .base import IAsyncEmbeddingProvider, IEmbeddingProvider
+
+# Rough per-entry bookkeeping cost (key string, OrderedDict node, ndarray header)
+_ENTRY_OVERHEAD_BYTES = 200
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class _DiskTier:
+    """SQLite-backed store of float32 vectors keyed by content hash."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute("pragma journal_mode=wal")
+            self._conn.execute(
+                "create table if not exists embeddings (key text primary key, vec blob not null)"
+            )
+            self._conn.commit()
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        if not keys:
+            return {}
+        out: Dict[str, np.ndarray] = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"select key, vec from embeddings where key in ({marks})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    out[key] = np.frombuffer(blob, dtype=np.float32).copy()
+        return out
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        if not items:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "insert or replace into embeddings (key, vec) values (?, ?)",
+                [(k, v.astype(np.float32).tobytes()) for k, v in items.items()],
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbeddingProvider(IEmbeddingProvider, IAsyncEmbeddingProvider):
+    """Content-addressed cache in front of any embedding provider.
+
+    Vectors are keyed by sha256(model, text) and kept in an in-process LRU
+    bounded by ``max_bytes``. With ``disk_path`` set, misses fall through to a
+    SQLite file before calling the wrapped provider, so repeated texts survive
+    restarts. Hit/miss counts are exposed via :meth:`stats` and recorded as
+    ``embedding_cache_*`` metrics on the monitoring service. Sync calls made
+    from a worker thread (e.g. ``asyncio.to_thread``) hand their metrics to the
+    event loop the cache was last used on; with no live loop only
+    :meth:`stats` is updated.
+    """
+
+    def __init__(
+        self,
+        provider: IEmbeddingProvider,
+        *,
+        model: str | None = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_path: str | Path | None = None,
+    ) -> None:
+        self._provider = provider
+        self.model = model or str(
+            getattr(provider, "model", None) or type(provider).__name__
+        )
+        self._max_bytes = max(0, max_bytes)
+        self._lru: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._disk: Optional[_DiskTier] = (
+            _DiskTier(Path(disk_path)) if disk_path else None
+        )
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        # Loop that records metrics; sync calls from other threads hand off to it
+        self._loop = _running_loop()
+        self._report_tasks: set[asyncio.Task[None]] = set()
+
+    # ---- IEmbeddingProvider ----
+    def embed(self, text: str) -> List[float]:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(t) for t in texts]
+        found, missing = self._lookup_memory(keys, texts)
+        memory_hits, disk_hits = len(found), 0
+        if missing and self._disk is not None:
+            disk_found = self._disk.get_many(list(missing))
+            disk_hits = len(disk_found)
+            self._promote(disk_found, found)
+        todo = [k for k in dict.fromkeys(keys) if k not in found]
+        if todo:
+            vectors = self._provider.embed_batch([missing[k] for k in todo])
+            fresh = self._store(todo, vectors, found)
+            if self._disk is not None:
+                self._disk.put_many(fresh)
+        self._report_sync(memory_hits, disk_hits, len(todo))
+        return [found[k].tolist() for k in keys]
+
+    # ---- IAsyncEmbeddingProvider ----
+    async def aembed(self, text: str) -> List[float]:
+        return (await self.aembed_batch([text]))[0]
+
+    async def aembed_batch(self, texts: List[str]) -> List[List[float]]:
+        self._loop = asyncio.get_running_loop()
+        keys = [self._key(t) for t in texts]
+        found, missing = self._lookup_memory(keys, texts)
+        memory_hits, disk_hits = len(found), 0
+        if missing and self._disk is not None:
+            disk_found = await asyncio.to_thread(self._disk.get_many, list(missing))
+            disk_hits = len(disk_found)
+            self._promote(disk_found, found)
+        todo = [k for k in dict.fromkeys(keys) if k not in found]
+        if todo:
+            vectors = await self._provider_embed([missing[k] for k in todo])
+            fresh = self._store(todo, vectors, found)
+            if self._disk is not None and fresh:
+                await asyncio.to_thread(self._disk.put_many, fresh)
+        await self._report(memory_hits, disk_hits, len(todo))
+        return [found[k].tolist() for k in keys]
+
+    async def _provider_embed(self, texts: List[str]) -> List[List[float]]:
+        # Single misses go through aembed so providers can micro-batch them
+        aembed = getattr(self._provider, "aembed", None)
+        if len(texts) == 1 and callable(aembed):
+            return [await aembed(texts[0])]
+        aembed_batch = getattr(self._provider, "aembed_batch", None)
+        if callable(aembed_batch):
+            return await aembed_batch(texts)
+        return await asyncio.to_thread(self._provider.embed_batch, texts)
+
+    # ---- Introspection ----
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._disk_hits + self._misses
+        return {
+            "model": self.model,
+            "entries": len(self._lru),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self._hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "hit_rate": (self._hits + self._disk_hits) / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+    # ---- Internals ----
+    def _key(self, text: str) -> str:
+        h = hashlib.sha256()
+        h.update(self.model.encode("utf-8"))
+        h.update(b"\0")
+        h.update(text.encode("utf-8"))
+        return h.hexdigest()
+
+    def _lookup_memory(
+        self, keys: List[str], texts: List[str]
+    ) -> tuple[Dict[str, np.ndarray], Dict[str, str]]:
+        """Split keys into LRU hits and misses (miss key -> text to embed)."""
+        found: Dict[str, np.ndarray] = {}
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            vec = self._lru.get(key)
+            if vec is not None:
+                self._lru.move_to_end(key)
+                found[key] = vec
+                self._hits += 1
+            else:
+                missing[key] = text
+        return found, missing
+
+    def _promote(
+        self, disk_found: Dict[str, np.ndarray], found: Dict[str, np.ndarray]
+    ) -> None:
+        for key, vec in disk_found.items():
+            self._disk_hits += 1
+            found[key] = vec
+            self._remember(key, vec)
+
+    def _store(
+        self, keys: List[str], vectors: List[List[float]], found: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        if len(vectors) != len(keys):
+            raise RuntimeError(
+                f"Embedding provider returned {len(vectors)} vectors for {len(keys)} inputs"
+            )
+        fresh: Dict[str, np.ndarray] = {}
+        for key, vector in zip(keys, vectors):
+            self._misses += 1
+            vec = np.asarray(vector, dtype=np.float32)
+            found[key] = vec
+            # Never cache all-zero vectors; providers use them as failure fallbacks
+            if vec.size and np.any(vec):
+                self._remember(key, vec)
+                fresh[key] = vec
+        return fresh
+
+    def _remember(self, key: str, vec: np.ndarray) -> None:
+        size = vec.nbytes + _ENTRY_OVERHEAD_BYTES
+        if size > self._max_bytes:
+            return
+        old = self._lru.pop(key, None)
+        if old is not None:
+            self._bytes -= old.nbytes + _ENTRY_OVERHEAD_BYTES
+        self._lru[key] = vec
+        self._bytes += size
+        while self._bytes > self._max_bytes and self._lru:
+            _k, evicted = self._lru.popitem(last=False)
+            self._bytes -= evicted.nbytes + _ENTRY_OVERHEAD_BYTES
+
+    def _report_sync(self, hits: int, disk_hits: int, misses: int) -> None:
+        if not (hits or disk_hits or misses):
+            return
+        if _running_loop() is not None:
+            self._spawn_report(hits, disk_hits, misses)
+            return
+        # Worker thread: the monitor is not thread-safe, so record on its loop
+        loop = self._loop
+        if loop is None or loop.is_closed() or not loop.is_running():
+            return
+        try:
+            loop.call_soon_threadsafe(self._spawn_report, hits, disk_hits, misses)
+        except RuntimeError:
+            # Loop closed between the check and the hand-off
+            pass
+
+    def _spawn_report(self, hits: int, disk_hits: int, misses: int) -> None:
+        task = asyncio.get_running_loop().create_task(
+            self._report(hits, disk_hits, misses)
+        )
+        self._report_tasks.add(task)
+        task.add_done_callback(self._report_tasks.discard)
+
+    async def _report(self, hits: int, disk_hits: int, misses: int) -> None:
+        if not (hits or disk_hits or misses):
+            return
+        try:
+            from l6e_forge.runtime.monitoring import get_monitoring
+
+            mon = get_monitoring()
+            tags = {"model": self.model}
+            if hits:
+                await mon.record_metric(
+                    "embedding_cache_hits", float(hits), tags={**tags, "tier": "memory"}
+                )
+            if disk_hits:
+                await mon.record_metric(
+                    "embedding_cache_hits",
+                    float(disk_hits),
+                    tags={**tags, "tier": "disk"},
+                )
+            if misses:
+                await mon.record_metric(
+                    "embedding_cache_misses", float(misses), tags=tags
+                )
+        except Exception:
+            pass
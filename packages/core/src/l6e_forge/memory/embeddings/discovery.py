@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from l6e_forge.logging import get_logger
+from l6e_forge.runtime.http import HttpClientPool, get_http_pool
+
+from .base import IAsyncEmbeddingProvider, IEmbeddingProvider
+
+logger = get_logger()
+
+# Cheap liveness endpoint per provider, relative to its base URL
+_PROBE_PATHS: Dict[str, str] = {"ollama": "/api/version", "lmstudio": "/models"}
+
+FALLBACK_PROVIDER = "mock"
+
+
+@dataclass
+class ProbeResult:
+    provider: str
+    reachable: bool
+    latency_ms: float
+    checked_at: float
+    error: str | None = None
+
+
+def load_embedding_settings(workspace_root: Path) -> Dict[str, Any]:
+    """Read ``[memory]`` discovery settings from forge.toml, with env overrides.
+
+    Recognised keys: ``embedding_provider`` (skips probing entirely) and
+    ``probe_ttl_seconds``. ``AF_EMBEDDING_PROVIDER`` overrides the provider.
+    """
+    settings: Dict[str, Any] = {}
+    cfg_path = workspace_root / "forge.toml"
+    if cfg_path.exists():
+        try:
+            import tomllib
+
+            with cfg_path.open("rb") as f:
+                memory = (tomllib.load(f) or {}).get("memory") or {}
+            if isinstance(memory.get("embedding_provider"), str):
+                settings["provider"] = memory["embedding_provider"]
+            if isinstance(memory.get("probe_ttl_seconds"), (int, float)):
+                settings["ttl_s"] = float(memory["probe_ttl_seconds"])
+        except Exception:
+            pass
+    env_provider = os.environ.get("AF_EMBEDDING_PROVIDER", "").strip()
+    if env_provider:
+        settings["provider"] = env_provider
+    if "provider" in settings:
+        settings["provider"] = str(settings["provider"]).lower()
+    return settings
+
+
+class DiscoveredEmbeddingProvider(IEmbeddingProvider, IAsyncEmbeddingProvider):
+    """Embedding provider that picks its backend by probing local model servers.
+
+    Construction does no I/O, so building a memory manager is instant. Probes run
+    concurrently on the pooled async client, either ahead of time via
+    :meth:`start` or on the first embedding call, and their results are cached
+    for ``ttl_s``. The first reachable provider in ``order`` wins; once a real
+    provider is chosen it is kept for the process lifetime so stored vectors stay
+    comparable. While only the fallback is available, stale results trigger a
+    background re-probe that can upgrade to a real provider. A configured
+    ``override`` bypasses probing altogether.
+    """
+
+    def __init__(
+        self,
+        factories: Dict[str, Callable[[], IEmbeddingProvider]],
+        endpoints: Dict[str, str],
+        *,
+        http: HttpClientPool | None = None,
+        order: Sequence[str] = ("ollama", "lmstudio"),
+        override: str | None = None,
+        ttl_s: float = 300.0,
+        probe_timeout_s: float = 1.0,
+    ) -> None:
+        if FALLBACK_PROVIDER not in factories:
+            raise ValueError(f"factories must include '{FALLBACK_PROVIDER}'")
+        if override is not None and override not in factories:
+            raise ValueError(f"Unknown embedding provider: {override}")
+        self._factories = factories
+        self._endpoints = {k: v.rstrip("/") for k, v in endpoints.items()}
+        self._http = http or get_http_pool()
+        self._order = [p for p in order if p in factories and p in _PROBE_PATHS]
+        self._override = override
+        self._ttl_s = ttl_s
+        self._probe_timeout_s = probe_timeout_s
+        self._results: Dict[str, ProbeResult] = {}
+        self._checked_at: float | None = None
+        self._selected: str | None = None
+        self._active: Optional[IEmbeddingProvider] = None
+        self._probe_task: Optional[asyncio.Task[None]] = None
+        if override is not None:
+            self._select(override)
+
+    # ---- Discovery ----
+    def start(self) -> None:
+        """Kick off a background probe on the running loop; never blocks."""
+        if self._selected is None or self._is_stale():
+            self._ensure_probe_task()
+
+    async def refresh(self) -> Dict[str, ProbeResult]:
+        """Probe every candidate concurrently and update the cached results."""
+        results = await asyncio.gather(*(self._aprobe(p) for p in self._order))
+        self._apply(results)
+        return dict(self._results)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "selected": self._selected,
+            "override": self._override,
+            "checked_at": self._checked_at,
+            "stale": self._is_stale(),
+            "probes": {
+                name: {
+                    "reachable": r.reachable,
+                    "latency_ms": r.latency_ms,
+                    "error": r.error,
+                }
+                for name, r in self._results.items()
+            },
+        }
+
+    @property
+    def selected(self) -> str | None:
+        return self._selected
+
+    # ---- IEmbeddingProvider ----
+    def embed(self, text: str) -> List[float]:
+        return self._resolve_sync().embed(text)
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        return self._resolve_sync().embed_batch(texts)
+
+    # ---- IAsyncEmbeddingProvider ----
+    async def aembed(self, text: str) -> List[float]:
+        provider = await self._resolve()
+        aembed = getattr(provider, "aembed", None)
+        if callable(aembed):
+            return await aembed(text)
+        return await asyncio.to_thread(provider.embed, text)
+
+    async def aembed_batch(self, texts: List[str]) -> List[List[float]]:
+        provider = await self._resolve()
+        aembed_batch = getattr(provider, "aembed_batch", None)
+        if callable(aembed_batch):
+            return await aembed_batch(texts)
+        return await asyncio.to_thread(provider.embed_batch, texts)
+
+    # ---- Internals ----
+    async def _resolve(self) -> IEmbeddingProvider:
+        if self._active is not None:
+            if self._selected == FALLBACK_PROVIDER and self._is_stale():
+                self._ensure_probe_task()
+            return self._active
+        task = self._ensure_probe_task()
+        # Shield so one cancelled caller does not abort the probe for everyone
+        await asyncio.shield(task)
+        assert self._active is not None
+        return self._active
+
+    def _resolve_sync(self) -> IEmbeddingProvider:
+        if self._active is None:
+            with ThreadPoolExecutor(max_workers=max(1, len(self._order))) as pool:
+                self._apply(list(pool.map(self._probe_sync, self._order)))
+        assert self._active is not None
+        return self._active
+
+    def _ensure_probe_task(self) -> asyncio.Task[None]:
+        task = self._probe_task
+        loop = asyncio.get_running_loop()
+        if task is None or task.done() or task.get_loop() is not loop:
+
+            async def _run() -> None:
+                try:
+                    await self.refresh()
+                except Exception as e:  # noqa: BLE001
+                    logger.warning(f"Embedding provider probe failed: {e}")
+                    if self._active is None:
+                        self._select(FALLBACK_PROVIDER)
+
+            task = loop.create_task(_run())
+            self._probe_task = task
+        return task
+
+    def _is_stale(self) -> bool:
+        if self._override is not None:
+            return False
+        return (
+            self._checked_at is None
+            or time.monotonic() - self._checked_at >= self._ttl_s
+        )
+
+    def _apply(self, results: List[ProbeResult]) -> None:
+        for r in results:
+            self._results[r.provider] = r
+        self._checked_at = time.monotonic()
+        if self._override is not None:
+            return
+        if self._selected not in (None, FALLBACK_PROVIDER):
+            return
+        chosen = next((r.provider for r in results if r.reachable), FALLBACK_PROVIDER)
+        if chosen != self._selected:
+            if self._selected == FALLBACK_PROVIDER:
+                logger.warning(
+                    f"Embedding provider '{chosen}' became reachable; switching from "
+                    f"'{FALLBACK_PROVIDER}' (vectors stored earlier are not comparable)"
+                )
+            self._select(chosen)
+
+    def _select(self, name: str) -> None:
+        self._active = self._factories[name]()
+        self._selected = name
+
+    def _probe_url(self, provider: str) -> str:
+        return f"{self._endpoints[provider]}{_PROBE_PATHS[provider]}"
+
+    async def _aprobe(self, provider: str) -> ProbeResult:
+        start = time.perf_counter()
+        try:
+            client = self._http.async_client(self._endpoints[provider])
+            r = await client.get(
+                self._probe_url(provider), timeout=self._probe_timeout_s
+            )
+        except Exception as e:  # noqa: BLE001
+            return self._result(provider, start, str(e) or type(e).__name__)
+        return self._result(provider, start, _status_error(r.status_code))
+
+    def _probe_sync(self, provider: str) -> ProbeResult:
+        start = time.perf_counter()
+        try:
+            client = self._http.sync_client(self._endpoints[provider])
+            r = client.get(self._probe_url(provider), timeout=self._probe_timeout_s)
+        except Exception as e:  # noqa: BLE001
+            return self._result(provider, start, str(e) or type(e).__name__)
+        return self._result(provider, start, _status_error(r.status_code))
+
+    @staticmethod
+    def _result(provider: str, start: float, error: str | None) -> ProbeResult:
+        return ProbeResult(
+            provider=provider,
+            reachable=error is None,
+            latency_ms=(time.perf_counter() - start) * 1000.0,
+            checked_at=time.time(),
+            error=error,
+        )
+
+
+def _status_error(status_code: int) -> str | None:
+    return None if status_code == 200 else f"HTTP {status_code}"
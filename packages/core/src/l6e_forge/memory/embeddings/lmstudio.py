@@ -1,35 +1,67 @@
 from __future__ import annotations
 
 import os
-from typing import List
+from typing import Any, List
 
-import httpx
+from l6e_forge.runtime.http import HttpClientPool, get_http_pool
 
-from .base import IEmbeddingProvider
+from .base import IAsyncEmbeddingProvider, IEmbeddingProvider
+from .batching import MicroBatcher
 
 
-class LMStudioEmbeddingProvider(IEmbeddingProvider):
+class LMStudioEmbeddingProvider(IEmbeddingProvider, IAsyncEmbeddingProvider):
     def __init__(
-        self, model: str = "text-embedding-3-small", endpoint: str | None = None
+        self,
+        model: str = "text-embedding-3-small",
+        endpoint: str | None = None,
+        http: HttpClientPool | None = None,
+        *,
+        batch_window_ms: float = 5.0,
+        max_batch_size: int = 64,
     ) -> None:
         # LM Studio OpenAI-compatible endpoint
         self.model = model
         self.endpoint = (
             endpoint or os.environ.get("LMSTUDIO_HOST") or "http://localhost:1234/v1"
         ).rstrip("/")
+        self._http = http or get_http_pool()
+        # Concurrent aembed() calls share one batched request
+        self._batcher = MicroBatcher(
+            self.aembed_batch, window_ms=batch_window_ms, max_batch_size=max_batch_size
+        )
 
     def embed(self, text: str) -> List[float]:
         return self.embed_batch([text])[0]
 
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
         url = f"{self.endpoint}/embeddings"
-        payload = {"model": self.model, "input": texts if len(texts) > 1 else texts[0]}
         try:
-            resp = httpx.post(url, json=payload, timeout=30.0)
+            client = self._http.sync_client(self.endpoint)
+            resp = client.post(url, json=self._payload(texts), timeout=30.0)
             resp.raise_for_status()
-            data = resp.json()
-            items = data.get("data") or []
-            return [list(map(float, it.get("embedding") or [])) for it in items]
+            return self._parse(resp.json())
         except Exception:
             pass
         return [[0.0] * 384 for _ in texts]
+
+    async def aembed(self, text: str) -> List[float]:
+        return await self._batcher.embed(text)
+
+    async def aembed_batch(self, texts: List[str]) -> List[List[float]]:
+        url = f"{self.endpoint}/embeddings"
+        try:
+            client = self._http.async_client(self.endpoint)
+            resp = await client.post(url, json=self._payload(texts), timeout=30.0)
+            resp.raise_for_status()
+            return self._parse(resp.json())
+        except Exception:
+            pass
+        return [[0.0] * 384 for _ in texts]
+
+    def _payload(self, texts: List[str]) -> dict[str, Any]:
+        return {"model": self.model, "input": texts if len(texts) > 1 else texts[0]}
+
+    @staticmethod
+    def _parse(data: dict[str, Any]) -> List[List[float]]:
+        items = data.get("data") or []
+        return [list(map(float, it.get("embedding") or [])) for it in items]
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from typing import List
 
-from .base import IEmbeddingProvider
+from .base import IAsyncEmbeddingProvider, IEmbeddingProvider
 
 
-class MockEmbeddingProvider(IEmbeddingProvider):
+class MockEmbeddingProvider(IEmbeddingProvider, IAsyncEmbeddingProvider):
     def __init__(self, dim: int = 256) -> None:
         self.dim = dim
 
@@ -23,3 +23,9 @@ class MockEmbeddingProvider(IEmbeddingProvider):
             norm = sum(x * x for x in vec) ** 0.5 or 1.0
             outs.append([x / norm for x in vec])
         return outs
+
+    async def aembed(self, text: str) -> List[float]:
+        return self.embed(text)
+
+    async def aembed_batch(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_batch(texts)
@@ -1,38 +1,141 @@
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
 
 import httpx
 
-from .base import IEmbeddingProvider
+from l6e_forge.runtime.http import HttpClientPool, get_http_pool
 
+from .base import IAsyncEmbeddingProvider, IEmbeddingProvider
+from .batching import MicroBatcher
+
+
+class OllamaEmbeddingProvider(IEmbeddingProvider, IAsyncEmbeddingProvider):
+    """Embeddings via Ollama's batch endpoint (POST /api/embed with ``input: [...]``).
+
+    Large batches are split into requests whose UTF-8 payload stays under
+    ``max_request_bytes`` (a cheap stand-in for the model's token budget) and the
+    requests run concurrently, up to ``max_concurrency`` at a time. Any failure
+    raises ``RuntimeError`` rather than returning placeholder vectors.
+    """
 
-class OllamaEmbeddingProvider(IEmbeddingProvider):
     def __init__(
-        self, model: str = "nomic-embed-text:latest", endpoint: str | None = None
+        self,
+        model: str = "nomic-embed-text:latest",
+        endpoint: str | None = None,
+        http: HttpClientPool | None = None,
+        *,
+        batch_window_ms: float = 5.0,
+        max_batch_size: int = 64,
+        max_request_bytes: int = 64 * 1024,
+        max_concurrency: int = 4,
+        timeout: float = 30.0,
     ) -> None:
         self.model = model
         self.endpoint = (
             endpoint or os.environ.get("OLLAMA_HOST") or "http://localhost:11434"
         ).rstrip("/")
+        self._http = http or get_http_pool()
+        self.max_request_bytes = max(1, max_request_bytes)
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        # Concurrent aembed() calls share one batched request
+        self._batcher = MicroBatcher(
+            self.aembed_batch, window_ms=batch_window_ms, max_batch_size=max_batch_size
+        )
 
     def embed(self, text: str) -> List[float]:
         return self.embed_batch([text])[0]
 
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
-        url = f"{self.endpoint}/api/embeddings"
-        payload = {"model": self.model, "prompt": texts if len(texts) > 1 else texts[0]}
+        chunks = self._chunk(texts)
+        if len(chunks) <= 1 or self.max_concurrency == 1:
+            results = [self._post_chunk(c) for c in chunks]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(chunks))
+            ) as pool:
+                results = list(pool.map(self._post_chunk, chunks))
+        return [vec for chunk in results for vec in chunk]
+
+    async def aembed(self, text: str) -> List[float]:
+        return await self._batcher.embed(text)
+
+    async def aembed_batch(self, texts: List[str]) -> List[List[float]]:
+        chunks = self._chunk(texts)
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async def _run(chunk: List[str]) -> List[List[float]]:
+            async with sem:
+                return await self._apost_chunk(chunk)
+
+        results = await asyncio.gather(*(_run(c) for c in chunks))
+        return [vec for chunk in results for vec in chunk]
+
+    def _chunk(self, texts: List[str]) -> List[List[str]]:
+        """Group texts into requests whose encoded size stays under the byte budget."""
+        chunks: List[List[str]] = []
+        current: List[str] = []
+        size = 0
+        for text in texts:
+            n = len(text.encode("utf-8"))
+            if current and size + n > self.max_request_bytes:
+                chunks.append(current)
+                current, size = [], 0
+            current.append(text)
+            size += n
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _post_chunk(self, texts: List[str]) -> List[List[float]]:
+        client = self._http.sync_client(self.endpoint)
+        try:
+            resp = client.post(
+                f"{self.endpoint}/api/embed",
+                json=self._payload(texts),
+                timeout=self.timeout,
+            )
+            resp.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise self._error(exc) from exc
+        return self._parse(resp.json(), len(texts))
+
+    async def _apost_chunk(self, texts: List[str]) -> List[List[float]]:
+        client = self._http.async_client(self.endpoint)
         try:
-            resp = httpx.post(url, json=payload, timeout=30.0)
+            resp = await client.post(
+                f"{self.endpoint}/api/embed",
+                json=self._payload(texts),
+                timeout=self.timeout,
+            )
             resp.raise_for_status()
-            data = resp.json()
-            # Ollama returns either {embedding: [...]} or {embeddings: [[...],[...]]}
-            if "embeddings" in data and isinstance(data["embeddings"], list):
-                return [list(map(float, v)) for v in data["embeddings"]]
-            if "embedding" in data and isinstance(data["embedding"], list):
-                return [list(map(float, data["embedding"]))]
-        except Exception:
-            pass
-        # Fallback: zeros
-        return [[0.0] * 384 for _ in texts]
+        except httpx.HTTPError as exc:
+            raise self._error(exc) from exc
+        return self._parse(resp.json(), len(texts))
+
+    def _payload(self, texts: List[str]) -> dict[str, Any]:
+        return {"model": self.model, "input": texts}
+
+    def _error(self, exc: httpx.HTTPError) -> RuntimeError:
+        if isinstance(exc, httpx.HTTPStatusError):
+            return RuntimeError(
+                f"Ollama embedding error: HTTP {exc.response.status_code} - {exc.response.text}"
+            )
+        if isinstance(exc, httpx.ConnectError):
+            return RuntimeError(
+                f"Ollama is not running at {self.endpoint}. Install from https://ollama.com and run 'ollama serve'."
+            )
+        return RuntimeError(f"Ollama embedding request failed: {exc}")
+
+    def _parse(self, data: dict[str, Any], expected: int) -> List[List[float]]:
+        embeddings = data.get("embeddings")
+        if not isinstance(embeddings, list) or len(embeddings) != expected:
+            got = len(embeddings) if isinstance(embeddings, list) else 0
+            raise RuntimeError(
+                f"Ollama returned {got} embeddings for {expected} inputs (model {self.model})"
+            )
+        return [list(map(float, v)) for v in embeddings]
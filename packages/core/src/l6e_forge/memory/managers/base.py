@@ -1,7 +1,8 @@
-from typing import Any, Protocol
+from typing import Any, Callable, Iterable, Protocol
 
 from l6e_forge.types.core import Message, ConversationID
-from l6e_forge.types.memory import MemoryResult
+from l6e_forge.memory.conversation.base import MessagePage
+from l6e_forge.types.memory import MemoryBatch, MemoryResult, MetadataFilter
 
 
 class IMemoryManager(Protocol):
@@ -20,14 +21,33 @@ class IMemoryManager(Protocol):
         """Store content with vector embedding"""
         ...
 
+    async def store_vectors_bulk(
+        self,
+        namespace: str,
+        items: Iterable[tuple[str, str, dict[str, Any] | None]],
+        *,
+        collection: str | None = None,
+        batch_size: int = 64,
+        on_progress: Callable[[MemoryBatch], None] | None = None,
+    ) -> MemoryBatch:
+        """Embed and store many (key, content, metadata) items in batches.
+
+        Returns the final batch report; ``on_progress`` is called after each chunk.
+        """
+        ...
+
     async def search_vectors(
         self,
         namespace: str,
         query: str,
         collection: str | None = None,
         limit: int = 10,
+        filters: MetadataFilter | None = None,
     ) -> list[MemoryResult]:
-        """Search for similar content using vector similarity"""
+        """Search for similar content using vector similarity.
+
+        ``filters`` restricts results to items whose metadata matches.
+        """
         ...
 
     async def search_vectors_multi(
@@ -36,11 +56,13 @@ class IMemoryManager(Protocol):
         query: str,
         per_namespace_limit: int = 5,
         overall_limit: int | None = None,
+        filters: MetadataFilter | None = None,
     ) -> list[MemoryResult]:
         """Search across multiple namespaces and return merged results sorted by score.
 
         - per_namespace_limit controls how many results to fetch from each namespace.
         - overall_limit (if provided) caps total results after merging/sorting.
+        - filters (if provided) is applied to every namespace before ranking.
         """
         ...
 
@@ -70,6 +92,21 @@ class IMemoryManager(Protocol):
         """Get conversation history"""
         ...
 
+    async def get_conversation_page(
+        self,
+        conversation_id: ConversationID,
+        limit: int = 50,
+        *,
+        before: str | None = None,
+        after: str | None = None,
+    ) -> MessagePage:
+        """Get one keyset page of conversation history (oldest first).
+
+        Without a cursor the latest ``limit`` messages are returned; pass the
+        page's ``next_cursor`` as ``before`` (or ``after``) to continue.
+        """
+        ...
+
     # Session memory (temporary, scoped to conversation)
     async def store_session(self, session_id: str, key: str, value: Any) -> None:
         """Store session-scoped data"""
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    Optional,
+    TypeVar,
+    cast,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MB = 1024 * 1024
+
+
+def approx_size(value: Any, _depth: int = 0) -> int:
+    """Rough resident size of ``value`` in bytes; containers are walked 3 levels."""
+    if isinstance(value, str):
+        return 49 + len(value)
+    if isinstance(value, (bytes, bytearray)):
+        return 33 + len(value)
+    size = sys.getsizeof(value, 64)
+    if _depth >= 3:
+        return size
+    if isinstance(value, dict):
+        size += sum(
+            approx_size(k, _depth + 1) + approx_size(v, _depth + 1)
+            for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(approx_size(v, _depth + 1) for v in value)
+    return size
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+
+
+@dataclass
+class MemoryLimits:
+    """Bounds for MemoryManager's in-process conversation, session and KV data.
+
+    ``None`` disables a bound. TTLs are idle times: reading or writing an entry
+    resets its clock.
+    """
+
+    max_messages_per_conversation: int = 1000
+    max_conversations: Optional[int] = 10_000
+    conversation_max_bytes: Optional[int] = 128 * _MB
+    conversation_ttl_s: Optional[float] = 7 * 24 * 3600.0
+    max_sessions: Optional[int] = 10_000
+    session_max_bytes: Optional[int] = 64 * _MB
+    session_ttl_s: Optional[float] = 24 * 3600.0
+    max_kv_entries: Optional[int] = 100_000
+    kv_max_bytes: Optional[int] = 64 * _MB
+
+    @classmethod
+    def from_env(cls) -> "MemoryLimits":
+        """Defaults adjusted by ``AF_MEMORY_MAX_MB`` (split 2:1:1 across
+        conversations, sessions and KV), ``AF_MEMORY_CONVERSATION_TTL`` and
+        ``AF_MEMORY_SESSION_TTL`` (seconds; 0 disables)."""
+        limits = cls()
+        total_mb = _env_float("AF_MEMORY_MAX_MB", 0.0)
+        if total_mb > 0:
+            limits.conversation_max_bytes = int(total_mb * _MB / 2)
+            limits.session_max_bytes = int(total_mb * _MB / 4)
+            limits.kv_max_bytes = int(total_mb * _MB / 4)
+        for attr, env in (
+            ("conversation_ttl_s", "AF_MEMORY_CONVERSATION_TTL"),
+            ("session_ttl_s", "AF_MEMORY_SESSION_TTL"),
+        ):
+            if os.environ.get(env):
+                ttl = _env_float(env, getattr(limits, attr) or 0.0)
+                setattr(limits, attr, ttl if ttl > 0 else None)
+        return limits
+
+
+class _Entry(Generic[V]):
+    __slots__ = ("value", "size", "touched")
+
+    def __init__(self, value: V, size: int, touched: float) -> None:
+        self.value = value
+        self.size = size
+        self.touched = touched
+
+
+class LRUStore(Generic[K, V]):
+    """Mapping with least-recently-used eviction, idle TTL and byte accounting.
+
+    Entries are kept in access order, so expired entries always sit at the front
+    and are dropped as part of normal eviction without a scan. Values mutated in
+    place must report their size change through :meth:`resize`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl_s: Optional[float] = None,
+        sizeof: Callable[[V], int] = approx_size,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries: "OrderedDict[K, _Entry[V]]" = OrderedDict()
+        self._bytes = 0
+        self._evicted = 0
+        self._expired = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        if key not in self._entries:
+            return False
+        return not self._is_expired(self._entries[cast(K, key)], self._clock())
+
+    def values(self) -> Iterator[V]:
+        return (e.value for e in self._entries.values())
+
+    def get(self, key: K, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        now = self._clock()
+        if self._is_expired(entry, now):
+            self._drop(key, expired=True)
+            return default
+        entry.touched = now
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def set(self, key: K, value: V) -> None:
+        size = self._sizeof(value)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+        self._entries[key] = _Entry(value, size, self._clock())
+        self._bytes += size
+        self._evict()
+
+    def setdefault(self, key: K, factory: Callable[[], V]) -> V:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def resize(self, key: K, delta: int) -> None:
+        """Account for an in-place change of ``delta`` bytes to ``key``'s value."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry.size += delta
+        self._bytes += delta
+        entry.touched = self._clock()
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def pop(self, key: K, default: Any = None) -> Any:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return default
+        self._bytes -= entry.size
+        return entry.value
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry now; returns how many were removed."""
+        removed = 0
+        now = self._clock()
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if not self._is_expired(entry, now):
+                break
+            self._drop(key, expired=True)
+            removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_s": self.ttl_s,
+            "evicted": self._evicted,
+            "expired": self._expired,
+        }
+
+    # ---- Internals ----
+    def _is_expired(self, entry: _Entry[V], now: float) -> bool:
+        return self.ttl_s is not None and now - entry.touched >= self.ttl_s
+
+    def _evict(self) -> None:
+        self.purge_expired()
+        # The newest entry is always kept, even when it alone exceeds max_bytes
+        while len(self._entries) > 1 and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._drop(next(iter(self._entries)), expired=False)
+
+    def _drop(self, key: K, *, expired: bool) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        if expired:
+            self._expired += 1
+        else:
+            self._evicted += 1
+
+
+_MISSING: Any = object()
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import itertools
+from collections import deque
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
 from l6e_forge.memory.backends.base import IMemoryBackend
 from l6e_forge.memory.managers.base import IMemoryManager
@@ -9,8 +15,15 @@ from l6e_forge.memory.embeddings.mock import MockEmbeddingProvider
 from l6e_forge.types.core import Message, ConversationID
 
 
-from l6e_forge.memory.conversation.base import IConversationStore
-from l6e_forge.types.memory import MemoryResult
+from l6e_forge.memory.conversation.base import (
+    IConversationStore,
+    MessagePage,
+    paginate,
+)
+from l6e_forge.memory.conversation.cache import ConversationCache, message_size
+from l6e_forge.memory.managers.bounded import LRUStore, MemoryLimits, approx_size
+from l6e_forge.monitor.tracing import set_span_attributes, span, traced
+from l6e_forge.types.memory import MemoryBatch, MemoryResult, MetadataFilter
 
 
 class MemoryManager(IMemoryManager):
@@ -19,13 +32,47 @@ class MemoryManager(IMemoryManager):
         vector_store: Optional[IMemoryBackend] = None,
         embedder: IEmbeddingProvider | None = None,
         conversation_store: Optional[IConversationStore] = None,
+        conversation_cache: Optional[ConversationCache] = None,
+        limits: Optional[MemoryLimits] = None,
     ) -> None:
         self._store = vector_store
         self._embedder = embedder or MockEmbeddingProvider()
-        self._kv: Dict[str, Dict[str, Any]] = {}
-        self._conversations: Dict[str, List[Message]] = {}
-        self._sessions: Dict[str, Dict[str, Any]] = {}
+        # In-process data is bounded so a long-running process does not grow forever
+        self._limits = limits or MemoryLimits.from_env()
+        lim = self._limits
+        self._kv: LRUStore[tuple[str, str], Any] = LRUStore(
+            max_entries=lim.max_kv_entries, max_bytes=lim.kv_max_bytes
+        )
+        self._conversations: LRUStore[str, deque[Message]] = LRUStore(
+            max_entries=lim.max_conversations,
+            max_bytes=lim.conversation_max_bytes,
+            ttl_s=lim.conversation_ttl_s,
+            sizeof=lambda msgs: sum(message_size(m) for m in msgs),
+        )
+        self._sessions: LRUStore[str, Dict[str, Any]] = LRUStore(
+            max_entries=lim.max_sessions,
+            max_bytes=lim.session_max_bytes,
+            ttl_s=lim.session_ttl_s,
+        )
         self._conversation_store = conversation_store
+        # Optional recent-history cache in front of the external conversation store
+        self._conversation_cache = conversation_cache
+
+    @traced("memory.embed")
+    async def _embed(self, text: str) -> List[float]:
+        # Prefer the non-blocking path; run blocking providers off the event loop
+        aembed = getattr(self._embedder, "aembed", None)
+        if callable(aembed):
+            return await aembed(text)
+        return await asyncio.to_thread(self._embedder.embed, text)
+
+    @traced("memory.embed_batch")
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        set_span_attributes(count=len(texts))
+        aembed_batch = getattr(self._embedder, "aembed_batch", None)
+        if callable(aembed_batch):
+            return await aembed_batch(texts)
+        return await asyncio.to_thread(self._embedder.embed_batch, texts)
 
     async def store_vector(
         self,
@@ -38,24 +85,106 @@ class MemoryManager(IMemoryManager):
     ) -> None:
         if self._store is None:
             raise ValueError("No vector store provided")
-        emb = self._embedder.embed(content)
+        emb = await self._embed(content)
         await self._store.upsert(
             namespace, key, emb, content, collection or "default", metadata=metadata
         )
 
+    async def store_vectors_bulk(
+        self,
+        namespace: str,
+        items: Iterable[tuple[str, str, dict[str, Any] | None]],
+        *,
+        collection: str | None = None,
+        batch_size: int = 64,
+        on_progress: Callable[[MemoryBatch], None] | None = None,
+    ) -> MemoryBatch:
+        if self._store is None:
+            raise ValueError("No vector store provided")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        # Only sized inputs report their total up front; iterables are counted as they stream
+        total = len(items) if isinstance(items, Sequence) else None
+        report = MemoryBatch(
+            batch_id=str(uuid.uuid4()),
+            operation_type="bulk_insert",
+            namespace=namespace,
+            entry_count=total or 0,
+            status="processing",
+            started_at=datetime.now(),
+        )
+        upsert_many = getattr(self._store, "upsert_many", None)
+        start = time.perf_counter()
+        it = iter(items)
+        chunk = list(itertools.islice(it, batch_size))
+        while chunk:
+            # Read one batch ahead so only the final write waits for the backend to apply it
+            next_chunk = list(itertools.islice(it, batch_size))
+            try:
+                embeddings = await self._embed_batch([c for _k, c, _m in chunk])
+                if len(embeddings) != len(chunk):
+                    raise RuntimeError(
+                        f"Embedder returned {len(embeddings)} vectors for {len(chunk)} inputs"
+                    )
+                points = [
+                    (key, emb, content, metadata)
+                    for (key, content, metadata), emb in zip(chunk, embeddings)
+                ]
+                if callable(upsert_many):
+                    await upsert_many(
+                        namespace, points, collection or "default", wait=not next_chunk
+                    )
+                else:
+                    for key, emb, content, metadata in points:
+                        await self._store.upsert(
+                            namespace,
+                            key,
+                            emb,
+                            content,
+                            collection or "default",
+                            metadata=metadata,
+                        )
+                report.processed_count += len(chunk)
+            except Exception as exc:  # noqa: BLE001
+                report.failed_count += len(chunk)
+                report.errors.append(f"{chunk[0][0]}..{chunk[-1][0]}: {exc}")
+            if total is None:
+                report.entry_count += len(chunk)
+            elapsed = time.perf_counter() - start
+            report.items_per_second = (
+                report.processed_count / elapsed if elapsed > 0 else 0.0
+            )
+            report.total_size_bytes += sum(
+                len(c.encode("utf-8")) for _k, c, _m in chunk
+            )
+            if on_progress is not None:
+                on_progress(report)
+            chunk = next_chunk
+        report.completed_at = datetime.now()
+        report.status = (
+            "failed"
+            if report.failed_count and not report.processed_count
+            else "completed"
+        )
+        return report
+
     async def search_vectors(
         self,
         namespace: str,
         query: str,
         collection: str | None = None,
         limit: int = 10,
+        filters: MetadataFilter | None = None,
     ) -> list[MemoryResult]:
         if self._store is None:
             raise ValueError("No vector store provided")
-        q = self._embedder.embed(query)
-        rows = await self._store.query(
-            namespace, q, limit=limit, collection=collection or "default"
-        )
+        q = await self._embed(query)
+        # Only forward filters when given so filter-unaware backends keep working
+        extra: dict[str, Any] = {"filters": filters} if filters else {}
+        with span("memory.vector_query", namespace=namespace, limit=limit):
+            rows = await self._store.query(
+                namespace, q, limit=limit, collection=collection or "default", **extra
+            )
         out: list[MemoryResult] = []
         for idx, (key, score, item) in enumerate(rows, start=1):
             out.append(
@@ -79,19 +208,32 @@ class MemoryManager(IMemoryManager):
         query: str,
         per_namespace_limit: int = 5,
         overall_limit: int | None = None,
+        filters: MetadataFilter | None = None,
     ) -> list[MemoryResult]:
         if self._store is None:
             raise ValueError("No vector store provided")
-        q = self._embedder.embed(query)
-        merged: list[MemoryResult] = []
-        for entry in namespaces:
-            if isinstance(entry, tuple):
-                ns, col = entry
+        q = await self._embed(query)
+        extra: dict[str, Any] = {"filters": filters} if filters else {}
+        targets: list[tuple[str, str]] = [
+            entry if isinstance(entry, tuple) else (entry, "default")
+            for entry in namespaces
+        ]
+        # One batched call when the backend supports it, else one query per namespace
+        query_many = getattr(self._store, "query_many", None)
+        with span("memory.vector_query", namespaces=len(targets)):
+            if callable(query_many):
+                batches = await query_many(
+                    [(ns, col, per_namespace_limit) for ns, col in targets], q, **extra
+                )
             else:
-                ns, col = entry, "default"
-            rows = await self._store.query(
-                ns, q, limit=per_namespace_limit, collection=col
-            )
+                batches = [
+                    await self._store.query(
+                        ns, q, limit=per_namespace_limit, collection=col, **extra
+                    )
+                    for ns, col in targets
+                ]
+        merged: list[MemoryResult] = []
+        for (ns, _col), rows in zip(targets, batches):
             for _key, score, item in rows:
                 merged.append(
                     MemoryResult(
@@ -117,36 +259,118 @@ class MemoryManager(IMemoryManager):
         return merged
 
     async def store_kv(self, namespace: str, key: str, value: Any) -> None:
-        ns = self._kv.setdefault(namespace, {})
-        ns[key] = value
+        self._kv.set((namespace, key), value)
 
     async def get_kv(self, namespace: str, key: str) -> Any:
-        return self._kv.get(namespace, {}).get(key)
+        return self._kv.get((namespace, key))
 
     async def delete_kv(self, namespace: str, key: str) -> None:
-        self._kv.get(namespace, {}).pop(key, None)
+        self._kv.pop((namespace, key))
 
+    @traced("memory.store_conversation")
     async def store_conversation(
         self, conversation_id: ConversationID, message: Message
     ) -> None:
         if self._conversation_store is not None:
             await self._conversation_store.store_message(conversation_id, message)
+            if self._conversation_cache is not None:
+                self._conversation_cache.append(conversation_id, message)
             return
-        self._conversations.setdefault(str(conversation_id), []).append(message)
+        key = str(conversation_id)
+        msgs = self._conversations.setdefault(key, self._new_conversation)
+        delta = message_size(message)
+        if len(msgs) == msgs.maxlen:
+            delta -= message_size(msgs[0])
+        msgs.append(message)
+        self._conversations.resize(key, delta)
+
+    def _new_conversation(self) -> deque[Message]:
+        return deque(maxlen=max(1, self._limits.max_messages_per_conversation))
 
+    @traced("memory.get_conversation")
     async def get_conversation(
         self, conversation_id: ConversationID, limit: int = 50
     ) -> list[Message]:
         if self._conversation_store is not None:
-            return await self._conversation_store.get_messages(conversation_id, limit)
-        msgs = self._conversations.get(str(conversation_id), [])
-        return msgs[-limit:]
+            cache = self._conversation_cache
+            if cache is None:
+                return await self._conversation_store.get_messages(
+                    conversation_id, limit
+                )
+            cached = cache.get(conversation_id, limit)
+            set_span_attributes(cache="hit" if cached is not None else "miss")
+            if cached is not None:
+                return cached
+            if limit > cache.window:
+                return await self._conversation_store.get_messages(
+                    conversation_id, limit
+                )
+            # Cold conversation: load the whole window once, then serve from memory
+            cache.begin_load(conversation_id)
+            try:
+                msgs = await self._conversation_store.get_messages(
+                    conversation_id, cache.window
+                )
+            except BaseException:
+                cache.abort_load(conversation_id)
+                raise
+            cache.finish_load(conversation_id, msgs)
+            return msgs[-limit:] if limit > 0 else []
+        msgs = self._conversations.get(str(conversation_id), ())
+        if limit <= 0:
+            return []
+        # Walk from the newest end so the cost is O(limit), not O(history)
+        recent = list(itertools.islice(reversed(msgs), limit))
+        recent.reverse()
+        return recent
+
+    async def get_conversation_page(
+        self,
+        conversation_id: ConversationID,
+        limit: int = 50,
+        *,
+        before: str | None = None,
+        after: str | None = None,
+    ) -> MessagePage:
+        if self._conversation_store is not None:
+            return await self._conversation_store.get_messages_page(
+                conversation_id, limit, before=before, after=after
+            )
+        msgs = self._conversations.get(str(conversation_id), ())
+        return paginate(list(msgs), limit, before=before, after=after)
 
     async def store_session(self, session_id: str, key: str, value: Any) -> None:
-        self._sessions.setdefault(session_id, {})[key] = value
+        data = self._sessions.setdefault(session_id, dict)
+        delta = approx_size(key) + approx_size(value)
+        if key in data:
+            delta -= approx_size(key) + approx_size(data[key])
+        data[key] = value
+        self._sessions.resize(session_id, delta)
 
     async def get_session(self, session_id: str, key: str) -> Any:
-        return self._sessions.get(session_id, {}).get(key)
+        data = self._sessions.get(session_id)
+        return data.get(key) if data is not None else None
 
     async def clear_session(self, session_id: str) -> None:
-        self._sessions.pop(session_id, None)
+        self._sessions.pop(session_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counts and approximate memory of the in-process stores."""
+        for store in (self._conversations, self._sessions, self._kv):
+            store.purge_expired()
+        conversations = self._conversations.stats()
+        conversations["messages"] = sum(len(m) for m in self._conversations.values())
+        conversations["max_messages_per_conversation"] = (
+            self._limits.max_messages_per_conversation
+        )
+        out: Dict[str, Any] = {
+            "conversations": conversations,
+            "sessions": self._sessions.stats(),
+            "kv": self._kv.stats(),
+            "approx_bytes": conversations["bytes"]
+            + self._sessions.stats()["bytes"]
+            + self._kv.stats()["bytes"],
+        }
+        if self._conversation_cache is not None:
+            out["conversation_cache"] = self._conversation_cache.stats()
+        return out
@@ -6,6 +6,7 @@ from l6e_forge.types.model import (
     CompletionResponse,
     ModelInstance,
     ModelSpec,
+    StreamingChunk,
 )
 from l6e_forge.types.error import HealthStatus
 
@@ -39,10 +40,22 @@ class IModelManager(Protocol):
         """Generate chat response"""
         ...
 
-    async def stream_complete(
+    def stream_complete(
         self, model_id: ModelID, prompt: str, **kwargs
     ) -> AsyncIterator[str]:
-        """Stream text completion"""
+        """Stream text completion.
+
+        Implemented as an async generator yielding text deltas.
+        """
+        ...
+
+    def stream_chat(
+        self, model_id: ModelID, messages: list[Message], **kwargs
+    ) -> AsyncIterator[StreamingChunk]:
+        """Stream a chat response as it is generated.
+
+        Implemented as an async generator; the last chunk has ``is_complete=True``.
+        """
         ...
 
     # Model information
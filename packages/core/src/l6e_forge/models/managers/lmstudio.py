@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import json
 import uuid
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, AsyncIterator
 
 import httpx
 
 from l6e_forge.types.core import Message
-from l6e_forge.types.model import ChatResponse, ModelInstance, ModelSpec
+from l6e_forge.types.model import (
+    ChatResponse,
+    ModelInstance,
+    ModelSpec,
+    StreamingChunk,
+)
 from l6e_forge.types.error import HealthStatus
 from l6e_forge.models.managers.base import IModelManager
+from l6e_forge.runtime.http import HttpClientPool, get_http_pool
+from l6e_forge.monitor.tracing import set_span_attributes, traced
 
 
 @dataclass
@@ -24,8 +32,13 @@ class LMStudioModelManager(IModelManager):
     Defaults to http://localhost:1234/v1 as commonly used by LM Studio.
     """
 
-    def __init__(self, endpoint: str = "http://localhost:1234/v1") -> None:
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:1234/v1",
+        http: HttpClientPool | None = None,
+    ) -> None:
         self.endpoint = endpoint.rstrip("/")
+        self._http = http or get_http_pool()
         self._models: dict[str, _LoadedModel] = {}
 
     async def load_model(self, model_spec: ModelSpec) -> uuid.UUID:
@@ -44,12 +57,14 @@ class LMStudioModelManager(IModelManager):
     async def complete(self, model_id: uuid.UUID, prompt: str, **kwargs) -> Any:  # noqa: D401, ANN401
         raise NotImplementedError
 
+    @traced("model.chat")
     async def chat(
         self, model_id: uuid.UUID, messages: list[Message], **kwargs
     ) -> ChatResponse:
         loaded = self._models.get(str(model_id))
         if not loaded:
             raise RuntimeError("Model not loaded")
+        set_span_attributes(provider="lmstudio", model=loaded.model_name)
 
         url = f"{self.endpoint}/chat/completions"
         payload = {
@@ -61,9 +76,9 @@ class LMStudioModelManager(IModelManager):
 
         timeout = kwargs.pop("timeout", 120.0)
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                resp = await client.post(url, json=payload)
-                resp.raise_for_status()
+            client = self._http.async_client(self.endpoint)
+            resp = await client.post(url, json=payload, timeout=timeout)
+            resp.raise_for_status()
         except httpx.ConnectError as exc:  # noqa: PERF203
             raise RuntimeError(
                 f"LM Studio server not reachable at {self.endpoint}. Start it and enable the OpenAI-compatible API."
@@ -96,13 +111,85 @@ class LMStudioModelManager(IModelManager):
             context_truncated=False,
         )
 
-    async def stream_complete(self, model_id: uuid.UUID, prompt: str, **kwargs):  # noqa: D401, ANN201
-        raise NotImplementedError
+    async def stream_chat(
+        self, model_id: uuid.UUID, messages: list[Message], **kwargs
+    ) -> AsyncIterator[StreamingChunk]:
+        loaded = self._models.get(str(model_id))
+        if not loaded:
+            raise RuntimeError("Model not loaded")
+
+        url = f"{self.endpoint}/chat/completions"
+        connect_timeout = kwargs.pop("timeout", None) or 30.0
+        payload = {
+            "model": loaded.model_name,
+            "messages": [{"role": m.role, "content": m.content} for m in messages],
+            "stream": True,
+        }
+        payload.update({k: v for k, v in kwargs.items() if v is not None})
+
+        request_id = str(uuid.uuid4())
+        chunk_id = 0
+        client = self._http.async_client(self.endpoint)
+        try:
+            # Server-sent events: "data: {...}" lines terminated by "data: [DONE]"
+            async with client.stream(
+                "POST",
+                url,
+                json=payload,
+                timeout=httpx.Timeout(connect_timeout, read=None),
+            ) as resp:
+                if resp.is_error:
+                    await resp.aread()
+                resp.raise_for_status()
+                async for line in resp.aiter_lines():
+                    line = line.strip()
+                    if not line or line.startswith(":"):
+                        continue
+                    if line.startswith("data:"):
+                        line = line[len("data:") :].strip()
+                    if line == "[DONE]":
+                        break
+                    data = json.loads(line)
+                    choice = (data.get("choices") or [{}])[0]
+                    content = (choice.get("delta") or {}).get("content") or ""
+                    if content:
+                        yield StreamingChunk(
+                            content=content,
+                            request_id=data.get("id", request_id),
+                            chunk_id=chunk_id,
+                        )
+                        chunk_id += 1
+        except httpx.ConnectError as exc:  # noqa: PERF203
+            raise RuntimeError(
+                f"LM Studio server not reachable at {self.endpoint}. Start it and enable the OpenAI-compatible API."
+            ) from exc
+        except httpx.HTTPStatusError as exc:
+            raise RuntimeError(
+                f"LM Studio error: HTTP {exc.response.status_code} - {exc.response.text}"
+            ) from exc
+        yield StreamingChunk(
+            content="",
+            request_id=request_id,
+            chunk_id=chunk_id,
+            is_complete=True,
+            token_count=0,
+        )
+
+    async def stream_complete(
+        self, model_id: uuid.UUID, prompt: str, **kwargs
+    ) -> AsyncIterator[str]:
+        async for chunk in self.stream_chat(
+            model_id, [Message(content=prompt, role="user")], **kwargs
+        ):
+            if chunk.content:
+                yield chunk.content
 
     def list_available_models(self) -> list[ModelSpec]:
         # OpenAI-compatible: GET /models
         try:
-            resp = httpx.get(f"{self.endpoint}/models", timeout=5.0)
+            resp = self._http.sync_client(self.endpoint).get(
+                f"{self.endpoint}/models", timeout=5.0
+            )
             resp.raise_for_status()
             data = resp.json()
             items = data.get("data", [])
@@ -139,7 +226,8 @@ class LMStudioModelManager(IModelManager):
 
     async def get_model_health(self, model_id: uuid.UUID) -> HealthStatus:  # noqa: ARG002
         try:
-            resp = httpx.get(f"{self.endpoint}/models", timeout=2.0)
+            client = self._http.async_client(self.endpoint)
+            resp = await client.get(f"{self.endpoint}/models", timeout=2.0)
             resp.raise_for_status()
             return HealthStatus(healthy=True, status="healthy")
         except Exception:
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import json
 import uuid
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, AsyncIterator
 
 import httpx
 
 from l6e_forge.types.core import Message
-from l6e_forge.types.model import ChatResponse, ModelInstance, ModelSpec
+from l6e_forge.types.model import (
+    ChatResponse,
+    ModelInstance,
+    ModelSpec,
+    StreamingChunk,
+)
 from l6e_forge.types.error import HealthStatus
 from l6e_forge.models.managers.base import IModelManager
+from l6e_forge.runtime.http import HttpClientPool, get_http_pool
+from l6e_forge.monitor.tracing import set_span_attributes, traced
 
 
 @dataclass
@@ -26,8 +34,13 @@ class OllamaModelManager(IModelManager):
     - Gracefully explains when Ollama is not running
     """
 
-    def __init__(self, endpoint: str = "http://localhost:11434") -> None:
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:11434",
+        http: HttpClientPool | None = None,
+    ) -> None:
         self.endpoint = endpoint.rstrip("/")
+        self._http = http or get_http_pool()
         self._models: dict[str, _LoadedModel] = {}  # model_id -> loaded model
 
     # Model lifecycle
@@ -50,12 +63,14 @@ class OllamaModelManager(IModelManager):
     async def complete(self, model_id: uuid.UUID, prompt: str, **kwargs) -> Any:  # noqa: D401, ANN401
         raise NotImplementedError
 
+    @traced("model.chat")
     async def chat(
         self, model_id: uuid.UUID, messages: list[Message], **kwargs
     ) -> ChatResponse:
         loaded = self._models.get(str(model_id))
         if not loaded:
             raise RuntimeError("Model not loaded")
+        set_span_attributes(provider="ollama", model=loaded.model_name)
         payload = {
             "model": loaded.model_name,
             "messages": [{"role": m.role, "content": m.content} for m in messages],
@@ -66,9 +81,9 @@ class OllamaModelManager(IModelManager):
 
         url = f"{self.endpoint}/api/chat"
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(url, json=payload)
-                resp.raise_for_status()
+            client = self._http.async_client(self.endpoint)
+            resp = await client.post(url, json=payload, timeout=30.0)
+            resp.raise_for_status()
         except httpx.ConnectError as exc:  # noqa: PERF203
             raise RuntimeError(
                 f"Ollama is not running at {self.endpoint}. Install from https://ollama.com and run 'ollama serve'."
@@ -101,14 +116,85 @@ class OllamaModelManager(IModelManager):
             context_truncated=False,
         )
 
-    async def stream_complete(self, model_id: uuid.UUID, prompt: str, **kwargs):  # noqa: D401, ANN201
-        raise NotImplementedError
+    async def stream_chat(
+        self, model_id: uuid.UUID, messages: list[Message], **kwargs
+    ) -> AsyncIterator[StreamingChunk]:
+        loaded = self._models.get(str(model_id))
+        if not loaded:
+            raise RuntimeError("Model not loaded")
+        connect_timeout = kwargs.pop("timeout", None) or 30.0
+        payload = {
+            "model": loaded.model_name,
+            "messages": [{"role": m.role, "content": m.content} for m in messages],
+            "stream": True,
+        }
+        payload.update({k: v for k, v in kwargs.items() if v is not None})
+
+        url = f"{self.endpoint}/api/chat"
+        request_id = str(uuid.uuid4())
+        chunk_id = 0
+        client = self._http.async_client(self.endpoint)
+        try:
+            # No read timeout: the gap before the first token includes model load time
+            async with client.stream(
+                "POST",
+                url,
+                json=payload,
+                timeout=httpx.Timeout(connect_timeout, read=None),
+            ) as resp:
+                if resp.is_error:
+                    await resp.aread()
+                resp.raise_for_status()
+                async for line in resp.aiter_lines():
+                    if not line.strip():
+                        continue
+                    data = json.loads(line)
+                    if data.get("error"):
+                        raise RuntimeError(f"Ollama error: {data['error']}")
+                    content = (data.get("message") or {}).get("content") or ""
+                    done = bool(data.get("done"))
+                    if content or done:
+                        yield StreamingChunk(
+                            content=content,
+                            request_id=request_id,
+                            chunk_id=chunk_id,
+                            is_complete=done,
+                            token_count=1 if content else 0,
+                        )
+                        chunk_id += 1
+                    if done:
+                        return
+        except httpx.ConnectError as exc:  # noqa: PERF203
+            raise RuntimeError(
+                f"Ollama is not running at {self.endpoint}. Install from https://ollama.com and run 'ollama serve'."
+            ) from exc
+        except httpx.HTTPStatusError as exc:
+            raise RuntimeError(
+                f"Ollama error: HTTP {exc.response.status_code} - {exc.response.text}"
+            ) from exc
+        # Stream ended without a done marker; still signal completion
+        yield StreamingChunk(
+            content="",
+            request_id=request_id,
+            chunk_id=chunk_id,
+            is_complete=True,
+            token_count=0,
+        )
+
+    async def stream_complete(
+        self, model_id: uuid.UUID, prompt: str, **kwargs
+    ) -> AsyncIterator[str]:
+        async for chunk in self.stream_chat(
+            model_id, [Message(content=prompt, role="user")], **kwargs
+        ):
+            if chunk.content:
+                yield chunk.content
 
     # Model information
     def list_available_models(self) -> list[ModelSpec]:
         url = f"{self.endpoint}/api/tags"
         try:
-            resp = httpx.get(url, timeout=5.0)
+            resp = self._http.sync_client(self.endpoint).get(url, timeout=5.0)
             resp.raise_for_status()
             tags = resp.json().get("models", [])
         except Exception:
@@ -150,7 +236,8 @@ class OllamaModelManager(IModelManager):
     async def get_model_health(self, model_id: uuid.UUID) -> HealthStatus:  # noqa: ARG002
         # Check server availability only
         try:
-            resp = httpx.get(f"{self.endpoint}/api/version", timeout=2.0)
+            client = self._http.async_client(self.endpoint)
+            resp = await client.get(f"{self.endpoint}/api/version", timeout=2.0)
             resp.raise_for_status()
             return HealthStatus(healthy=True, status="healthy")
         except Exception:
@@ -5,6 +5,7 @@ from typing import Any, Tuple
 import os
 
 from l6e_forge.models.managers.base import IModelManager
+from l6e_forge.runtime.http import HttpClientPool
 
 
 def load_endpoints_from_config(
@@ -44,7 +45,9 @@ def load_endpoints_from_config(
 
 
 def get_manager(
-    provider: str, endpoints: dict[str, str] | None = None
+    provider: str,
+    endpoints: dict[str, str] | None = None,
+    http: HttpClientPool | None = None,
 ) -> IModelManager:
     """Construct a model manager for the given provider name using endpoints if provided."""
     p = provider.lower()
@@ -55,7 +58,8 @@ def get_manager(
         return OllamaModelManager(
             endpoint=eps.get(
                 "ollama", os.environ.get("OLLAMA_HOST", "http://localhost:11434")
-            )
+            ),
+            http=http,
         )
     if p == "lmstudio":
         from l6e_forge.models.managers.lmstudio import LMStudioModelManager
@@ -63,6 +67,7 @@ def get_manager(
         return LMStudioModelManager(
             endpoint=eps.get(
                 "lmstudio", os.environ.get("LMSTUDIO_HOST", "http://localhost:1234/v1")
-            )
+            ),
+            http=http,
         )
     raise ValueError(f"Unsupported provider: {provider}")
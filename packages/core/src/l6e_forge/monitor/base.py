@@ -68,18 +68,25 @@ class IMonitoringService(Protocol):
         ...
 
     def get_perf_summary(self) -> dict[str, Any]:
-        """Return a small performance summary (avg, p95, count)."""
+        """Return a small performance summary (avg, p50, p95, p99, count).
+
+        Implementations may add ``windows`` with the same fields per rollup window.
+        """
         ...
 
     def get_perf_by_agent(self) -> dict[str, dict[str, Any]]:
-        """Return performance summary grouped by agent id: {agent_id: {avg_ms,p95_ms,count}}"""
+        """Return performance summary grouped by agent id: {agent_id: {avg_ms,p95_ms,count,...}}"""
         ...
 
     # --- Streaming/subscription API (optional) ---
-    async def subscribe(self):  # -> asyncio.Queue
-        """Subscribe to live updates. May not be supported by remote implementations."""
+    async def subscribe(self):  # -> queue with async get(), e.g. asyncio.Queue
+        """Subscribe to live updates. May not be supported by remote implementations.
+
+        The returned queue should be bounded so a slow consumer cannot grow it
+        without limit.
+        """
         ...
 
-    async def unsubscribe(self, q) -> None:  # q: asyncio.Queue
+    async def unsubscribe(self, q) -> None:  # q: the queue from subscribe()
         """Unsubscribe from live updates. May not be supported by remote implementations."""
         ...
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Optional
+
+from l6e_forge.logging import get_logger
+
+logger = get_logger()
+
+
+class BatchExporter:
+    """Bounded in-process queue drained in batches by a background task.
+
+    ``submit`` never blocks or awaits: items are appended to a deque and a flush
+    task on the running loop sends them ``batch_size`` at a time, at least every
+    ``flush_interval`` seconds. When the queue is full the oldest item is
+    dropped, so a slow or unreachable receiver costs memory up to ``max_queue``
+    items and nothing else. ``send`` returns True when a batch was accepted;
+    failed batches are counted and discarded.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[dict[str, Any]]], Awaitable[bool]],
+        *,
+        max_queue: int = 10_000,
+        batch_size: int = 200,
+        flush_interval: float = 0.25,
+    ) -> None:
+        self._send = send
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._queue: Deque[dict[str, Any]] = deque(maxlen=max(1, max_queue))
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._sent = 0
+        self._failed = 0
+        self._dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def submit(self, item: dict[str, Any]) -> bool:
+        """Queue ``item`` for the next batch.
+
+        Returns False without queueing when no event loop is running in this
+        thread; the caller should then deliver the item itself.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        if len(self._queue) == self._queue.maxlen:
+            self._dropped += 1
+        self._queue.append(item)
+        self._ensure_task(loop)
+        if len(self._queue) >= self.batch_size and self._wake is not None:
+            self._wake.set()
+        return True
+
+    async def flush(self) -> None:
+        """Send everything queued so far."""
+        while self._queue:
+            count = min(self.batch_size, len(self._queue))
+            batch = [self._queue.popleft() for _ in range(count)]
+            try:
+                ok = await self._send(batch)
+            except Exception as e:  # noqa: BLE001
+                logger.debug(f"Monitoring batch export failed: {e}")
+                ok = False
+            if ok:
+                self._sent += len(batch)
+            else:
+                self._failed += len(batch)
+
+    async def aclose(self) -> None:
+        """Stop the flush task and send what is still queued."""
+        task, self._task = self._task, None
+        own_loop = self._loop is asyncio.get_running_loop()
+        if task is not None and not task.done() and own_loop:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        await self.flush()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "queued": len(self._queue),
+            "max_queue": self._queue.maxlen,
+            "sent": self._sent,
+            "failed": self._failed,
+            "dropped": self._dropped,
+        }
+
+    # ---- Internals ----
+    def _ensure_task(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._task is not None and not self._task.done() and self._loop is loop:
+            return
+        self._loop = loop
+        self._wake = asyncio.Event()
+        self._task = loop.create_task(self._run(self._wake))
+
+    async def _run(self, wake: asyncio.Event) -> None:
+        # Exits once a full interval passes with nothing queued; submit restarts it
+        while self._queue:
+            try:
+                await asyncio.wait_for(wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            wake.clear()
+            await self.flush()
@@ -1,20 +1,29 @@
 from __future__ import annotations
 
-import asyncio
 import time
-from collections import deque
-from datetime import datetime
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
 from typing import Any, Deque
 
 from l6e_forge.monitor.base import IMonitoringService
+from l6e_forge.monitor.metrics import MetricsEngine
+from l6e_forge.monitor.series import MetricColumns, TagTable, downsample
+from l6e_forge.monitor.subscription import OverflowPolicy, Subscription
+from l6e_forge.monitor.tracing import new_trace_id
+
+_EMPTY_PERF = {"avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "count": 0}
 
 
 class InMemoryMonitoringService(IMonitoringService):
     """Simple in-memory monitoring store with pub/sub for real-time updates.
 
-    - Stores recent metrics and events in bounded deques to avoid unbounded memory use
-    - Provides an asyncio.Queue-based broadcast channel for subscribers (websocket clients)
+    - Stores recent events in bounded deques to avoid unbounded memory use
+    - Stores recent metric points in bounded, time-ordered numpy columns
+    - Keeps streaming quantile sketches per metric for O(1) summary reads
+    - Broadcasts to subscribers (websocket clients) through bounded per-subscriber
+      queues, so a stalled client loses or coalesces messages instead of growing
     - Tracks lightweight agent status and chat logs
+    - Keeps the spans of the most recent traces for per-request waterfalls
     """
 
     def __init__(
@@ -22,34 +31,51 @@ class InMemoryMonitoringService(IMonitoringService):
         max_events: int = 2000,
         max_metrics_per_name: int = 1000,
         max_chats: int = 2000,
+        metrics: MetricsEngine | None = None,
+        subscriber_queue_size: int = 1000,
+        subscriber_policy: OverflowPolicy = "coalesce",
+        max_traces: int = 500,
+        max_spans_per_trace: int = 500,
     ) -> None:
         self._events: Deque[dict[str, Any]] = deque(maxlen=max_events)
-        self._metric_name_to_points: dict[str, Deque[dict[str, Any]]] = {}
-        self._metric_name_to_points_max: int = max_metrics_per_name
-        self._traces: dict[str, dict[str, Any]] = {}
+        self._metric_series: dict[str, MetricColumns] = {}
+        self._metric_series_max: int = max_metrics_per_name
+        self._metric_tags = TagTable()
+        self._metrics = metrics or MetricsEngine()
+        self._traces: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._max_traces = max_traces
+        self._max_spans_per_trace = max_spans_per_trace
         self._agent_status: dict[str, dict[str, Any]] = {}
         self._chat_logs: Deque[dict[str, Any]] = deque(maxlen=max_chats)
 
-        # Broadcast channel for real-time stream
-        self._subscribers: set[asyncio.Queue] = set()
-        self._lock = asyncio.Lock()
+        # Broadcast channel for real-time stream. The tuple is replaced, never
+        # mutated, so broadcasting iterates a stable snapshot without a lock.
+        self._subscribers: tuple[Subscription, ...] = ()
+        self._subscriber_queue_size = subscriber_queue_size
+        self._subscriber_policy: OverflowPolicy = subscriber_policy
+        # Counters of subscribers that have since unsubscribed
+        self._closed_dropped = 0
+        self._closed_coalesced = 0
 
     # ---- Public API (IMonitoringService) ----
     async def record_metric(
         self, name: str, value: float, tags: dict[str, str] | None = None
     ) -> None:
-        point = {
-            "name": name,
-            "value": value,
-            "tags": tags or {},
-            "timestamp": datetime.now().isoformat(),
-        }
-        if name not in self._metric_name_to_points:
-            self._metric_name_to_points[name] = deque(
-                maxlen=self._metric_name_to_points_max
-            )
-        self._metric_name_to_points[name].append(point)
-        await self._broadcast({"type": "metric", "data": point})
+        now_ns = time.time_ns()
+        tags = tags or {}
+        series = self._metric_series.get(name)
+        if series is None:
+            series = self._metric_series[name] = MetricColumns(self._metric_series_max)
+        series.append(now_ns, value, self._metric_tags.intern(tags))
+        self._metrics.record(name, value, tags, now_ns / 1e9)
+        if self._subscribers:
+            point = {
+                "name": name,
+                "value": value,
+                "tags": tags,
+                "timestamp": _iso(now_ns),
+            }
+            await self._broadcast({"type": "metric", "data": point})
 
     async def record_event(self, name: str, data: dict[str, Any]) -> None:
         evt = {
@@ -63,27 +89,75 @@ class InMemoryMonitoringService(IMonitoringService):
     def get_metrics(
         self, name: str, time_range: tuple[datetime, datetime] | None = None
     ) -> list[dict[str, Any]]:
-        series = list(self._metric_name_to_points.get(name, []))
+        series = self._metric_series.get(name)
+        if series is None:
+            return []
         if time_range is None:
-            return series
-        start, end = time_range
+            ts, values, tag_ids = series.select()
+        else:
+            ts, values, tag_ids = series.select(
+                _epoch_ns(time_range[0]), _epoch_ns(time_range[1])
+            )
+        return [
+            {
+                "name": name,
+                "value": value,
+                "tags": self._metric_tags.tags(tag_id),
+                "timestamp": _iso(t),
+            }
+            for t, value, tag_id in zip(ts.tolist(), values.tolist(), tag_ids.tolist())
+        ]
+
+    def get_metric_series(
+        self,
+        name: str,
+        *,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        buckets: int = 60,
+        step_s: float | None = None,
+        tags: dict[str, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Downsampled points of ``name``: count/min/max/avg per time bucket.
 
-        def _isin(p: dict[str, Any]) -> bool:
-            try:
-                ts = datetime.fromisoformat(str(p.get("timestamp")))
-            except Exception:
-                return False
-            return start <= ts <= end
+        Defaults to the last hour in ``buckets`` equal steps; ``step_s`` sets the
+        bucket width instead. ``tags`` keeps only points with exactly that tag
+        set. Empty buckets are omitted; each bucket is labelled by its start.
+        """
+        series = self._metric_series.get(name)
+        end = end or datetime.now()
+        start = start or end - timedelta(hours=1)
+        start_ns, end_ns = _epoch_ns(start), _epoch_ns(end)
+        if series is None or end_ns < start_ns:
+            return []
+        if step_s:
+            step_ns = int(step_s * 1e9)
+        else:
+            step_ns = (end_ns - start_ns) // max(1, buckets)
+        ts, values, tag_ids = series.select(start_ns, end_ns)
+        if tags is not None:
+            tag_id = self._metric_tags.lookup(tags)
+            if tag_id is None:
+                return []
+            keep = tag_ids == tag_id
+            ts, values = ts[keep], values[keep]
+        out = downsample(ts, values, start_ns, max(1, step_ns))
+        for bucket in out:
+            bucket["timestamp"] = _iso(bucket.pop("ts_ns"))
+        return out
 
-        return [p for p in series if _isin(p)]
+    def get_metric_summary(
+        self, name: str, tags: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """count/avg/min/max/p50/p95/p99 of a metric, all-time and per rollup
+        window (``windows`` -> 1m/5m/1h). ``tags`` selects one exact tag set."""
+        return self._metrics.summary(name, tags)
 
     async def start_trace(self, trace_name: str) -> str:
-        trace_id = f"trace_{int(time.time() * 1000)}"
-        self._traces[trace_id] = {
-            "trace_name": trace_name,
-            "started_at": datetime.now().isoformat(),
-            "steps": [],
-        }
+        # Spans opened with span(..., trace_id=...) are collected under this id
+        trace_id = new_trace_id()
+        trace = self._trace(trace_id)
+        trace["name"] = trace_name
         await self._broadcast(
             {
                 "type": "trace_start",
@@ -95,9 +169,52 @@ class InMemoryMonitoringService(IMonitoringService):
     async def end_trace(self, trace_id: str) -> None:
         trace = self._traces.get(trace_id)
         if trace is not None:
-            trace["ended_at"] = datetime.now().isoformat()
+            trace["ended_ns"] = time.time_ns()
             await self._broadcast({"type": "trace_end", "data": {"trace_id": trace_id}})
 
+    def record_span(self, span: dict[str, Any]) -> None:
+        """Store a finished span (see :mod:`l6e_forge.monitor.tracing`).
+
+        Finishing a root span completes its trace and notifies subscribers.
+        """
+        trace = self._trace(str(span["trace_id"]))
+        if len(trace["spans"]) < self._max_spans_per_trace:
+            trace["spans"].append(span)
+        else:
+            trace["dropped_spans"] += 1
+        if span.get("parent_id") is None:
+            trace["name"] = trace["name"] or span.get("name")
+            trace["ended_ns"] = int(span["start_ns"] + span["duration_ms"] * 1e6)
+            self._publish({"type": "trace", "data": _trace_summary(trace)})
+
+    def get_traces(self, limit: int = 50) -> list[dict[str, Any]]:
+        """Summaries of the most recent traces, newest first."""
+        recent = list(self._traces.values())[-limit:]
+        return [_trace_summary(t) for t in reversed(recent)]
+
+    def get_trace(self, trace_id: str) -> dict[str, Any] | None:
+        """A trace's spans in start order, with offset and depth for a waterfall."""
+        trace = self._traces.get(trace_id)
+        if trace is None:
+            return None
+        out = _trace_summary(trace)
+        spans = sorted(trace["spans"], key=lambda s: s["start_ns"])
+        origin = spans[0]["start_ns"] if spans else 0
+        by_id = {s["span_id"]: s for s in spans}
+
+        def depth(s: dict[str, Any]) -> int:
+            d = 0
+            while s.get("parent_id") in by_id and d < len(spans):
+                s = by_id[s["parent_id"]]
+                d += 1
+            return d
+
+        out["spans"] = [
+            {**s, "offset_ms": (s["start_ns"] - origin) / 1e6, "depth": depth(s)}
+            for s in spans
+        ]
+        return out
+
     # ---- Convenience helpers for UI ----
     def get_recent_events(self, limit: int = 200) -> list[dict[str, Any]]:
         return list(self._events)[-limit:]
@@ -139,60 +256,107 @@ class InMemoryMonitoringService(IMonitoringService):
         return list(self._chat_logs)[-limit:]
 
     def get_perf_summary(self) -> dict[str, Any]:
-        points = list(self._metric_name_to_points.get("response_time_ms", []))
-        values = [float(p.get("value", 0.0)) for p in points]
-        if not values:
-            return {"avg_ms": 0.0, "p95_ms": 0.0, "count": 0}
-        sorted_vals = sorted(values)
-        p95_index = max(0, int(len(sorted_vals) * 0.95) - 1)
-        return {
-            "avg_ms": sum(values) / len(values),
-            "p95_ms": sorted_vals[p95_index],
-            "count": len(values),
-        }
+        return _perf(self._metrics.summary("response_time_ms"))
 
     def get_perf_by_agent(self) -> dict[str, Any]:
-        # Group response_time_ms by agent tag
-        points = list(self._metric_name_to_points.get("response_time_ms", []))
-        buckets: dict[str, list[float]] = {}
-        for p in points:
-            try:
-                tags = p.get("tags") or {}
-                agent_id = str(tags.get("agent") or "unknown")
-                buckets.setdefault(agent_id, []).append(float(p.get("value", 0.0)))
-            except Exception:
-                continue
-        out: dict[str, dict[str, Any]] = {}
-        for agent_id, values in buckets.items():
-            if not values:
-                continue
-            sorted_vals = sorted(values)
-            p95_index = max(0, int(len(sorted_vals) * 0.95) - 1)
-            out[agent_id] = {
-                "avg_ms": sum(values) / len(values),
-                "p95_ms": sorted_vals[p95_index],
-                "count": len(values),
-            }
-        return out
+        # response_time_ms grouped by agent tag
+        groups = self._metrics.group_by("response_time_ms", "agent")
+        return {agent_id: _perf(s) for agent_id, s in groups.items() if s["count"]}
 
     # ---- Subscription management ----
-    async def subscribe(self) -> asyncio.Queue:
-        q: asyncio.Queue = asyncio.Queue()
-        async with self._lock:
-            self._subscribers.add(q)
+    async def subscribe(
+        self, maxsize: int | None = None, policy: OverflowPolicy | None = None
+    ) -> Subscription:
+        q = Subscription(
+            maxsize or self._subscriber_queue_size, policy or self._subscriber_policy
+        )
+        self._subscribers = (*self._subscribers, q)
         return q
 
-    async def unsubscribe(self, q: asyncio.Queue) -> None:
-        async with self._lock:
-            self._subscribers.discard(q)
+    async def unsubscribe(self, q: Subscription) -> None:
+        if q not in self._subscribers:
+            return
+        self._subscribers = tuple(s for s in self._subscribers if s is not q)
+        self._closed_dropped += q.dropped
+        self._closed_coalesced += q.coalesced
+
+    def subscriber_stats(self) -> dict[str, Any]:
+        """Live subscriber queues plus dropped/coalesced totals since start."""
+        subscribers = [q.stats() for q in self._subscribers]
+        return {
+            "subscribers": subscribers,
+            "dropped_total": self._closed_dropped
+            + sum(s["dropped"] for s in subscribers),
+            "coalesced_total": self._closed_coalesced
+            + sum(s["coalesced"] for s in subscribers),
+        }
 
     async def _broadcast(self, message: dict[str, Any]) -> None:
-        # Best effort broadcast; drop if queue is full
-        async with self._lock:
-            subscribers = list(self._subscribers)
-        for q in subscribers:
-            try:
-                q.put_nowait(message)
-            except Exception:
-                # Slow or closed subscriber; ignore
-                pass
+        self._publish(message)
+
+    def _publish(self, message: dict[str, Any]) -> None:
+        # Never blocks: each subscriber applies its own overflow policy
+        for q in self._subscribers:
+            q.put_nowait(message)
+
+    def _trace(self, trace_id: str) -> dict[str, Any]:
+        trace = self._traces.get(trace_id)
+        if trace is None:
+            trace = self._traces[trace_id] = {
+                "trace_id": trace_id,
+                "name": None,
+                "started_ns": time.time_ns(),
+                "ended_ns": None,
+                "spans": [],
+                "dropped_spans": 0,
+            }
+            while len(self._traces) > self._max_traces:
+                self._traces.popitem(last=False)
+        return trace
+
+
+def _trace_summary(trace: dict[str, Any]) -> dict[str, Any]:
+    spans = trace["spans"]
+    started = min((s["start_ns"] for s in spans), default=trace["started_ns"])
+    ended = trace["ended_ns"]
+    if ended is None and spans:
+        ended = max(int(s["start_ns"] + s["duration_ms"] * 1e6) for s in spans)
+    return {
+        "trace_id": trace["trace_id"],
+        "name": trace["name"],
+        "started_at": _iso(started),
+        "duration_ms": (ended - started) / 1e6 if ended is not None else None,
+        "span_count": len(spans),
+        "dropped_spans": trace["dropped_spans"],
+        "status": "error" if any(s.get("status") == "error" for s in spans) else "ok",
+    }
+
+
+def _epoch_ns(when: datetime) -> int:
+    # Naive datetimes are local time, matching datetime.now()
+    return round(when.timestamp() * 1e6) * 1000
+
+
+def _iso(ts_ns: int) -> str:
+    return datetime.fromtimestamp(ts_ns / 1e9).isoformat()
+
+
+def _perf(summary: dict[str, Any]) -> dict[str, Any]:
+    """Millisecond view of a metric summary: all-time figures plus windows."""
+
+    def fields(s: dict[str, Any]) -> dict[str, Any]:
+        if not s["count"]:
+            return dict(_EMPTY_PERF)
+        return {
+            "avg_ms": s["avg"],
+            "p50_ms": s["p50"],
+            "p95_ms": s["p95"],
+            "p99_ms": s["p99"],
+            "count": s["count"],
+        }
+
+    out = fields(summary)
+    out["windows"] = {
+        label: fields(w) for label, w in summary.get("windows", {}).items()
+    }
+    return out
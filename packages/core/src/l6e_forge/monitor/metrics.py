@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Rollup windows: (label, span in seconds, ring slots); the last window shifts
+# once a slot ends, so a "1m" summary covers between 50 and 60 seconds.
+WINDOWS: Tuple[Tuple[str, float, int], ...] = (
+    ("1m", 60.0, 6),
+    ("5m", 300.0, 5),
+    ("1h", 3600.0, 12),
+)
+QUANTILES: Tuple[Tuple[str, float], ...] = (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+
+SeriesKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class DDSketch:
+    """Quantile sketch with relative-error guarantees (DDSketch).
+
+    Positive values fall into logarithmic buckets ``gamma**(i-1) < v <= gamma**i``
+    so any quantile is returned within ``relative_accuracy`` of the true value,
+    independent of how many values were added. Memory grows with the log of the
+    value range (about 1k buckets for 1µs..1h at 1%), never with the count.
+    """
+
+    __slots__ = (
+        "_gamma",
+        "_log_gamma",
+        "bins",
+        "neg_bins",
+        "zeros",
+        "count",
+        "sum",
+        "min",
+        "max",
+    )
+
+    # Values closer to zero than this share one bucket
+    MIN_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: Dict[int, int] = {}
+        self.neg_bins: Dict[int, int] = {}
+        self.zeros = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        if value > self.MIN_VALUE:
+            i = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[i] = self.bins.get(i, 0) + 1
+        elif value < -self.MIN_VALUE:
+            i = math.ceil(math.log(-value) / self._log_gamma)
+            self.neg_bins[i] = self.neg_bins.get(i, 0) + 1
+        else:
+            self.zeros += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "DDSketch") -> None:
+        for i, c in other.bins.items():
+            self.bins[i] = self.bins.get(i, 0) + c
+        for i, c in other.neg_bins.items():
+            self.neg_bins[i] = self.neg_bins.get(i, 0) + c
+        self.zeros += other.zeros
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def clear(self) -> None:
+        self.bins.clear()
+        self.neg_bins.clear()
+        self.zeros = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        """Nearest-rank quantiles: the ``ceil(q * count)``-th smallest value."""
+        qs = list(qs)
+        if self.count == 0:
+            return [0.0 for _ in qs]
+        # Ascending (value, count) buckets: negatives, zero, then positives
+        buckets: List[Tuple[float, int]] = [
+            (-self._value(i), self.neg_bins[i])
+            for i in sorted(self.neg_bins, reverse=True)
+        ]
+        if self.zeros:
+            buckets.append((0.0, self.zeros))
+        buckets.extend((self._value(i), self.bins[i]) for i in sorted(self.bins))
+        out: List[float] = []
+        for q in qs:
+            rank = max(1, math.ceil(q * self.count))
+            seen = 0
+            value = buckets[-1][0]
+            for v, c in buckets:
+                seen += c
+                if seen >= rank:
+                    value = v
+                    break
+            out.append(min(max(value, self.min), self.max))
+        return out
+
+    def quantile(self, q: float) -> float:
+        return self.quantiles((q,))[0]
+
+    def _value(self, i: int) -> float:
+        # Midpoint (in relative terms) of bucket i's range
+        return 2.0 * self._gamma**i / (self._gamma + 1.0)
+
+
+class RollingSketch:
+    """Sketch of the last ``span_s`` seconds, kept as a ring of time slots.
+
+    Each slot covers ``span_s / slots`` seconds of wall time and is reset when
+    the ring wraps onto it, so old values age out without per-point bookkeeping.
+    """
+
+    __slots__ = ("span_s", "width", "_slots", "_epochs", "_accuracy")
+
+    def __init__(self, span_s: float, slots: int, relative_accuracy: float) -> None:
+        self.span_s = span_s
+        self.width = span_s / slots
+        self._accuracy = relative_accuracy
+        self._slots: List[Optional[DDSketch]] = [None] * slots
+        self._epochs = [-1] * slots
+
+    def add(self, value: float, now: float) -> None:
+        epoch = int(now // self.width)
+        pos = epoch % len(self._slots)
+        slot = self._slots[pos]
+        if slot is None:
+            slot = self._slots[pos] = DDSketch(self._accuracy)
+        elif self._epochs[pos] != epoch:
+            slot.clear()
+        self._epochs[pos] = epoch
+        slot.add(value)
+
+    def snapshot(self, now: float) -> DDSketch:
+        epoch = int(now // self.width)
+        oldest = epoch - len(self._slots)
+        merged = DDSketch(self._accuracy)
+        for slot, slot_epoch in zip(self._slots, self._epochs):
+            if slot is not None and oldest < slot_epoch <= epoch:
+                merged.merge(slot)
+        return merged
+
+
+def summarize(sketch: DDSketch) -> Dict[str, Any]:
+    if sketch.count == 0:
+        out: Dict[str, Any] = {"count": 0, "avg": 0.0, "min": 0.0, "max": 0.0}
+        out.update({label: 0.0 for label, _q in QUANTILES})
+        return out
+    values = sketch.quantiles(q for _label, q in QUANTILES)
+    out = {
+        "count": sketch.count,
+        "avg": sketch.sum / sketch.count,
+        "min": sketch.min,
+        "max": sketch.max,
+    }
+    out.update({label: v for (label, _q), v in zip(QUANTILES, values)})
+    return out
+
+
+class MetricSeries:
+    """All-time sketch plus rolling windows for one (metric, tag set)."""
+
+    __slots__ = ("total", "windows", "version", "_cache")
+
+    def __init__(self, relative_accuracy: float) -> None:
+        self.total = DDSketch(relative_accuracy)
+        self.windows = {
+            label: RollingSketch(span, slots, relative_accuracy)
+            for label, span, slots in WINDOWS
+        }
+        self.version = 0
+        self._cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
+    def add(self, value: float, now: float) -> None:
+        self.total.add(value)
+        for window in self.windows.values():
+            window.add(value, now)
+        self.version += 1
+
+    def summary(self, now: float) -> Dict[str, Any]:
+        # Windows only move when a slot boundary of the finest window passes
+        finest = min(w.width for w in self.windows.values())
+        key = (self.version, int(now // finest))
+        if self._cache is not None and self._cache[0] == key:
+            return self._cache[1]
+        out = summarize(self.total)
+        out["windows"] = {
+            label: summarize(w.snapshot(now)) for label, w in self.windows.items()
+        }
+        self._cache = (key, out)
+        return out
+
+
+class MetricsEngine:
+    """Incremental per-(metric, tag set) statistics for the monitoring service.
+
+    Recording touches a fixed number of sketch buckets; summaries are computed
+    from the sketches and cached until new values arrive, so reads cost the same
+    for ten points or ten million. Every metric also feeds an untagged series
+    used for whole-metric summaries. The least recently updated tagged series
+    are dropped beyond ``max_series``.
+    """
+
+    def __init__(
+        self,
+        *,
+        relative_accuracy: float = 0.01,
+        max_series: int = 1000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.max_series = max_series
+        self._clock = clock
+        self._series: "OrderedDict[SeriesKey, MetricSeries]" = OrderedDict()
+
+    @staticmethod
+    def series_key(name: str, tags: Optional[Dict[str, str]] = None) -> SeriesKey:
+        return name, tuple(sorted((str(k), str(v)) for k, v in (tags or {}).items()))
+
+    def record(
+        self,
+        name: str,
+        value: float,
+        tags: Optional[Dict[str, str]] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        now = self._clock() if now is None else now
+        self._get_or_create((name, ())).add(value, now)
+        if tags:
+            self._get_or_create(self.series_key(name, tags)).add(value, now)
+
+    def summary(
+        self, name: str, tags: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        series = self._series.get(self.series_key(name, tags))
+        if series is None:
+            return MetricSeries(self.relative_accuracy).summary(self._clock())
+        return series.summary(self._clock())
+
+    def group_by(self, name: str, tag: str) -> Dict[str, Dict[str, Any]]:
+        """Summaries of ``name`` per value of ``tag`` (missing tag -> "unknown")."""
+        now = self._clock()
+        groups: Dict[str, List[MetricSeries]] = {}
+        for (series_name, tags), series in self._series.items():
+            if series_name != name or not tags:
+                continue
+            value = dict(tags).get(tag, "unknown")
+            groups.setdefault(value, []).append(series)
+        out: Dict[str, Dict[str, Any]] = {}
+        for value, members in groups.items():
+            if len(members) == 1:
+                out[value] = members[0].summary(now)
+                continue
+            merged = MetricSeries(self.relative_accuracy)
+            for series in members:
+                merged.total.merge(series.total)
+            summary = summarize(merged.total)
+            summary["windows"] = {
+                label: summarize(
+                    _merge(m.windows[label].snapshot(now) for m in members)
+                )
+                for label, _span, _slots in WINDOWS
+            }
+            out[value] = summary
+        return out
+
+    def names(self) -> List[str]:
+        return sorted({name for name, _tags in self._series})
+
+    def _get_or_create(self, key: SeriesKey) -> MetricSeries:
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = MetricSeries(self.relative_accuracy)
+            if len(self._series) > self.max_series:
+                self._evict()
+        else:
+            self._series.move_to_end(key)
+        return series
+
+    def _evict(self) -> None:
+        # Untagged per-metric series are kept; they back the headline summaries
+        for key in list(self._series):
+            if len(self._series) <= self.max_series:
+                break
+            if key[1]:
+                del self._series[key]
+
+
+def _merge(sketches: Iterable[DDSketch]) -> DDSketch:
+    merged: Optional[DDSketch] = None
+    for sketch in sketches:
+        if merged is None:
+            merged = sketch
+        else:
+            merged.merge(sketch)
+    return merged if merged is not None else DDSketch()
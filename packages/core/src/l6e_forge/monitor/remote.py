@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from typing import Any, Optional, List
 
-import httpx
-
 from l6e_forge.monitor.base import IMonitoringService
+from l6e_forge.monitor.exporter import BatchExporter
+from l6e_forge.runtime.http import HttpClientPool, get_http_pool
 
 
 class RemoteMonitoringService(IMonitoringService):
@@ -12,22 +12,41 @@ class RemoteMonitoringService(IMonitoringService):
 
     The server is expected to be an instance of the l6e forge monitor app
     exposing the ingestion endpoints under /ingest/*.
+
+    Writes are queued on a :class:`BatchExporter` and posted to /ingest/batch
+    from a background task, so callers never wait on the monitor. Sync helpers
+    called outside an event loop (e.g. during shutdown) still post directly.
     """
 
-    def __init__(self, base_url: str, timeout_seconds: float = 5.0) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        timeout_seconds: float = 5.0,
+        http: HttpClientPool | None = None,
+        *,
+        max_queue: int = 10_000,
+        batch_size: int = 200,
+        flush_interval: float = 0.25,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout_seconds = timeout_seconds
+        self._http = http or get_http_pool()
+        self._exporter = BatchExporter(
+            self._send_batch,
+            max_queue=max_queue,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+        )
 
     # --- IMonitoringService methods ---
     async def record_metric(
         self, name: str, value: float, tags: dict[str, str] | None = None
     ) -> None:
-        await self._post(
-            "/ingest/metric", {"name": name, "value": value, "tags": tags or {}}
-        )
+        payload = {"name": name, "value": value, "tags": tags or {}}
+        self._enqueue("metric", "/ingest/metric", payload)
 
     async def record_event(self, name: str, data: dict[str, Any]) -> None:
-        await self._post("/ingest/event", {"name": name, "data": data})
+        self._enqueue("event", "/ingest/event", {"name": name, "data": data})
 
     def get_metrics(
         self, name: str, time_range: tuple[Any, Any] | None = None
@@ -43,7 +62,10 @@ class RemoteMonitoringService(IMonitoringService):
             return ""
 
     async def end_trace(self, trace_id: str) -> None:
-        await self._post("/ingest/trace/end", {"trace_id": trace_id})
+        self._enqueue("trace_end", "/ingest/trace/end", {"trace_id": trace_id})
+
+    def record_span(self, span: dict[str, Any]) -> None:
+        self._enqueue("span", "/ingest/span", span)
 
     # --- Extended helpers used by LocalRuntime ---
     def set_agent_status(
@@ -53,8 +75,8 @@ class RemoteMonitoringService(IMonitoringService):
         status: str,
         config: dict[str, Any] | None = None,
     ) -> None:  # noqa: D401
-        # Execute synchronously to ensure registration updates land even if event loop ends
-        self._post_sync(
+        self._enqueue(
+            "agent_status",
             "/ingest/agent/status",
             {
                 "agent_id": agent_id,
@@ -65,12 +87,13 @@ class RemoteMonitoringService(IMonitoringService):
         )
 
     def remove_agent(self, agent_id: str) -> None:  # noqa: D401
-        self._post_sync("/ingest/agent/remove", {"agent_id": agent_id})
+        self._enqueue("agent_remove", "/ingest/agent/remove", {"agent_id": agent_id})
 
     def add_chat_log(
         self, conversation_id: str, role: str, content: str, agent_id: str | None = None
     ) -> None:  # noqa: D401
-        self._post_sync(
+        self._enqueue(
+            "chat",
             "/ingest/chat",
             {
                 "conversation_id": str(conversation_id),
@@ -82,66 +105,38 @@ class RemoteMonitoringService(IMonitoringService):
 
     # --- Read helpers ---
     def get_recent_events(self, limit: int = 200) -> List[dict[str, Any]]:
-        try:
-            with httpx.Client(timeout=self.timeout_seconds) as client:
-                r = client.get(f"{self.base_url}/api/events?limit={limit}")
-                r.raise_for_status()
-                if r.headers.get("content-type", "").startswith("application/json"):
-                    data = r.json()
-                    # The monitor returns a JSON array; pass through
-                    return data if isinstance(data, list) else []
-        except Exception:
-            return []
-        return []
+        data = self._get_sync(f"/api/events?limit={limit}")
+        # The monitor returns a JSON array; pass through
+        return data if isinstance(data, list) else []
 
     def get_agent_status(self) -> List[dict[str, Any]]:
-        try:
-            with httpx.Client(timeout=self.timeout_seconds) as client:
-                r = client.get(f"{self.base_url}/api/agents")
-                r.raise_for_status()
-                if r.headers.get("content-type", "").startswith("application/json"):
-                    data = r.json()
-                    # The monitor returns a JSON array for agents
-                    return data if isinstance(data, list) else data.get("agents", [])
-        except Exception:
-            return []
-        return []
+        data = self._get_sync("/api/agents")
+        # The monitor returns a JSON array for agents
+        if isinstance(data, dict):
+            return data.get("agents", [])
+        return data if isinstance(data, list) else []
 
     def get_chat_logs(self, limit: int = 200) -> List[dict[str, Any]]:
-        try:
-            with httpx.Client(timeout=self.timeout_seconds) as client:
-                r = client.get(f"{self.base_url}/api/chats?limit={limit}")
-                r.raise_for_status()
-                if r.headers.get("content-type", "").startswith("application/json"):
-                    data = r.json()
-                    return data if isinstance(data, list) else []
-        except Exception:
-            return []
-        return []
+        data = self._get_sync(f"/api/chats?limit={limit}")
+        return data if isinstance(data, list) else []
 
     def get_perf_summary(self) -> dict[str, Any]:
-        try:
-            with httpx.Client(timeout=self.timeout_seconds) as client:
-                r = client.get(f"{self.base_url}/api/perf")
-                r.raise_for_status()
-                if r.headers.get("content-type", "").startswith("application/json"):
-                    data = r.json()
-                    return data if isinstance(data, dict) else {}
-        except Exception:
+        data = self._get_sync("/api/perf")
+        if data is None:
             return {"avg_ms": 0.0, "p95_ms": 0.0, "count": 0}
-        return {"avg_ms": 0.0, "p95_ms": 0.0, "count": 0}
+        return data if isinstance(data, dict) else {}
 
     def get_perf_by_agent(self) -> dict[str, Any]:
-        try:
-            with httpx.Client(timeout=self.timeout_seconds) as client:
-                r = client.get(f"{self.base_url}/api/perf/by-agent")
-                r.raise_for_status()
-                if r.headers.get("content-type", "").startswith("application/json"):
-                    data = r.json()
-                    return data if isinstance(data, dict) else {}
-        except Exception:
-            return {}
-        return {}
+        data = self._get_sync("/api/perf/by-agent")
+        return data if isinstance(data, dict) else {}
+
+    def get_traces(self, limit: int = 50) -> List[dict[str, Any]]:
+        data = self._get_sync(f"/api/traces?limit={limit}")
+        return data if isinstance(data, list) else []
+
+    def get_trace(self, trace_id: str) -> Optional[dict[str, Any]]:
+        data = self._get_sync(f"/api/traces/{trace_id}")
+        return data if isinstance(data, dict) and data.get("trace_id") else None
 
     async def subscribe(self):  # pragma: no cover - not supported for remote
         raise NotImplementedError("subscribe not supported for RemoteMonitoringService")
@@ -151,16 +146,46 @@ class RemoteMonitoringService(IMonitoringService):
     ) -> None:  # pragma: no cover - not supported for remote
         return None
 
+    # --- Export pipeline ---
+    async def flush(self) -> None:
+        """Send every queued monitoring write now."""
+        await self._exporter.flush()
+
+    async def aclose(self) -> None:
+        """Stop the background exporter after sending what is queued."""
+        await self._exporter.aclose()
+
+    def exporter_stats(self) -> dict[str, Any]:
+        return self._exporter.stats()
+
+    def _enqueue(self, kind: str, path: str, payload: dict[str, Any]) -> None:
+        if not self._exporter.submit({"kind": kind, **payload}):
+            # No running loop (e.g. interpreter shutdown): deliver synchronously
+            # so registration updates still land
+            self._post_sync(path, payload)
+
+    async def _send_batch(self, items: list[dict[str, Any]]) -> bool:
+        url = f"{self.base_url}/ingest/batch"
+        try:
+            client = self._http.async_client(self.base_url)
+            r = await client.post(
+                url, json={"items": items}, timeout=self.timeout_seconds
+            )
+            r.raise_for_status()
+            return True
+        except Exception:
+            return False
+
     # --- HTTP helper ---
     async def _post(self, path: str, json: dict[str, Any]) -> Optional[dict[str, Any]]:
         url = f"{self.base_url}{path}"
         try:
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                r = await client.post(url, json=json)
-                r.raise_for_status()
-                if r.headers.get("content-type", "").startswith("application/json"):
-                    return r.json()
-                return None
+            client = self._http.async_client(self.base_url)
+            r = await client.post(url, json=json, timeout=self.timeout_seconds)
+            r.raise_for_status()
+            if r.headers.get("content-type", "").startswith("application/json"):
+                return r.json()
+            return None
         except Exception:
             # Best-effort: swallow errors in MVP
             return None
@@ -168,11 +193,24 @@ class RemoteMonitoringService(IMonitoringService):
     def _post_sync(self, path: str, json: dict[str, Any]) -> Optional[dict[str, Any]]:
         url = f"{self.base_url}{path}"
         try:
-            with httpx.Client(timeout=self.timeout_seconds) as client:
-                r = client.post(url, json=json)
-                r.raise_for_status()
-                if r.headers.get("content-type", "").startswith("application/json"):
-                    return r.json()
-                return None
+            client = self._http.sync_client(self.base_url)
+            r = client.post(url, json=json, timeout=self.timeout_seconds)
+            r.raise_for_status()
+            if r.headers.get("content-type", "").startswith("application/json"):
+                return r.json()
+            return None
         except Exception:
             return None
+
+    def _get_sync(self, path: str) -> Any:
+        """GET a JSON document from the monitor; returns None on any failure."""
+        url = f"{self.base_url}{path}"
+        try:
+            client = self._http.sync_client(self.base_url)
+            r = client.get(url, timeout=self.timeout_seconds)
+            r.raise_for_status()
+            if r.headers.get("content-type", "").startswith("application/json"):
+                return r.json()
+        except Exception:
+            return None
+        return None
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+TagKey = Tuple[Tuple[str, str], ...]
+
+
+class TagTable:
+    """Interns tag dicts so each stored point only carries a small integer id."""
+
+    def __init__(self) -> None:
+        self._ids: Dict[TagKey, int] = {}
+        self._tags: List[Dict[str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    @staticmethod
+    def key(tags: Optional[Dict[str, str]]) -> TagKey:
+        return tuple(sorted((str(k), str(v)) for k, v in (tags or {}).items()))
+
+    def intern(self, tags: Optional[Dict[str, str]]) -> int:
+        key = self.key(tags)
+        tag_id = self._ids.get(key)
+        if tag_id is None:
+            tag_id = self._ids[key] = len(self._tags)
+            self._tags.append(dict(key))
+        return tag_id
+
+    def lookup(self, tags: Optional[Dict[str, str]]) -> Optional[int]:
+        """Id of an already seen tag set, without interning it."""
+        return self._ids.get(self.key(tags))
+
+    def tags(self, tag_id: int) -> Dict[str, str]:
+        return self._tags[tag_id]
+
+
+class MetricColumns:
+    """The last ``capacity`` points of one metric as parallel numpy columns.
+
+    Points are int64 epoch-nanosecond timestamps, float64 values and int32 tag
+    ids (20 bytes each). Columns grow up to ``capacity`` plus a quarter of
+    headroom; once that fills, the newest ``capacity`` points slide back to the
+    front, so appends stay amortized O(1) and the retained points are always
+    one contiguous, time-ordered slice that range queries binary-search.
+    """
+
+    _INITIAL = 64
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(1, capacity)
+        self._limit = self.capacity + max(1, self.capacity // 4)
+        size = min(self._INITIAL, self._limit)
+        self._ts = np.empty(size, dtype=np.int64)
+        self._values = np.empty(size, dtype=np.float64)
+        self._tag_ids = np.empty(size, dtype=np.int32)
+        self._end = 0
+
+    def __len__(self) -> int:
+        return min(self._end, self.capacity)
+
+    @property
+    def nbytes(self) -> int:
+        return self._ts.nbytes + self._values.nbytes + self._tag_ids.nbytes
+
+    def append(self, ts_ns: int, value: float, tag_id: int) -> None:
+        if self._end == self._ts.shape[0]:
+            if self._end < self._limit:
+                self._resize(min(2 * self._end, self._limit))
+            else:
+                keep = slice(self._end - self.capacity, self._end)
+                for col in (self._ts, self._values, self._tag_ids):
+                    col[: self.capacity] = col[keep]
+                self._end = self.capacity
+        if self._end and ts_ns < self._ts[self._end - 1]:
+            # Keep the column sorted if the wall clock steps backwards
+            ts_ns = int(self._ts[self._end - 1])
+        self._ts[self._end] = ts_ns
+        self._values[self._end] = value
+        self._tag_ids[self._end] = tag_id
+        self._end += 1
+
+    def _resize(self, size: int) -> None:
+        for attr in ("_ts", "_values", "_tag_ids"):
+            old = getattr(self, attr)
+            new = np.empty(size, dtype=old.dtype)
+            new[: self._end] = old[: self._end]
+            setattr(self, attr, new)
+
+    def select(
+        self, start_ns: Optional[int] = None, end_ns: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(timestamps, values, tag ids) with ``start_ns <= ts <= end_ns``.
+
+        The arrays are views, valid until the next :meth:`append`.
+        """
+        lo = max(0, self._end - self.capacity)
+        hi = self._end
+        ts = self._ts[lo:hi]
+        a = 0 if start_ns is None else int(np.searchsorted(ts, start_ns, "left"))
+        b = len(ts) if end_ns is None else int(np.searchsorted(ts, end_ns, "right"))
+        return ts[a:b], self._values[lo + a : lo + b], self._tag_ids[lo + a : lo + b]
+
+
+def downsample(
+    ts: np.ndarray, values: np.ndarray, start_ns: int, step_ns: int
+) -> List[Dict[str, Any]]:
+    """min/max/avg/count of time-sorted points per ``step_ns`` bucket.
+
+    Buckets are aligned to ``start_ns``; empty buckets are omitted. Each bucket
+    reports its start as ``ts_ns``.
+    """
+    if ts.size == 0:
+        return []
+    bucket = (ts - start_ns) // step_ns
+    # Sorted input: bucket ids only increase, so runs mark bucket boundaries
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(bucket)) + 1))
+    counts = np.diff(np.concatenate((starts, [ts.size])))
+    mins = np.minimum.reduceat(values, starts)
+    maxs = np.maximum.reduceat(values, starts)
+    sums = np.add.reduceat(values, starts)
+    return [
+        {
+            "ts_ns": int(start_ns + b * step_ns),
+            "count": int(c),
+            "min": float(lo),
+            "max": float(hi),
+            "avg": float(s / c),
+        }
+        for b, c, lo, hi, s in zip(
+            bucket[starts].tolist(),
+            counts.tolist(),
+            mins.tolist(),
+            maxs.tolist(),
+            sums.tolist(),
+        )
+    ]
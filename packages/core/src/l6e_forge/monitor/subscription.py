@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, Deque, Hashable, Literal
+
+OverflowPolicy = Literal["coalesce", "drop_oldest", "drop_newest"]
+POLICIES: tuple[str, ...] = ("coalesce", "drop_oldest", "drop_newest")
+
+
+class Subscription:
+    """Bounded, single-consumer message queue for one live-stream subscriber.
+
+    ``put_nowait`` never blocks or raises on a full queue. What happens to a
+    message that does not fit depends on ``policy``:
+
+    - ``coalesce``: a metric replaces the newest still-queued metric with the
+      same name and tags (only the latest snapshot per series is delivered);
+      anything else drops the oldest queued message
+    - ``drop_oldest``: the oldest queued message is discarded
+    - ``drop_newest``: the incoming message is discarded
+
+    ``get`` mirrors :meth:`asyncio.Queue.get` so consumers can use either.
+    """
+
+    def __init__(
+        self, maxsize: int = 1000, policy: OverflowPolicy = "coalesce"
+    ) -> None:
+        if policy not in POLICIES:
+            raise ValueError(
+                f"Unknown subscriber policy '{policy}' (expected one of {POLICIES})"
+            )
+        self.maxsize = max(1, maxsize)
+        self.policy = policy
+        # Entries are one-item lists so a coalesced metric can be swapped in place
+        self._items: Deque[list[dict[str, Any]]] = deque()
+        # Series key -> its newest queued entry, the one a full queue coalesces into
+        self._pending_metrics: dict[Hashable, list[dict[str, Any]]] = {}
+        self._ready = asyncio.Event()
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def put_nowait(self, message: dict[str, Any]) -> None:
+        metric = self._metric_key(message)
+        if len(self._items) >= self.maxsize:
+            entry = self._pending_metrics.get(metric) if metric is not None else None
+            if entry is not None:
+                entry[0] = message
+                self.coalesced += 1
+                return
+            if self.policy == "drop_newest":
+                self.dropped += 1
+                return
+            self._discard(self._items.popleft())
+            self.dropped += 1
+        entry = [message]
+        self._items.append(entry)
+        if metric is not None:
+            self._pending_metrics[metric] = entry
+        self._ready.set()
+
+    def get_nowait(self) -> dict[str, Any]:
+        if not self._items:
+            raise asyncio.QueueEmpty
+        entry = self._items.popleft()
+        self._discard(entry)
+        self.delivered += 1
+        return entry[0]
+
+    async def get(self) -> dict[str, Any]:
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+        return self.get_nowait()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "policy": self.policy,
+            "maxsize": self.maxsize,
+            "queued": len(self._items),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
+
+    # ---- Internals ----
+    def _metric_key(self, message: dict[str, Any]) -> Hashable | None:
+        if self.policy != "coalesce" or message.get("type") != "metric":
+            return None
+        data = message.get("data")
+        if not isinstance(data, dict):
+            return None
+        tags = data.get("tags") or {}
+        return (
+            str(data.get("name")),
+            tuple(sorted((str(k), str(v)) for k, v in tags.items())),
+        )
+
+    def _discard(self, entry: list[dict[str, Any]]) -> None:
+        metric = self._metric_key(entry[0])
+        if metric is not None and self._pending_metrics.get(metric) is entry:
+            del self._pending_metrics[metric]
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import functools
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterator,
+    Optional,
+    ParamSpec,
+    TypeVar,
+)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar(
+    "l6e_forge_current_span", default=None
+)
+_exporter: Optional[Callable[[Dict[str, Any]], None]] = None
+
+
+@dataclass
+class Span:
+    """One timed operation within a trace.
+
+    Spans opened while another span is current become its children and share
+    its ``trace_id``; a span opened with no current span starts a new trace.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_ns: int = field(default_factory=time.time_ns)
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    duration_ns: Optional[int] = None
+    status: str = "ok"
+    error: Optional[str] = None
+    _t0: int = field(default_factory=time.perf_counter_ns, repr=False)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        if self.duration_ns is None:
+            self.duration_ns = time.perf_counter_ns() - self._t0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "duration_ms": (self.duration_ns or 0) / 1e6,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+def new_trace_id() -> str:
+    return uuid.uuid4().hex
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def set_span_attributes(**attributes: Any) -> None:
+    """Attach attributes to the current span, if any."""
+    sp = _current_span.get()
+    if sp is not None:
+        sp.attributes.update(attributes)
+
+
+def set_span_exporter(exporter: Optional[Callable[[Dict[str, Any]], None]]) -> None:
+    """Send finished spans to ``exporter`` instead of the monitoring service."""
+    global _exporter
+    _exporter = exporter
+
+
+@contextmanager
+def span(
+    name: str, *, trace_id: Optional[str] = None, **attributes: Any
+) -> Iterator[Span]:
+    """Time the enclosed block as a span nested under the current one.
+
+    Works in sync and async code alike: the current span lives in a context
+    variable, so concurrent tasks each see their own. Exceptions mark the span
+    as failed and propagate. ``trace_id`` joins a trace started elsewhere.
+    """
+    parent = _current_span.get()
+    if parent is not None and trace_id in (None, parent.trace_id):
+        trace_id, parent_id = parent.trace_id, parent.span_id
+    else:
+        trace_id, parent_id = trace_id or new_trace_id(), None
+    sp = Span(
+        name=name,
+        trace_id=trace_id,
+        span_id=os.urandom(8).hex(),
+        parent_id=parent_id,
+        attributes=attributes,
+    )
+    token = _current_span.set(sp)
+    try:
+        yield sp
+    except BaseException as e:
+        sp.status = "error"
+        sp.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        sp.end()
+        try:
+            _current_span.reset(token)
+        except ValueError:
+            # Closed from another context (e.g. an abandoned async generator)
+            pass
+        _export(sp)
+
+
+def traced(
+    name: str,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Coroutine[Any, Any, R]]]:
+    """Decorator running a coroutine function inside :func:`span`."""
+
+    def decorate(fn: Callable[P, Awaitable[R]]) -> Callable[P, Coroutine[Any, Any, R]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with span(name):
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def _export(sp: Span) -> None:
+    try:
+        exporter = _exporter
+        if exporter is None:
+            # Imported lazily: the runtime package imports monitor modules
+            from l6e_forge.runtime.monitoring import get_monitoring
+
+            exporter = getattr(get_monitoring(), "record_span", None)
+            if not callable(exporter):
+                return
+        exporter(sp.to_dict())
+    except Exception:
+        # Tracing is best-effort and must never break the traced operation
+        pass
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Callable, Protocol, TYPE_CHECKING
+from typing import AsyncIterator, Callable, Protocol, TYPE_CHECKING
 
 from l6e_forge.events.bus.base import IEventBus
 from l6e_forge.memory.managers.base import IMemoryManager
@@ -10,6 +10,7 @@ from l6e_forge.models.managers.base import IModelManager
 
 from l6e_forge.types.agent import AgentSpec
 from l6e_forge.types.core import AgentID, AgentResponse, Message
+from l6e_forge.types.model import StreamingChunk
 
 if TYPE_CHECKING:
     from l6e_forge.core.agents.base import IAgent
@@ -46,10 +47,22 @@ class IRuntime(Protocol):
         """Route a message to appropriate agent(s)"""
         ...
 
+    def route_message_stream(
+        self, message: Message, target: AgentID | None = None
+    ) -> AsyncIterator[StreamingChunk]:
+        """Route a message and stream the reply; the last chunk is marked complete"""
+        ...
+
     async def broadcast_message(
-        self, message: Message, filter_fn: Callable | None = None
+        self,
+        message: Message,
+        filter_fn: Callable | None = None,
+        *,
+        timeout: float | None = None,
+        first_n: int | None = None,
+        first_successful: bool = False,
     ) -> list[AgentResponse]:
-        """Broadcast message to multiple agents"""
+        """Broadcast message to multiple agents concurrently; returns whoever answered"""
         ...
 
     # Resource management
@@ -77,3 +90,12 @@ class IRuntime(Protocol):
     async def enable_hot_reload(self, watch_paths: list[Path]) -> None:
         """Enable hot reloading for specified paths"""
         ...
+
+    # Lifecycle
+    async def start(self) -> None:
+        """Start background work; must return without waiting on network I/O"""
+        ...
+
+    async def shutdown(self) -> None:
+        """Release runtime-owned resources (pooled connections, stores)"""
+        ...
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+class HttpClientPool:
+    """Shared, lifecycle-managed httpx clients keyed by origin (scheme://host:port).
+
+    - One keep-alive connection pool per origin, so connection limits apply per host
+    - HTTP/2 is optional: ``h2`` is not a dependency of this package, so a default
+      install speaks HTTP/1.1. Install ``httpx[http2]`` (or pass ``http2=True``
+      with ``h2`` available) to negotiate HTTP/2
+    - Async clients are bound to the event loop that created them; if a different
+      loop asks for a client (e.g. a new loop per test), fresh clients are built
+    - ``aclose()`` releases every pooled connection; the pool can be reused after
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections_per_host: int = 20,
+        max_keepalive_per_host: int = 10,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 30.0,
+        http2: bool | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        sync_transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_keepalive_per_host,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._timeout = timeout
+        self._http2 = (
+            importlib.util.find_spec("h2") is not None if http2 is None else http2
+        )
+        # Custom transports replace the network; one implementing both interfaces
+        # (e.g. httpx.MockTransport) also serves the blocking clients
+        self._transport = transport
+        if sync_transport is None and isinstance(transport, httpx.BaseTransport):
+            sync_transport = transport
+        self._sync_transport = sync_transport
+        self._async_clients: dict[str, httpx.AsyncClient] = {}
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sync_clients: dict[str, httpx.Client] = {}
+
+    def async_client(self, base_url: str) -> httpx.AsyncClient:
+        """Return the pooled AsyncClient for the origin of ``base_url``."""
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            # Clients from a previous (possibly closed) loop cannot be reused
+            self._async_clients = {}
+            self._async_loop = loop
+        origin = _origin(base_url)
+        client = self._async_clients.get(origin)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=self._limits,
+                timeout=self._timeout,
+                http2=self._http2,
+                transport=self._transport,
+            )
+            self._async_clients[origin] = client
+        return client
+
+    def sync_client(self, base_url: str) -> httpx.Client:
+        """Return the pooled blocking Client for the origin of ``base_url``."""
+        origin = _origin(base_url)
+        client = self._sync_clients.get(origin)
+        if client is None or client.is_closed:
+            client = httpx.Client(
+                limits=self._limits,
+                timeout=self._timeout,
+                http2=self._http2,
+                transport=self._sync_transport,
+            )
+            self._sync_clients[origin] = client
+        return client
+
+    def close(self) -> None:
+        """Close pooled blocking clients."""
+        clients, self._sync_clients = self._sync_clients, {}
+        for client in clients.values():
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    async def aclose(self) -> None:
+        """Close every pooled client owned by the running loop and all blocking clients."""
+        clients, self._async_clients = self._async_clients, {}
+        owner, self._async_loop = self._async_loop, None
+        if owner is asyncio.get_running_loop():
+            for client in clients.values():
+                try:
+                    await client.aclose()
+                except Exception:
+                    pass
+        self.close()
+
+
+_http_pool_singleton: Optional[HttpClientPool] = None
+
+
+def get_http_pool() -> HttpClientPool:
+    global _http_pool_singleton
+    if _http_pool_singleton is None:
+        _http_pool_singleton = HttpClientPool()
+    return _http_pool_singleton
+
+
+def set_http_pool(pool: HttpClientPool) -> None:
+    global _http_pool_singleton
+    _http_pool_singleton = pool
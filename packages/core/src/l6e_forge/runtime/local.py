@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 from pathlib import Path
+import asyncio
 import importlib.util
 import sys
 import uuid
-from typing import Callable, Any
+from typing import AsyncIterator, Callable, Any
 import os
 
 from l6e_forge.types.core import AgentID, AgentResponse, Message, ConversationID
 from l6e_forge.types.agent import AgentSpec
+from l6e_forge.types.model import StreamingChunk
 from l6e_forge.runtime.monitoring import get_monitoring
+from l6e_forge.monitor.tracing import set_span_attributes, span, traced
+from l6e_forge.runtime.http import HttpClientPool, get_http_pool
+from l6e_forge.runtime.scheduler import AgentScheduler
 from l6e_forge.logging import get_logger
 
 # Type-only import to avoid circulars
@@ -20,6 +25,9 @@ if TYPE_CHECKING:  # pragma: no cover
 
 logger = get_logger()
 
+# Messages of recent history attached to each AgentContext
+HISTORY_WINDOW = 50
+
 
 class LocalRuntime:
     """Minimal local runtime for MVP.
@@ -33,7 +41,9 @@ class LocalRuntime:
     Unimplemented (stubs only): event bus, memory manager, model manager, tool registry.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, http: HttpClientPool | None = None) -> None:
+        # Shared pooled HTTP clients used by model managers, embedders and stores
+        self._http = http or get_http_pool()
         self._id_to_agent: dict[AgentID, "IAgent"] = {}
         self._id_to_name: dict[AgentID, str] = {}
         self._name_to_id: dict[str, AgentID] = {}
@@ -42,6 +52,10 @@ class LocalRuntime:
         self._agent_configs: dict[AgentID, dict[str, Any]] = {}
         self._agent_paths: dict[AgentID, Path] = {}
         self._tool_registry = None
+        self._schedulers: dict[AgentID, AgentScheduler] = {}
+        self._embedding_discovery = None
+        self._conversation_store = None
+        self._vector_store = None
 
     # Agent management
     async def register_agent(self, agent_path: Path) -> AgentID:
@@ -131,6 +145,7 @@ class LocalRuntime:
     async def unregister_agent(self, agent_id: AgentID) -> None:
         name = self._id_to_name.pop(agent_id, None)
         self._id_to_agent.pop(agent_id, None)
+        self._schedulers.pop(agent_id, None)
         if name:
             self._name_to_id.pop(name, None)
         try:
@@ -160,20 +175,39 @@ class LocalRuntime:
         return []
 
     # Message routing
-    async def route_message(
+    def _resolve_agent(self, target: AgentID | None) -> tuple[AgentID, "IAgent"]:
+        agent_id = target if target is not None else next(iter(self._id_to_agent), None)
+        agent = self._id_to_agent.get(agent_id) if agent_id is not None else None
+        if agent_id is None or agent is None:
+            raise RuntimeError("No registered agents to route message to")
+        return agent_id, agent
+
+    def _scheduler(self, agent_id: AgentID) -> AgentScheduler:
+        sched = self._schedulers.get(agent_id)
+        if sched is None:
+            sched = AgentScheduler.from_config(
+                self._id_to_name.get(agent_id, str(agent_id)),
+                self._agent_configs.get(agent_id, {}),
+            )
+            self._schedulers[agent_id] = sched
+        return sched
+
+    def get_scheduler_stats(self) -> list[dict[str, Any]]:
+        """Per-agent queue depth, concurrency and wait-time counters."""
+        return [s.stats() for s in self._schedulers.values()]
+
+    def _agent_name(self, target: AgentID | None) -> str:
+        return self._id_to_name.get(
+            target or next(iter(self._id_to_name.keys()), uuid.uuid4()),
+            "unknown",
+        )
+
+    async def _build_context(
         self,
         message: Message,
-        target: AgentID | None = None,
-        conversation_id: ConversationID | None = None,
-        session_id: str | None = None,
-    ) -> AgentResponse:
-        agent: IAgent | None = None
-        if target is not None:
-            agent = self._id_to_agent.get(target)
-        else:
-            agent = next(iter(self._id_to_agent.values()), None)
-        if agent is None:
-            raise RuntimeError("No registered agents to route message to")
+        conversation_id: ConversationID | None,
+        session_id: str | None,
+    ):  # -> AgentContext
         # Minimal context
         from l6e_forge.types.core import AgentContext  # local import to avoid cycles
 
@@ -193,17 +227,38 @@ class LocalRuntime:
 
             try:
                 ctx.conversation_history = await mm.get_conversation(
-                    ctx.conversation_id, limit=50
+                    ctx.conversation_id, limit=HISTORY_WINDOW
                 )
             except Exception:
                 ctx.conversation_history = []
             ctx.history_provider = ConversationHistoryProvider(mm)
         except Exception:
             pass
+        return ctx
+
+    @traced("runtime.route_message")
+    async def route_message(
+        self,
+        message: Message,
+        target: AgentID | None = None,
+        conversation_id: ConversationID | None = None,
+        session_id: str | None = None,
+    ) -> AgentResponse:
+        agent_id, agent = self._resolve_agent(target)
+        conversation_id = conversation_id or uuid.uuid4()
+        set_span_attributes(
+            agent=self._agent_name(agent_id), conversation_id=str(conversation_id)
+        )
         import time as _time
 
-        _start = _time.perf_counter()
-        resp = await agent.handle_message(message, ctx)
+        # Admission control: bounded concurrency and queue per agent (raises AgentOverloadedError).
+        # Admit before persisting so a rejected message never lands in the history.
+        async with self._scheduler(agent_id).slot(conversation_id):
+            ctx = await self._build_context(message, conversation_id, session_id)
+            _start = _time.perf_counter()
+            # Time spent waiting for the slot shows as the gap before this span
+            with span("agent.handle_message"):
+                resp = await agent.handle_message(message, ctx)
         # Process result with configurable processor (agent override or env default)
         try:
             # Agent-provided processor instance or default no-op
@@ -221,10 +276,7 @@ class LocalRuntime:
         # Ensure response object integrity for UI
         try:
             if not getattr(resp, "agent_id", None):
-                resp.agent_id = self._id_to_name.get(
-                    target or next(iter(self._id_to_name.keys()), uuid.uuid4()),
-                    "unknown",
-                )  # type: ignore[attr-defined]
+                resp.agent_id = self._agent_name(target)  # type: ignore[attr-defined]
             if not getattr(resp, "content", None):
                 resp.content = ""  # type: ignore[attr-defined]
         except Exception:
@@ -240,20 +292,144 @@ class LocalRuntime:
             pass
         return resp
 
+    async def route_message_stream(
+        self,
+        message: Message,
+        target: AgentID | None = None,
+        conversation_id: ConversationID | None = None,
+        session_id: str | None = None,
+    ) -> AsyncIterator[StreamingChunk]:
+        """Route a message and yield the reply as it is generated.
+
+        Agents exposing ``handle_message_stream`` stream token by token; others
+        are awaited via ``route_message`` and yield their reply as one chunk.
+        The last chunk always has ``is_complete=True``.
+        """
+        agent_id, agent = self._resolve_agent(target)
+        handle_stream = getattr(agent, "handle_message_stream", None)
+        if not callable(handle_stream):
+            resp = await self.route_message(
+                message,
+                target=target,
+                conversation_id=conversation_id,
+                session_id=session_id,
+            )
+            yield StreamingChunk(
+                content=resp.content,
+                request_id=str(message.message_id),
+                chunk_id=0,
+                is_complete=True,
+            )
+            return
+
+        import time as _time
+
+        agent_name = self._agent_name(agent_id)
+        first_token_ms: float | None = None
+        chunk_id = 0
+        completed = False
+        with span("runtime.route_message_stream", agent=agent_name) as sp:
+            conversation_id = conversation_id or uuid.uuid4()
+            sp.set_attribute("conversation_id", str(conversation_id))
+            # The slot is held until the stream is exhausted or the consumer closes it
+            async with self._scheduler(agent_id).slot(conversation_id):
+                ctx = await self._build_context(message, conversation_id, session_id)
+                _start = _time.perf_counter()
+                async for chunk in handle_stream(message, ctx):
+                    if first_token_ms is None and chunk.content:
+                        first_token_ms = (_time.perf_counter() - _start) * 1000.0
+                        sp.set_attribute("first_token_ms", round(first_token_ms, 3))
+                    completed = completed or chunk.is_complete
+                    chunk_id = chunk.chunk_id + 1
+                    yield chunk
+            sp.set_attribute("chunks", chunk_id)
+        if not completed:
+            yield StreamingChunk(
+                content="",
+                request_id=str(message.message_id),
+                chunk_id=chunk_id,
+                is_complete=True,
+                token_count=0,
+            )
+        _elapsed_ms = (_time.perf_counter() - _start) * 1000.0
+        try:
+            mon = get_monitoring()
+            if first_token_ms is not None:
+                await mon.record_metric(
+                    "time_to_first_token_ms", first_token_ms, tags={"agent": agent_name}
+                )
+            await mon.record_metric(
+                "response_time_ms", _elapsed_ms, tags={"agent": agent_name}
+            )
+        except Exception:
+            pass
+
     async def broadcast_message(
-        self, message: Message, filter_fn: Callable | None = None
+        self,
+        message: Message,
+        filter_fn: Callable | None = None,
+        *,
+        timeout: float | None = None,
+        first_n: int | None = None,
+        first_successful: bool = False,
     ) -> list[AgentResponse]:
-        results: list[AgentResponse] = []
-        for agent in self._id_to_agent.values():
-            if filter_fn and not filter_fn(agent):  # type: ignore[arg-type]
-                continue
-            from l6e_forge.types.core import (
-                AgentContext,
-            )  # local import to avoid cycles
+        """Send a message to every (filtered) agent concurrently.
+
+        Latency is that of the slowest agent still running, bounded by ``timeout``
+        seconds per agent. Agents that fail or miss their deadline are left out of
+        the result (partial results). With ``first_n`` (or ``first_successful``,
+        i.e. ``first_n=1``) the broadcast returns as soon as that many agents have
+        answered and cancels the rest. Responses keep registration order.
+        """
+        from l6e_forge.types.core import AgentContext  # local import to avoid cycles
 
+        targets = [
+            (agent_id, agent)
+            for agent_id, agent in self._id_to_agent.items()
+            if not filter_fn or filter_fn(agent)  # type: ignore[arg-type]
+        ]
+        wanted = 1 if first_successful else first_n
+        if wanted is not None and wanted <= 0:
+            return []
+        results: dict[int, AgentResponse] = {}
+        tasks: list[asyncio.Task] = []
+
+        async def _one(pos: int, agent_id: AgentID, agent: "IAgent") -> None:
             ctx = AgentContext(conversation_id=uuid.uuid4(), session_id="local")
-            results.append(await agent.handle_message(message, ctx))
-        return results
+            name = self._id_to_name.get(agent_id, str(agent_id))
+            try:
+                async with asyncio.timeout(timeout):
+                    async with self._scheduler(agent_id).slot(ctx.conversation_id):
+                        resp = await agent.handle_message(message, ctx)
+            except TimeoutError:
+                logger.warning(
+                    f"broadcast: agent {name} missed its {timeout}s deadline"
+                )
+                await self._record_broadcast_drop(name, "timeout")
+                return
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"broadcast: agent {name} failed: {e}")
+                await self._record_broadcast_drop(name, "error")
+                return
+            results[pos] = resp
+            if wanted is not None and len(results) >= wanted:
+                # Enough answers; cancel the stragglers
+                for task in tasks:
+                    if task is not asyncio.current_task():
+                        task.cancel()
+
+        async with asyncio.TaskGroup() as tg:
+            for pos, (agent_id, agent) in enumerate(targets):
+                tasks.append(tg.create_task(_one(pos, agent_id, agent)))
+        return [results[pos] for pos in sorted(results)]
+
+    async def _record_broadcast_drop(self, agent_name: str, reason: str) -> None:
+        try:
+            await get_monitoring().record_metric(
+                "broadcast_dropped", 1.0, tags={"agent": agent_name, "reason": reason}
+            )
+        except Exception:
+            pass
 
     # Resource management (stubs)
     def get_memory_manager(self):  # -> IMemoryManager
@@ -265,46 +441,63 @@ class LocalRuntime:
             from l6e_forge.memory.embeddings.ollama import OllamaEmbeddingProvider
             from l6e_forge.memory.embeddings.lmstudio import LMStudioEmbeddingProvider
             from l6e_forge.memory.embeddings.mock import MockEmbeddingProvider
+            from l6e_forge.memory.embeddings.discovery import (
+                DiscoveredEmbeddingProvider,
+                load_embedding_settings,
+            )
 
             # Choose store based on env/config; default to in-memory
-            store = InMemoryVectorStore()
+            from l6e_forge.memory.backends.ivf import IVFConfig
+
+            # AF_MEMORY_INDEX=ivf switches large namespaces to approximate search
+            ann = IVFConfig() if os.environ.get("AF_MEMORY_INDEX") == "ivf" else None
+            from l6e_forge.memory.backends.quantization import CODECS
+
+            quantization = os.environ.get("AF_MEMORY_QUANTIZATION", "float32")
+            if quantization not in CODECS:
+                logger.warning(f"Unknown AF_MEMORY_QUANTIZATION '{quantization}'")
+                quantization = "float32"
+            store = InMemoryVectorStore(ann=ann, quantization=quantization)
             try:
                 # If QDRANT_URL or AF_MEMORY_PROVIDER=qdrant, use Qdrant
                 if (
                     os.environ.get("QDRANT_URL")
                     or os.environ.get("AF_MEMORY_PROVIDER") == "qdrant"
                 ):
-                    store = QdrantVectorStore()
+                    store = QdrantVectorStore(http=self._http)
             except Exception:
                 pass
-            # Prefer Ollama embeddings if reachable, else LM Studio, else mock
-            embedder = None
+            self._vector_store = store
+            # Prefer Ollama embeddings if reachable, else LM Studio, else mock. Probing
+            # is deferred and async so building the manager never blocks on I/O;
+            # [memory] embedding_provider in forge.toml skips it altogether.
+            settings = load_embedding_settings(Path.cwd())
+            endpoints = {
+                "ollama": os.environ.get("OLLAMA_HOST", "http://localhost:11434"),
+                "lmstudio": os.environ.get("LMSTUDIO_HOST", "http://localhost:1234/v1"),
+            }
             try:
-                import httpx
-
-                # Probe Ollama
-                ollama = os.environ.get("OLLAMA_HOST", "http://localhost:11434").rstrip(
-                    "/"
+                embedder = DiscoveredEmbeddingProvider(
+                    {
+                        "ollama": lambda: self._with_embedding_cache(
+                            OllamaEmbeddingProvider(http=self._http)
+                        ),
+                        "lmstudio": lambda: self._with_embedding_cache(
+                            LMStudioEmbeddingProvider(http=self._http)
+                        ),
+                        "mock": MockEmbeddingProvider,
+                    },
+                    endpoints,
+                    http=self._http,
+                    override=settings.get("provider"),
+                    ttl_s=settings.get("ttl_s", 300.0),
                 )
-                r = httpx.get(f"{ollama}/api/version", timeout=1.0)
-                if r.status_code == 200:
-                    embedder = OllamaEmbeddingProvider()
-            except Exception:
-                embedder = None
-            if embedder is None:
-                try:
-                    import httpx
-
-                    lm = os.environ.get(
-                        "LMSTUDIO_HOST", "http://localhost:1234/v1"
-                    ).rstrip("/")
-                    r = httpx.get(f"{lm}/models", timeout=1.0)
-                    if r.status_code == 200:
-                        embedder = LMStudioEmbeddingProvider()
-                except Exception:
-                    embedder = None
-            if embedder is None:
-                embedder = MockEmbeddingProvider()
+            except ValueError as e:
+                logger.error(f"Invalid embedding configuration: {e}")
+                embedder = DiscoveredEmbeddingProvider(
+                    {"mock": MockEmbeddingProvider}, endpoints, override="mock"
+                )
+            self._embedding_discovery = embedder
             # Optional conversation store (Postgres) if AF_DB_URL is set
             conversation_store = None
             try:
@@ -317,9 +510,48 @@ class LocalRuntime:
                     conversation_store = PostgresConversationStore(db_url)
             except Exception:
                 conversation_store = None
-            self._memory_manager = MemoryManager(store, embedder, conversation_store)
+            self._conversation_store = conversation_store
+            conversation_cache = None
+            if conversation_store is not None:
+                # Serve history reads from memory; AF_CONVERSATION_CACHE_MB=0 disables it
+                from l6e_forge.memory.conversation.cache import ConversationCache
+
+                try:
+                    cache_mb = float(os.environ.get("AF_CONVERSATION_CACHE_MB", "32"))
+                except ValueError:
+                    cache_mb = 32.0
+                if cache_mb > 0:
+                    conversation_cache = ConversationCache(
+                        window=HISTORY_WINDOW, max_bytes=int(cache_mb * 1024 * 1024)
+                    )
+            self._memory_manager = MemoryManager(
+                store, embedder, conversation_store, conversation_cache
+            )
         return self._memory_manager
 
+    def _with_embedding_cache(self, embedder):  # -> IEmbeddingProvider
+        # Content-addressed cache; AF_EMBEDDING_CACHE_MB=0 disables it and
+        # AF_EMBEDDING_CACHE_PATH adds a SQLite tier that survives restarts
+        try:
+            from l6e_forge.memory.embeddings.cache import CachedEmbeddingProvider
+
+            cache_mb = float(os.environ.get("AF_EMBEDDING_CACHE_MB", "64"))
+            if cache_mb > 0:
+                return CachedEmbeddingProvider(
+                    embedder,
+                    max_bytes=int(cache_mb * 1024 * 1024),
+                    disk_path=os.environ.get("AF_EMBEDDING_CACHE_PATH") or None,
+                )
+        except Exception as e:  # noqa: BLE001
+            logger.error(f"Embedding cache disabled: {e}")
+        return embedder
+
+    def get_embedding_status(self) -> dict[str, Any]:
+        """Embedding provider discovery state (selected provider, cached probe results)."""
+        if self._embedding_discovery is None:
+            return {"selected": None, "probes": {}}
+        return self._embedding_discovery.status()
+
     def get_model_manager(self):  # -> IModelManager
         if self._model_manager is None:
             # Use provider registry with endpoints from forge.toml (workspace root is parent of agents dir)
@@ -333,7 +565,7 @@ class LocalRuntime:
             provider = (
                 os.environ.get("AF_DEFAULT_PROVIDER") or _default_provider or "ollama"
             )
-            self._model_manager = get_manager(provider, endpoints)
+            self._model_manager = get_manager(provider, endpoints, http=self._http)
         return self._model_manager
 
     def get_tool_registry(self):  # -> IToolRegistry
@@ -346,6 +578,53 @@ class LocalRuntime:
     def get_event_bus(self):  # -> IEventBus
         raise NotImplementedError
 
+    def get_http_pool(self) -> HttpClientPool:
+        return self._http
+
+    async def start(self) -> None:
+        """Begin background work (embedding provider discovery) without waiting on I/O."""
+        self.get_memory_manager()
+        try:
+            if self._embedding_discovery is not None:
+                self._embedding_discovery.start()
+        except Exception:
+            pass
+        # Restore the in-memory vector store instead of re-embedding the corpus
+        snapshot_dir = os.environ.get("AF_MEMORY_SNAPSHOT_DIR")
+        load = getattr(self._vector_store, "load_snapshot", None)
+        if snapshot_dir and callable(load):
+            if (Path(snapshot_dir) / "manifest.json").exists():
+                try:
+                    count = await load(snapshot_dir)
+                    logger.info(f"Loaded {count} vectors from {snapshot_dir}")
+                except Exception as e:  # noqa: BLE001
+                    logger.error(f"Failed to load vector snapshot: {e}")
+
+    async def shutdown(self) -> None:
+        """Release runtime-owned resources such as pooled HTTP connections."""
+        # Flush write-behind conversation buffers before connections go away
+        close = getattr(self._conversation_store, "close", None)
+        if callable(close):
+            try:
+                await close()
+            except Exception as e:  # noqa: BLE001
+                logger.error(f"Error closing conversation store: {e}")
+        snapshot_dir = os.environ.get("AF_MEMORY_SNAPSHOT_DIR")
+        save = getattr(self._vector_store, "save_snapshot", None)
+        if snapshot_dir and callable(save):
+            try:
+                await save(snapshot_dir)
+            except Exception as e:  # noqa: BLE001
+                logger.error(f"Failed to save vector snapshot: {e}")
+        # Queued monitoring writes go out before the pooled client is closed
+        flush = getattr(get_monitoring(), "flush", None)
+        if callable(flush):
+            try:
+                await flush()
+            except Exception as e:  # noqa: BLE001
+                logger.error(f"Failed to flush monitoring: {e}")
+        await self._http.aclose()
+
     # Development support (stubs)
     async def start_dev_mode(self, port: int = 8123) -> None:
         return None
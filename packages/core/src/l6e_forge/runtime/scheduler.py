@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Hashable, Mapping
+
+from l6e_forge.runtime.monitoring import get_monitoring
+
+
+class AgentOverloadedError(RuntimeError):
+    """Raised when an agent's queue is full or a request waited too long for a slot.
+
+    API layers map this to HTTP 429 with ``Retry-After: retry_after_s``.
+    """
+
+    def __init__(self, agent: str, reason: str, retry_after_s: float = 1.0) -> None:
+        super().__init__(f"Agent '{agent}' is overloaded: {reason}")
+        self.agent = agent
+        self.reason = reason
+        self.retry_after_s = retry_after_s
+
+
+class AgentScheduler:
+    """Admission control for a single agent.
+
+    - At most ``max_concurrency`` requests run at once
+    - Up to ``max_queue_size`` more wait for a slot; beyond that callers are
+      rejected immediately with :class:`AgentOverloadedError`
+    - Waiters are grouped by conversation and served round-robin, FIFO within a
+      conversation, so one busy conversation cannot starve the others
+    - A waiter that does not get a slot within ``queue_timeout_s`` is rejected
+      rather than left to hit the model server's own timeout
+    """
+
+    def __init__(
+        self,
+        agent: str,
+        *,
+        max_concurrency: int = 4,
+        max_queue_size: int = 32,
+        queue_timeout_s: float | None = 30.0,
+    ) -> None:
+        self.agent = agent
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_queue_size = max(0, int(max_queue_size))
+        self.queue_timeout_s = queue_timeout_s
+        self._active = 0
+        self._queued = 0
+        # conversation key -> waiters; dict order is the round-robin order
+        self._waiters: "OrderedDict[Hashable, deque[asyncio.Future[None]]]" = (
+            OrderedDict()
+        )
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._wait_ms_total = 0.0
+        self._wait_ms_max = 0.0
+
+    @classmethod
+    def from_config(cls, agent: str, config: Mapping[str, Any]) -> "AgentScheduler":
+        """Build from an agent's ``[behavior]`` table (max_concurrency, max_queue_size, queue_timeout)."""
+        behavior = config.get("behavior") if isinstance(config, Mapping) else None
+        behavior = behavior if isinstance(behavior, Mapping) else {}
+        timeout = behavior.get("queue_timeout", 30.0)
+        return cls(
+            agent,
+            max_concurrency=int(behavior.get("max_concurrency", 4)),
+            max_queue_size=int(behavior.get("max_queue_size", 32)),
+            queue_timeout_s=float(timeout) if timeout else None,
+        )
+
+    @asynccontextmanager
+    async def slot(self, conversation: Hashable) -> AsyncIterator[float]:
+        """Hold one execution slot for the duration of the block; yields the queue wait in ms."""
+        wait_ms = await self._acquire(conversation)
+        try:
+            await self._record("agent_queue_wait_ms", wait_ms)
+            yield wait_ms
+        finally:
+            self._release()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "agent": self.agent,
+            "active": self._active,
+            "queued": self._queued,
+            "conversations_waiting": len(self._waiters),
+            "max_concurrency": self.max_concurrency,
+            "max_queue_size": self.max_queue_size,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "timed_out": self._timed_out,
+            "avg_wait_ms": self._wait_ms_total / self._admitted
+            if self._admitted
+            else 0.0,
+            "max_wait_ms": self._wait_ms_max,
+        }
+
+    # ---- Internals ----
+    async def _acquire(self, conversation: Hashable) -> float:
+        if self._active < self.max_concurrency and self._queued == 0:
+            self._active += 1
+            self._admitted += 1
+            return 0.0
+        if self._queued >= self.max_queue_size:
+            self._rejected += 1
+            await self._record("agent_rejected", 1.0)
+            raise AgentOverloadedError(
+                self.agent, f"queue full ({self._queued} waiting)"
+            )
+
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(conversation, deque()).append(fut)
+        self._queued += 1
+        start = time.perf_counter()
+        try:
+            await self._record("agent_queue_depth", float(self._queued))
+            await asyncio.wait_for(fut, self.queue_timeout_s)
+        except BaseException as exc:
+            if fut.done() and not fut.cancelled():
+                # The slot was handed over as we gave up; pass it on
+                self._release()
+            else:
+                self._discard(conversation, fut)
+            if isinstance(exc, asyncio.TimeoutError):
+                self._timed_out += 1
+                self._rejected += 1
+                await self._record("agent_rejected", 1.0)
+                raise AgentOverloadedError(
+                    self.agent,
+                    f"no slot within {self.queue_timeout_s:g}s",
+                    retry_after_s=self.queue_timeout_s or 1.0,
+                ) from None
+            raise
+        wait_ms = (time.perf_counter() - start) * 1000.0
+        self._admitted += 1
+        self._wait_ms_total += wait_ms
+        self._wait_ms_max = max(self._wait_ms_max, wait_ms)
+        return wait_ms
+
+    def _release(self) -> None:
+        # Hand the slot straight to the next waiter so newcomers cannot jump the queue
+        while self._waiters:
+            conversation, waiters = next(iter(self._waiters.items()))
+            fut = waiters.popleft()
+            self._queued -= 1
+            if waiters:
+                self._waiters.move_to_end(conversation)
+            else:
+                del self._waiters[conversation]
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self._active -= 1
+
+    def _discard(self, conversation: Hashable, fut: asyncio.Future[None]) -> None:
+        waiters = self._waiters.get(conversation)
+        if waiters is None or fut not in waiters:
+            return
+        waiters.remove(fut)
+        self._queued -= 1
+        if not waiters:
+            del self._waiters[conversation]
+
+    async def _record(self, name: str, value: float) -> None:
+        try:
+            await get_monitoring().record_metric(
+                name, value, tags={"agent": self.agent}
+            )
+        except Exception:
+            pass
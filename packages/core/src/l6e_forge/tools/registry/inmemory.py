@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 import uuid
 
+from l6e_forge.monitor.tracing import span
 from l6e_forge.types.core import AgentID, ToolID
 from l6e_forge.types.tool import ToolContext, ToolResult, ToolSpec
 from l6e_forge.tools.base import ITool
@@ -79,4 +80,5 @@ class InMemoryToolRegistry(IToolRegistry):
         self, tool_id: ToolID, parameters: dict[str, Any], context: ToolContext
     ) -> ToolResult:
         tool = self.get_tool(tool_id)
-        return await tool.execute(parameters, context)
+        with span("tool.execute", tool=str(tool_id)):
+            return await tool.execute(parameters, context)
@@ -186,6 +186,11 @@ class BehaviorConfig:
     max_retries: int = 3
     fallback_behavior: Literal["error", "default_response", "escalate"] = "error"
 
+    # Admission control (per agent): concurrent requests, waiting requests, max wait
+    max_concurrency: int = 4
+    max_queue_size: int = 32
+    queue_timeout: float = 30.0
+
 
 @dataclass
 class DevelopmentConfig:
@@ -60,6 +60,12 @@ class MemoryResult:
     rank: Optional[int] = None
 
 
+# Structured metadata filter: {field: value} for equality, {field: [a, b]} for
+# membership, or {field: {"gte": 1, "lt": 5}} with operators eq/in/gt/gte/lt/lte.
+# Conditions are ANDed; dotted fields ("source.kind") address nested metadata.
+MetadataFilter = Dict[str, Any]
+
+
 @dataclass
 class MemoryQuery:
     """Query for memory search"""
@@ -72,7 +78,7 @@ class MemoryQuery:
     score_threshold: float = 0.0
 
     # Filters
-    metadata_filters: Dict[str, Any] = field(default_factory=dict)
+    metadata_filters: MetadataFilter = field(default_factory=dict)
     tag_filters: List[str] = field(default_factory=list)
     date_range: Optional[tuple[datetime, datetime]] = None
 
@@ -311,6 +317,7 @@ class MemoryBatch:
     created_at: datetime = field(default_factory=datetime.now)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    items_per_second: float = 0.0
 
 
 # ============================================================================
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import json
 import os
 import uuid
-from typing import Any
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator
 
-from fastapi import FastAPI, Response, WebSocket
+from fastapi import FastAPI, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
@@ -12,6 +16,7 @@ import os as _os
 
 from l6e_forge.runtime.local import LocalRuntime
 from l6e_forge.runtime.monitoring import get_monitoring
+from l6e_forge.runtime.scheduler import AgentOverloadedError
 from l6e_forge.types.core import Message
 
 import logging
@@ -29,8 +34,27 @@ def _runtime() -> LocalRuntime:
     return _runtime_singleton
 
 
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Probe embedding providers in the background so the first chat does not wait on them
+    await _runtime().start()
+    yield
+    # Close pooled upstream connections (model servers, Qdrant, monitor) on shutdown
+    if _runtime_singleton is not None:
+        await _runtime_singleton.shutdown()
+
+
+def _overloaded(exc: AgentOverloadedError, conversation_id: uuid.UUID) -> JSONResponse:
+    # Shed load instead of piling more requests onto the model server
+    return JSONResponse(
+        {"error": str(exc), "conversation_id": str(conversation_id)},
+        status_code=429,
+        headers={"Retry-After": str(max(1, round(exc.retry_after_s)))},
+    )
+
+
 def create_app() -> FastAPI:
-    app = FastAPI(title="l6e forge API", version="0.1")
+    app = FastAPI(title="l6e forge API", version="0.1", lifespan=_lifespan)
 
     # CORS for local dev and compose usage
     app.add_middleware(
@@ -105,12 +129,10 @@ def create_app() -> FastAPI:
         await rt.unregister_agent(aid)
         return {"ok": True}
 
-    @app.post("/chat")
-    @app.post("/api/chat")
-    async def chat(payload: dict[str, Any]) -> dict[str, Any]:
+    async def _prepare_chat(payload: dict[str, Any]) -> dict[str, Any]:
+        """Validate a chat payload, start the agent if needed and resolve ids."""
         agent_name = str(payload.get("agent", "default"))
         text = str(payload.get("message", "")).strip()
-        # Start log removed to reduce duplicate noise; we log only the end
         workspace = str(
             payload.get("workspace", os.environ.get("AF_WORKSPACE", "/workspace"))
         )
@@ -146,6 +168,69 @@ def create_app() -> FastAPI:
             session_uuid = incoming_sess.strip()
         else:
             session_uuid = str(uuid.uuid4())
+        return {
+            "text": text,
+            "agent_id": aid,
+            "conversation_id": conversation_uuid,
+            "session_id": session_uuid,
+        }
+
+    async def _stream_chat(req: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        """Route a prepared chat request and yield chunk/done/error events.
+
+        Admission is decided before the first event: :class:`AgentOverloadedError`
+        propagates to the caller so each transport can report it its own way.
+        """
+        aid = req["agent_id"]
+        conversation_uuid = req["conversation_id"]
+        mon = get_monitoring()
+        mon.add_chat_log(
+            conversation_id=str(conversation_uuid), role="user", content=req["text"]
+        )
+        await mon.record_event("chat.message", {"direction": "in", "role": "user"})
+        parts: list[str] = []
+        try:
+            async for chunk in _runtime().route_message_stream(
+                Message(role="user", content=req["text"]),
+                target=aid,
+                conversation_id=conversation_uuid,
+                session_id=req["session_id"],
+            ):
+                if chunk.content:
+                    parts.append(chunk.content)
+                    yield {"type": "chunk", "content": chunk.content}
+        except AgentOverloadedError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("chat stream failed")
+            yield {"type": "error", "error": str(exc) or type(exc).__name__}
+            return
+        content = "".join(parts)
+        mon.add_chat_log(
+            conversation_id=str(conversation_uuid),
+            role="assistant",
+            content=content,
+            agent_id=str(aid),
+        )
+        await mon.record_event("chat.message", {"direction": "out", "agent": str(aid)})
+        yield {
+            "type": "done",
+            "content": content,
+            "conversation_id": str(conversation_uuid),
+            "session_id": req["session_id"],
+            "agent_id": str(aid),
+        }
+
+    @app.post("/chat")
+    @app.post("/api/chat")
+    async def chat(payload: dict[str, Any]) -> Any:
+        # Start log removed to reduce duplicate noise; we log only the end
+        req = await _prepare_chat(payload)
+        if "error" in req:
+            return req
+        aid = req["agent_id"]
+        conversation_uuid = req["conversation_id"]
+        session_uuid = req["session_id"]
         conversation_id = conversation_uuid
         # Idempotency: optional request_id from client; cache simple last result per (conversation_id, request_id)
         request_id = str(payload.get("request_id") or "").strip()
@@ -158,17 +243,21 @@ def create_app() -> FastAPI:
         if _idem_key and _idem_key in idem_cache:
             return idem_cache[_idem_key]
 
+        runtime = _runtime()
         mon = get_monitoring()
         mon.add_chat_log(
-            conversation_id=str(conversation_uuid), role="user", content=text
+            conversation_id=str(conversation_uuid), role="user", content=req["text"]
         )
         await mon.record_event("chat.message", {"direction": "in", "role": "user"})
-        resp = await runtime.route_message(
-            Message(role="user", content=text),
-            target=aid,
-            conversation_id=conversation_uuid,
-            session_id=session_uuid,
-        )
+        try:
+            resp = await runtime.route_message(
+                Message(role="user", content=req["text"]),
+                target=aid,
+                conversation_id=conversation_uuid,
+                session_id=session_uuid,
+            )
+        except AgentOverloadedError as exc:
+            return _overloaded(exc, conversation_uuid)
         print(f"/api/chat end agent_id={aid} content={resp.content!r}")
         mon.add_chat_log(
             conversation_id=str(conversation_uuid),
@@ -187,6 +276,55 @@ def create_app() -> FastAPI:
             idem_cache[_idem_key] = out
         return out
 
+    @app.post("/api/chat/stream")
+    async def chat_stream(payload: dict[str, Any]) -> Response:
+        """Server-sent events: ``chunk`` per token batch, then ``done`` (or ``error``)."""
+        req = await _prepare_chat(payload)
+        if "error" in req:
+            return JSONResponse(req, status_code=400)
+
+        events = _stream_chat(req)
+        try:
+            # Wait for admission so a rejected request gets a real 429, like /api/chat
+            first = await events.__anext__()
+        except AgentOverloadedError as exc:
+            return _overloaded(exc, req["conversation_id"])
+
+        def _sse(event: dict[str, Any]) -> str:
+            return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+        async def _events() -> AsyncIterator[str]:
+            yield _sse(first)
+            async for event in events:
+                yield _sse(event)
+
+        return StreamingResponse(
+            _events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.websocket("/api/chat/ws")
+    async def chat_ws(ws: WebSocket) -> None:
+        """One JSON chat payload in, ``{"type": "chunk"|"done"|"error", ...}`` frames out."""
+        await ws.accept()
+        try:
+            while True:
+                payload = await ws.receive_json()
+                req = await _prepare_chat(payload if isinstance(payload, dict) else {})
+                if "error" in req:
+                    await ws.send_json({"type": "error", "error": req["error"]})
+                    continue
+                try:
+                    async for event in _stream_chat(req):
+                        await ws.send_json(event)
+                except AgentOverloadedError as exc:
+                    await ws.send_json(
+                        {"type": "error", "error": str(exc), "status": 429}
+                    )
+        except WebSocketDisconnect:
+            pass
+
     # Memory endpoints (MVP)
     @app.post("/api/memory/upsert")
     async def memory_upsert(payload: dict[str, Any]) -> dict[str, Any]:
@@ -226,6 +364,15 @@ def create_app() -> FastAPI:
         ]
         return {"results": out}
 
+    @app.get("/api/memory/providers")
+    async def memory_providers() -> dict[str, Any]:
+        return _runtime().get_embedding_status()
+
+    @app.get("/api/memory/stats")
+    async def memory_stats() -> dict[str, Any]:
+        stats = getattr(_runtime().get_memory_manager(), "stats", None)
+        return stats() if callable(stats) else {}
+
     # Serve monitor data directly under API namespace. Monitor service remains internal-only.
     @app.get("/api/perf")
     async def api_perf() -> dict[str, Any]:
@@ -237,6 +384,40 @@ def create_app() -> FastAPI:
         mon = get_monitoring()
         return mon.get_perf_by_agent()
 
+    @app.get("/api/traces")
+    async def api_traces(limit: int = 50) -> list[dict[str, Any]]:
+        get_traces = getattr(get_monitoring(), "get_traces", None)
+        return get_traces(limit) if callable(get_traces) else []
+
+    @app.get("/api/traces/{trace_id}")
+    async def api_trace(trace_id: str) -> Any:
+        get_trace = getattr(get_monitoring(), "get_trace", None)
+        found = get_trace(trace_id) if callable(get_trace) else None
+        if found is None:
+            return JSONResponse({"error": "trace not found"}, status_code=404)
+        return found
+
+    @app.get("/api/monitor/subscribers")
+    async def api_monitor_subscribers() -> dict[str, Any]:
+        stats = getattr(get_monitoring(), "subscriber_stats", None)
+        return stats() if callable(stats) else {}
+
+    @app.get("/api/metrics/{name}")
+    async def api_metric_series(
+        name: str, minutes: float = 60.0, buckets: int = 60
+    ) -> list[dict[str, Any]]:
+        series = getattr(get_monitoring(), "get_metric_series", None)
+        if not callable(series):
+            return []
+        end = datetime.now()
+        return series(
+            name, start=end - timedelta(minutes=minutes), end=end, buckets=buckets
+        )
+
+    @app.get("/api/scheduler")
+    async def api_scheduler() -> list[dict[str, Any]]:
+        return _runtime().get_scheduler_stats()
+
     @app.get("/api/chats")
     async def api_chats(limit: int = 200) -> list[dict[str, Any]]:
         mon = get_monitoring()
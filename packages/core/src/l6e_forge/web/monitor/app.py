@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import datetime, timedelta
 from typing import Any
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
@@ -51,27 +52,112 @@ def create_app(monitor: IMonitoringService) -> FastAPI:
     async def perf_by_agent() -> JSONResponse:
         return JSONResponse(monitor.get_perf_by_agent())
 
-    # Ingestion endpoints to accept metrics/events/status from remote runtimes
-    @app.post("/ingest/metric")
-    async def ingest_metric(payload: dict[str, Any]) -> JSONResponse:
+    @app.get("/api/traces")
+    async def traces(limit: int = 50) -> JSONResponse:
+        get_traces = getattr(monitor, "get_traces", None)
+        return JSONResponse(get_traces(limit) if callable(get_traces) else [])
+
+    @app.get("/api/traces/{trace_id}")
+    async def trace(trace_id: str) -> JSONResponse:
+        get_trace = getattr(monitor, "get_trace", None)
+        found = get_trace(trace_id) if callable(get_trace) else None
+        if found is None:
+            return JSONResponse({"error": "trace not found"}, status_code=404)
+        return JSONResponse(found)
+
+    @app.get("/api/subscribers")
+    async def subscribers() -> JSONResponse:
+        stats = getattr(monitor, "subscriber_stats", None)
+        return JSONResponse(stats() if callable(stats) else {})
+
+    @app.get("/api/metrics/{name}")
+    async def metric_series(
+        name: str, minutes: float = 60.0, buckets: int = 60
+    ) -> JSONResponse:
+        # Downsampled series for charts; optional on monitoring backends
+        series = getattr(monitor, "get_metric_series", None)
+        if not callable(series):
+            return JSONResponse([])
+        end = datetime.now()
+        start = end - timedelta(minutes=minutes)
+        return JSONResponse(series(name, start=start, end=end, buckets=buckets))
+
+    # Ingestion handlers shared by the single-item endpoints and /ingest/batch
+    async def _metric(payload: dict[str, Any]) -> None:
+        name = str(payload.get("name"))
+        value = float(payload.get("value") or 0)
+        tags = payload.get("tags") or {}
+        await monitor.record_metric(name, value, tags=tags)
+
+    async def _event(payload: dict[str, Any]) -> None:
+        name = str(payload.get("name"))
+        data = payload.get("data") or {}
+        await monitor.record_event(name, data)
+
+    async def _trace_end(payload: dict[str, Any]) -> None:
+        await monitor.end_trace(str(payload.get("trace_id")))
+
+    async def _span(payload: dict[str, Any]) -> None:
+        record = getattr(monitor, "record_span", None)
+        if callable(record):
+            record({k: v for k, v in payload.items() if k != "kind"})
+
+    async def _agent_status(payload: dict[str, Any]) -> None:
+        # Convenience methods exist on InMemoryMonitoringService
+        agent_id = str(payload.get("agent_id"))
+        name = str(payload.get("name"))
+        status = str(payload.get("status", "ready"))
+        config = payload.get("config") or {}
+        monitor.set_agent_status(agent_id, name, status=status, config=config)
+        await monitor.record_event(
+            "agent.status", {"agent_id": agent_id, "status": status, "name": name}
+        )
+        # Trigger UI refresh by emitting agent.registered on ready state
+        if status == "ready":
+            await monitor.record_event(
+                "agent.registered", {"agent_id": agent_id, "name": name}
+            )
+
+    async def _agent_remove(payload: dict[str, Any]) -> None:
+        agent_id = str(payload.get("agent_id"))
+        monitor.remove_agent(agent_id)
+        await monitor.record_event("agent.unregistered", {"agent_id": agent_id})
+
+    async def _chat(payload: dict[str, Any]) -> None:
+        conversation_id = str(payload.get("conversation_id", "local"))
+        role = str(payload.get("role"))
+        content = str(payload.get("content"))
+        agent_id = payload.get("agent_id")
+        monitor.add_chat_log(conversation_id, role, content, agent_id=agent_id)
+        await monitor.record_event(
+            "chat.message", {"direction": "ingest", "role": role}
+        )
+
+    handlers = {
+        "metric": _metric,
+        "event": _event,
+        "trace_end": _trace_end,
+        "span": _span,
+        "agent_status": _agent_status,
+        "agent_remove": _agent_remove,
+        "chat": _chat,
+    }
+
+    async def _ingest(kind: str, payload: dict[str, Any]) -> JSONResponse:
         try:
-            name = str(payload.get("name"))
-            value = float(payload.get("value") or 0)
-            tags = payload.get("tags") or {}
-            await monitor.record_metric(name, value, tags=tags)
+            await handlers[kind](payload)
             return JSONResponse({"ok": True})
         except Exception as exc:
             return JSONResponse({"ok": False, "error": str(exc)}, status_code=400)
 
+    # Ingestion endpoints to accept metrics/events/status from remote runtimes
+    @app.post("/ingest/metric")
+    async def ingest_metric(payload: dict[str, Any]) -> JSONResponse:
+        return await _ingest("metric", payload)
+
     @app.post("/ingest/event")
     async def ingest_event(payload: dict[str, Any]) -> JSONResponse:
-        try:
-            name = str(payload.get("name"))
-            data = payload.get("data") or {}
-            await monitor.record_event(name, data)
-            return JSONResponse({"ok": True})
-        except Exception as exc:
-            return JSONResponse({"ok": False, "error": str(exc)}, status_code=400)
+        return await _ingest("event", payload)
 
     @app.post("/ingest/trace/start")
     async def ingest_trace_start(payload: dict[str, Any]) -> JSONResponse:
@@ -84,58 +170,44 @@ def create_app(monitor: IMonitoringService) -> FastAPI:
 
     @app.post("/ingest/trace/end")
     async def ingest_trace_end(payload: dict[str, Any]) -> JSONResponse:
-        try:
-            trace_id = str(payload.get("trace_id"))
-            await monitor.end_trace(trace_id)
-            return JSONResponse({"ok": True})
-        except Exception as exc:
-            return JSONResponse({"ok": False, "error": str(exc)}, status_code=400)
+        return await _ingest("trace_end", payload)
+
+    @app.post("/ingest/span")
+    async def ingest_span(payload: dict[str, Any]) -> JSONResponse:
+        return await _ingest("span", payload)
 
     @app.post("/ingest/agent/status")
     async def ingest_agent_status(payload: dict[str, Any]) -> JSONResponse:
-        try:
-            # Convenience methods exist on InMemoryMonitoringService
-            agent_id = str(payload.get("agent_id"))
-            name = str(payload.get("name"))
-            status = str(payload.get("status", "ready"))
-            config = payload.get("config") or {}
-            monitor.set_agent_status(agent_id, name, status=status, config=config)
-            await monitor.record_event(
-                "agent.status", {"agent_id": agent_id, "status": status, "name": name}
-            )
-            # Trigger UI refresh by emitting agent.registered on ready state
-            if status == "ready":
-                await monitor.record_event(
-                    "agent.registered", {"agent_id": agent_id, "name": name}
-                )
-            return JSONResponse({"ok": True})
-        except Exception as exc:
-            return JSONResponse({"ok": False, "error": str(exc)}, status_code=400)
+        return await _ingest("agent_status", payload)
 
     @app.post("/ingest/agent/remove")
     async def ingest_agent_remove(payload: dict[str, Any]) -> JSONResponse:
-        try:
-            agent_id = str(payload.get("agent_id"))
-            monitor.remove_agent(agent_id)
-            await monitor.record_event("agent.unregistered", {"agent_id": agent_id})
-            return JSONResponse({"ok": True})
-        except Exception as exc:
-            return JSONResponse({"ok": False, "error": str(exc)}, status_code=400)
+        return await _ingest("agent_remove", payload)
 
     @app.post("/ingest/chat")
     async def ingest_chat(payload: dict[str, Any]) -> JSONResponse:
-        try:
-            conversation_id = str(payload.get("conversation_id", "local"))
-            role = str(payload.get("role"))
-            content = str(payload.get("content"))
-            agent_id = payload.get("agent_id")
-            monitor.add_chat_log(conversation_id, role, content, agent_id=agent_id)
-            await monitor.record_event(
-                "chat.message", {"direction": "ingest", "role": role}
+        return await _ingest("chat", payload)
+
+    @app.post("/ingest/batch")
+    async def ingest_batch(payload: dict[str, Any]) -> JSONResponse:
+        """Apply ``{"items": [{"kind": ..., **fields}, ...]}`` in order.
+
+        Items that fail are skipped and reported; the rest are still applied.
+        """
+        items = payload.get("items")
+        if not isinstance(items, list):
+            return JSONResponse(
+                {"ok": False, "error": "'items' must be a list"}, status_code=400
             )
-            return JSONResponse({"ok": True})
-        except Exception as exc:
-            return JSONResponse({"ok": False, "error": str(exc)}, status_code=400)
+        errors: list[dict[str, Any]] = []
+        for pos, item in enumerate(items):
+            try:
+                await handlers[str(item.get("kind"))](item)
+            except Exception as exc:
+                errors.append({"index": pos, "error": str(exc) or repr(exc)})
+        return JSONResponse(
+            {"ok": not errors, "accepted": len(items) - len(errors), "errors": errors}
+        )
 
     @app.websocket("/ws")
     async def websocket_endpoint(ws: WebSocket) -> None:
@@ -199,6 +271,19 @@ _INDEX_HTML = """
     .conv-title { font-weight: 600; }
     .flex { display: flex; gap: 12px; align-items: center; }
     .muted { color: #8b949e; }
+    .trace-row { display: flex; justify-content: space-between; padding: 4px 6px; border-bottom: 1px dashed #30363d; cursor: pointer; font-size: 12px; }
+    .trace-row:hover, .trace-row.selected { background: #161b22; }
+    .trace-row.error .trace-name { color: #f85149; }
+    .waterfall { margin-top: 8px; font-size: 12px; }
+    .wf-row { display: grid; grid-template-columns: 260px 1fr 80px; gap: 8px; align-items: center; padding: 2px 0; }
+    .wf-name { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+    .wf-track { position: relative; height: 12px; background: #161b22; border-radius: 2px; }
+    .wf-bar { position: absolute; top: 0; height: 12px; min-width: 2px; border-radius: 2px; background: #1f6feb; }
+    .wf-bar.memory { background: #8957e5; }
+    .wf-bar.model { background: #d29922; }
+    .wf-bar.tool { background: #3fb950; }
+    .wf-bar.error { background: #f85149; }
+    .wf-ms { text-align: right; }
   </style>
   <script>
     let ws;
@@ -212,6 +297,9 @@ _INDEX_HTML = """
           renderPerf(msg.perf);
           return;
         }
+        if (msg.type === 'trace') {
+          scheduleTraces();
+        }
         if (msg.type === 'metric' && msg.data.name === 'response_time_ms') {
           fetch('/api/perf').then(r => r.json()).then(renderPerf);
         }
@@ -242,7 +330,9 @@ _INDEX_HTML = """
 
     function renderPerf(perf) {
       const el = document.getElementById('perf');
-      el.innerHTML = `Avg: ${perf.avg_ms.toFixed(1)} ms • P95: ${perf.p95_ms.toFixed(1)} ms • Count: ${perf.count}`;
+      const recent = (perf.windows || {})['5m'];
+      const last5m = recent && recent.count ? ` • Last 5m P95: ${recent.p95_ms.toFixed(1)} ms (${recent.count})` : '';
+      el.innerHTML = `Avg: ${perf.avg_ms.toFixed(1)} ms • P50: ${(perf.p50_ms || 0).toFixed(1)} ms • P95: ${perf.p95_ms.toFixed(1)} ms • P99: ${(perf.p99_ms || 0).toFixed(1)} ms • Count: ${perf.count}${last5m}`;
     }
 
     function renderChats(chats) {
@@ -270,6 +360,49 @@ _INDEX_HTML = """
       }).join('');
     }
 
+    function esc(v) {
+      return String(v ?? '').replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]));
+    }
+
+    let selectedTrace = null;
+    let tracesTimer = null;
+    function scheduleTraces() {
+      // Coalesce bursts of finished traces into one refresh
+      if (tracesTimer) return;
+      tracesTimer = setTimeout(() => { tracesTimer = null; loadTraces(); }, 500);
+    }
+
+    async function loadTraces() {
+      const traces = await fetch('/api/traces?limit=30').then(r => r.json());
+      const el = document.getElementById('traces');
+      el.innerHTML = traces.map(t => `
+        <div class="trace-row ${t.status} ${t.trace_id === selectedTrace ? 'selected' : ''}" onclick="showTrace('${t.trace_id}')">
+          <span class="trace-name">${esc(t.name || t.trace_id.slice(0, 8))}</span>
+          <span class="muted">${new Date(t.started_at).toLocaleTimeString()} • ${t.span_count} spans • ${(t.duration_ms || 0).toFixed(1)} ms</span>
+        </div>
+      `).join('') || '<span class="muted">No traces yet</span>';
+    }
+
+    async function showTrace(traceId) {
+      selectedTrace = traceId;
+      const trace = await fetch('/api/traces/' + traceId).then(r => r.json());
+      const total = Math.max(trace.duration_ms || 0, ...trace.spans.map(s => s.offset_ms + s.duration_ms), 0.001);
+      const kind = name => name.split('.')[0];
+      document.getElementById('waterfall').innerHTML = `
+        <div class="muted">${esc(trace.name)} • ${total.toFixed(1)} ms</div>
+        ${trace.spans.map(s => `
+          <div class="wf-row" title="${esc(JSON.stringify(s.attributes))}${s.error ? ' ' + esc(s.error) : ''}">
+            <span class="wf-name" style="padding-left:${s.depth * 12}px">${esc(s.name)}</span>
+            <div class="wf-track">
+              <div class="wf-bar ${esc(kind(s.name))} ${s.status === 'error' ? 'error' : ''}" style="left:${(100 * s.offset_ms / total).toFixed(2)}%;width:${(100 * s.duration_ms / total).toFixed(2)}%"></div>
+            </div>
+            <span class="wf-ms">${s.duration_ms.toFixed(1)} ms</span>
+          </div>
+        `).join('')}
+      `;
+      loadTraces();
+    }
+
     async function loadInitial() {
       const [agents, perf, chats] = await Promise.all([
         fetch('/api/agents').then(r => r.json()),
@@ -279,6 +412,7 @@ _INDEX_HTML = """
       renderAgents(agents);
       renderPerf(perf);
       renderChats(chats);
+      loadTraces();
     }
 
     window.addEventListener('load', () => { connect(); loadInitial(); });
@@ -298,6 +432,11 @@ _INDEX_HTML = """
       <div class="section-title">System Events</div>
       <div id="events" class="logs muted">Live via WS...</div>
     </div>
+    <div class="card" style="grid-column: 1 / -1;">
+      <div class="section-title">Request Traces</div>
+      <div id="traces" class="logs"></div>
+      <div id="waterfall" class="waterfall"></div>
+    </div>
     <div class="card" style="grid-column: 1 / -1;">
       <div class="section-title">Chat Logs</div>
       <div id="chats" class="logs"></div>
@@ -106,38 +106,13 @@ hot_reload = true
                             )
                             for s in services
                         ]
-                        # Create migrations directory with initial file
+                        # Write the conversation schema migrations (run by initdb)
+                        from l6e_forge.memory.conversation.schema import MIGRATIONS
+
                         mig_dir = root / "migrations"
                         mig_dir.mkdir(parents=True, exist_ok=True)
-                        (mig_dir / "0001_init.sql").write_text(
-                            (
-                                """
--- Create schema and tables for conversation/message persistence
-create schema if not exists forge;
-
-create table if not exists forge.conversations (
-  conversation_id uuid primary key,
-  agent_id text,
-  user_id text,
-  started_at timestamptz default now(),
-  last_activity timestamptz default now(),
-  message_count integer default 0
-);
-
-create table if not exists forge.messages (
-  message_id uuid primary key,
-  conversation_id uuid not null references forge.conversations(conversation_id) on delete cascade,
-  role text not null,
-  content text not null,
-  timestamp timestamptz not null default now(),
-  metadata jsonb default '{}'::jsonb
-);
-
-create index if not exists idx_messages_conversation_ts on forge.messages (conversation_id, timestamp desc);
-"""
-                            ).strip(),
-                            encoding="utf-8",
-                        )
+                        for name, sql in MIGRATIONS:
+                            (mig_dir / f"{name}.sql").write_text(sql, encoding="utf-8")
                     compose_text = await svc.generate(services)
                     target_cp.write_text(compose_text, encoding="utf-8")
             except Exception:
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from l6e_forge.runtime.scheduler import AgentOverloadedError, AgentScheduler
+
+
+@pytest.mark.asyncio
+async def test_limits_concurrency_and_rejects_when_queue_full() -> None:
+    sched = AgentScheduler("a", max_concurrency=2, max_queue_size=1)
+    release = asyncio.Event()
+    peak = 0
+
+    async def job() -> None:
+        nonlocal peak
+        async with sched.slot("c"):
+            peak = max(peak, sched.stats()["active"])
+            await release.wait()
+
+    tasks = [asyncio.create_task(job()) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert sched.stats()["queued"] == 1
+    with pytest.raises(AgentOverloadedError):
+        async with sched.slot("c"):
+            pass
+    release.set()
+    await asyncio.gather(*tasks)
+    stats = sched.stats()
+    assert peak == 2
+    assert stats["active"] == 0 and stats["queued"] == 0
+    assert stats["admitted"] == 3 and stats["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_round_robin_across_conversations() -> None:
+    sched = AgentScheduler("a", max_concurrency=1, max_queue_size=10)
+    order: list[str] = []
+    gate = asyncio.Event()
+
+    async def job(conv: str, tag: str) -> None:
+        async with sched.slot(conv):
+            order.append(tag)
+            await gate.wait()
+
+    holder = asyncio.create_task(job("busy", "hold"))
+    await asyncio.sleep(0)
+    # A busy conversation enqueues three requests before a second one arrives
+    tasks = [asyncio.create_task(job("busy", f"b{i}")) for i in range(3)]
+    tasks.append(asyncio.create_task(job("quiet", "q0")))
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(holder, *tasks)
+    assert order == ["hold", "b0", "q0", "b1", "b2"]
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_and_cancellation_free_the_queue() -> None:
+    sched = AgentScheduler(
+        "a", max_concurrency=1, max_queue_size=2, queue_timeout_s=0.05
+    )
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with sched.slot("x"):
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    with pytest.raises(AgentOverloadedError):
+        async with sched.slot("y"):
+            pass
+    cancelled = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert sched.stats()["queued"] == 0
+    release.set()
+    await holder
+    assert sched.stats()["active"] == 0
+    assert sched.stats()["timed_out"] == 1
+
+
+def test_from_config_reads_behavior_table() -> None:
+    behavior = {"max_concurrency": 1, "max_queue_size": 0, "queue_timeout": 0}
+    sched = AgentScheduler.from_config("a", {"behavior": behavior})
+    assert sched.max_concurrency == 1
+    assert sched.max_queue_size == 0
+    assert sched.queue_timeout_s is None
+
+
+@pytest.mark.asyncio
+async def test_rejected_message_is_not_stored_in_history() -> None:
+    import uuid
+    from typing import cast
+
+    from l6e_forge.core.agents.base import IAgent
+    from l6e_forge.runtime.local import LocalRuntime
+    from l6e_forge.types.core import Message
+
+    rt = LocalRuntime()
+    aid = uuid.uuid4()
+    rt._id_to_name[aid] = "a"
+    rt._schedulers[aid] = AgentScheduler("a", max_concurrency=1, max_queue_size=0)
+    rt._id_to_agent[aid] = cast(IAgent, object())
+    cid = uuid.uuid4()
+    async with rt._scheduler(aid).slot(cid):
+        with pytest.raises(AgentOverloadedError):
+            await rt.route_message(Message(content="hi", role="user"), aid, cid)
+    assert await rt.get_memory_manager().get_conversation(cid) == []
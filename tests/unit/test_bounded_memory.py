@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from l6e_forge.memory.managers.bounded import LRUStore, MemoryLimits
+from l6e_forge.memory.managers.memory import MemoryManager
+from l6e_forge.types.core import Message
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_store_evicts_by_count_bytes_and_idle_ttl() -> None:
+    clock = _Clock()
+    store: LRUStore[str, str] = LRUStore(
+        max_entries=3, max_bytes=10, ttl_s=60, sizeof=len, clock=clock
+    )
+    for key in ("a", "b", "c"):
+        store.set(key, "xx")
+    store.get("a")  # a becomes most recently used
+    store.set("d", "xx")
+    assert "b" not in store and "a" in store
+    store.set("e", "xxxxxx")  # 2 + 2 + 2 + 6 > 10 bytes
+    assert store.stats()["bytes"] <= 10 and "e" in store
+    clock.now = 61
+    assert store.get("e") is None
+    assert store.purge_expired() >= 1
+    assert len(store) == 0 and store.stats()["bytes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_manager_bounds_conversations_and_sessions() -> None:
+    limits = MemoryLimits(
+        max_messages_per_conversation=5, max_conversations=2, max_sessions=1
+    )
+    mm = MemoryManager(limits=limits)
+    cids = [uuid.uuid4() for _ in range(3)]
+    for cid in cids:
+        for i in range(8):
+            await mm.store_conversation(cid, Message(content=f"m{i}", role="user"))
+    recent = await mm.get_conversation(cids[-1], limit=50)
+    assert [m.content for m in recent] == ["m3", "m4", "m5", "m6", "m7"]
+    assert await mm.get_conversation(cids[0]) == []
+
+    await mm.store_session("s1", "k", "v" * 100)
+    await mm.store_session("s2", "k", "v")
+    assert await mm.get_session("s1", "k") is None
+    await mm.store_kv("ns", "k", {"a": 1})
+
+    stats = mm.stats()
+    assert stats["conversations"]["entries"] == 2
+    assert stats["conversations"]["messages"] == 10
+    assert stats["conversations"]["evicted"] == 1
+    assert stats["sessions"]["entries"] == 1
+    assert stats["kv"]["entries"] == 1
+    assert stats["approx_bytes"] > 0
+    await mm.clear_session("s2")
+    assert mm.stats()["sessions"]["bytes"] == 0
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from typing import cast
+
+import pytest
+
+from l6e_forge.core.agents.base import IAgent
+from l6e_forge.runtime.local import LocalRuntime
+from l6e_forge.types.core import AgentResponse, Message
+
+
+class _SleepyAgent:
+    def __init__(self, name: str, delay: float, fail: bool = False) -> None:
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.cancelled = False
+
+    async def handle_message(self, message, context) -> AgentResponse:
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise RuntimeError("boom")
+        return AgentResponse(content=self.name, agent_id=self.name, response_time=0.0)
+
+
+def _runtime(*agents: _SleepyAgent) -> LocalRuntime:
+    rt = LocalRuntime()
+    for agent in agents:
+        aid = uuid.uuid4()
+        rt._id_to_agent[aid] = cast(IAgent, agent)
+        rt._id_to_name[aid] = agent.name
+    return rt
+
+
+@pytest.mark.asyncio
+async def test_broadcast_runs_agents_concurrently() -> None:
+    rt = _runtime(*(_SleepyAgent(f"a{i}", 0.1) for i in range(5)))
+    start = time.perf_counter()
+    out = await rt.broadcast_message(Message(content="hi", role="user"))
+    elapsed = time.perf_counter() - start
+    assert [r.content for r in out] == [f"a{i}" for i in range(5)]
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_broadcast_returns_partial_results_on_timeout_and_error() -> None:
+    slow = _SleepyAgent("slow", 5.0)
+    rt = _runtime(_SleepyAgent("fast", 0.0), slow, _SleepyAgent("bad", 0.0, fail=True))
+    out = await rt.broadcast_message(Message(content="hi", role="user"), timeout=0.05)
+    assert [r.content for r in out] == ["fast"]
+    assert slow.cancelled
+
+
+@pytest.mark.asyncio
+async def test_broadcast_first_successful_cancels_stragglers() -> None:
+    slow = _SleepyAgent("slow", 5.0)
+    rt = _runtime(slow, _SleepyAgent("bad", 0.0, fail=True), _SleepyAgent("ok", 0.01))
+    start = time.perf_counter()
+    out = await rt.broadcast_message(
+        Message(content="hi", role="user"), first_successful=True
+    )
+    assert [r.content for r in out] == ["ok"]
+    assert slow.cancelled
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+
+import httpx
+import pytest
+
+from l6e_forge.runtime.local import LocalRuntime
+from l6e_forge.runtime.scheduler import AgentScheduler
+from l6e_forge.web.api import app as api_app
+
+_AGENT = """
+from l6e_forge.types.core import AgentResponse
+
+
+class Agent:
+    async def handle_message(self, message, context):
+        return AgentResponse(content="ok", agent_id="echo", response_time=0.0)
+"""
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_rejects_with_http_429(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    agent_dir = tmp_path / "agents" / "echo"
+    agent_dir.mkdir(parents=True)
+    (agent_dir / "agent.py").write_text(_AGENT)
+    rt = LocalRuntime()
+    monkeypatch.setattr(api_app, "_runtime_singleton", rt)
+    aid = await rt.register_agent(agent_dir)
+    rt._schedulers[aid] = AgentScheduler("echo", max_concurrency=1, max_queue_size=0)
+    cid = uuid.uuid4()
+    payload = {
+        "agent": "echo",
+        "message": "hi",
+        "workspace": str(tmp_path),
+        "conversation_id": str(cid),
+    }
+    transport = httpx.ASGITransport(app=api_app.create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://api") as client:
+        async with rt._scheduler(aid).slot(cid):
+            busy = await client.post("/api/chat/stream", json=payload)
+        ok = await client.post("/api/chat/stream", json=payload)
+    assert busy.status_code == 429
+    assert busy.headers["Retry-After"] == "1"
+    assert ok.status_code == 200
+    assert "event: done" in ok.text
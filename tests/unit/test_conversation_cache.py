@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from l6e_forge.memory.conversation.base import MessagePage, paginate
+from l6e_forge.memory.conversation.cache import ConversationCache, message_size
+from l6e_forge.memory.managers.memory import MemoryManager
+from l6e_forge.types.core import Message
+
+
+class _CountingStore:
+    def __init__(self) -> None:
+        self.messages: dict[str, list[Message]] = {}
+        self.reads = 0
+
+    async def connect(self) -> None:
+        return None
+
+    async def store_message(self, conversation_id, message: Message) -> None:
+        self.messages.setdefault(str(conversation_id), []).append(message)
+
+    async def get_messages(self, conversation_id, limit: int = 50) -> list[Message]:
+        self.reads += 1
+        return self.messages.get(str(conversation_id), [])[-limit:]
+
+    async def get_messages_page(
+        self,
+        conversation_id,
+        limit: int = 50,
+        *,
+        before: str | None = None,
+        after: str | None = None,
+    ) -> MessagePage:
+        self.reads += 1
+        return paginate(
+            self.messages.get(str(conversation_id), []),
+            limit,
+            before=before,
+            after=after,
+        )
+
+
+def _msg(text: str) -> Message:
+    return Message(content=text, role="user")
+
+
+@pytest.mark.asyncio
+async def test_store_is_read_only_for_cold_conversations() -> None:
+    store = _CountingStore()
+    cid = uuid.uuid4()
+    store.messages[str(cid)] = [_msg("old-1"), _msg("old-2")]
+    mm = MemoryManager(
+        conversation_store=store, conversation_cache=ConversationCache(window=3)
+    )
+    for i in range(4):
+        await mm.store_conversation(cid, _msg(f"new-{i}"))
+        history = await mm.get_conversation(cid, limit=3)
+    assert store.reads == 1
+    assert [m.content for m in history] == ["new-1", "new-2", "new-3"]
+    # Larger windows than the cache holds go to the store
+    assert len(await mm.get_conversation(cid, limit=10)) == 6
+    assert store.reads == 2
+
+
+def test_lru_eviction_respects_byte_budget() -> None:
+    one = message_size(_msg("x" * 100))
+    cache = ConversationCache(window=10, max_bytes=one * 2)
+    a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    for cid in (a, b):
+        cache.begin_load(cid)
+        cache.finish_load(cid, [_msg("x" * 100)])
+    assert cache.get(a, 1) is not None  # a is now most recently used
+    cache.begin_load(c)
+    cache.finish_load(c, [_msg("x" * 100)])
+    assert cache.get(b, 1) is None
+    assert cache.get(a, 1) is not None and cache.get(c, 1) is not None
+    assert cache.stats()["bytes"] <= one * 2
+    assert cache.stats()["evictions"] == 1
+
+
+def test_writes_during_load_are_kept_and_ring_is_bounded() -> None:
+    cache = ConversationCache(window=2)
+    cid = uuid.uuid4()
+    cache.begin_load(cid)
+    late = _msg("late")
+    cache.append(cid, late)
+    cache.finish_load(cid, [_msg("a")])
+    loaded = cache.get(cid, 2)
+    assert loaded is not None
+    assert [m.content for m in loaded] == ["a", "late"]
+    cache.append(cid, _msg("b"))
+    ring = cache.get(cid, 2)
+    assert ring is not None
+    assert [m.content for m in ring] == ["late", "b"]
+    assert cache.stats()["bytes"] == message_size(late) + message_size(_msg("b"))
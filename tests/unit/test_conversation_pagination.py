@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from l6e_forge.memory.conversation.base import START_CURSOR, decode_cursor, paginate
+from l6e_forge.memory.conversation.provider import ConversationHistoryProvider
+from l6e_forge.memory.managers.memory import MemoryManager
+from l6e_forge.types.core import Message
+
+
+def _history(n: int, same_timestamp_every: int = 1) -> list[Message]:
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    return [
+        Message(
+            content=f"m{i}",
+            role="user",
+            timestamp=base + timedelta(seconds=i // same_timestamp_every),
+        )
+        for i in range(n)
+    ]
+
+
+def test_pages_walk_backwards_and_forwards_without_gaps() -> None:
+    # Several messages share a timestamp so message_id must break ties
+    msgs = _history(23, same_timestamp_every=4)
+    ordered = sorted(msgs, key=lambda m: (m.timestamp, str(m.message_id)))
+    seen: list[Message] = []
+    page = paginate(msgs, 5)
+    while True:
+        seen = page.messages + seen
+        if page.next_cursor is None:
+            break
+        page = paginate(msgs, 5, before=page.next_cursor)
+    assert seen == ordered
+
+    forward: list[Message] = []
+    cursor: str | None = START_CURSOR
+    while cursor is not None:
+        page = paginate(msgs, 7, after=cursor)
+        forward += page.messages
+        cursor = page.next_cursor
+    assert forward == ordered
+
+
+def test_invalid_cursor_and_conflicting_directions_raise() -> None:
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+    with pytest.raises(ValueError):
+        paginate([], 5, before="a", after="b")
+
+
+@pytest.mark.asyncio
+async def test_history_provider_iterates_whole_conversation() -> None:
+    mm = MemoryManager()
+    cid = uuid.uuid4()
+    msgs = _history(12)
+    for m in msgs:
+        await mm.store_conversation(cid, m)
+    provider = ConversationHistoryProvider(mm)
+    assert [m.content async for m in provider.iter_messages(cid, page_size=5)] == [
+        m.content for m in msgs
+    ]
+    newest = [
+        m.content async for m in provider.iter_messages(cid, 5, newest_first=True)
+    ]
+    assert newest == [m.content for m in reversed(msgs)]
+    page = await provider.get_page(cid, 5)
+    assert [m.content for m in page.messages] == ["m7", "m8", "m9", "m10", "m11"]
+    older = await provider.get_page(cid, 5, before=page.next_cursor)
+    assert [m.content for m in older.messages] == ["m2", "m3", "m4", "m5", "m6"]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from l6e_forge.memory.embeddings.batching import MicroBatcher
+
+
+class _FakeBackend:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls: list[list[str]] = []
+        self.fail = fail
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("embedding server down")
+        return [[float(len(t))] for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch() -> None:
+    backend = _FakeBackend()
+    batcher = MicroBatcher(backend.embed_batch, window_ms=20)
+    texts = ["a", "bb", "ccc", "bb", "a"]
+    out = await asyncio.gather(*(batcher.embed(t) for t in texts))
+    assert out == [[1.0], [2.0], [3.0], [2.0], [1.0]]
+    # Duplicates are coalesced and everything goes out in a single call
+    assert backend.calls == [["a", "bb", "ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_flushes_early_and_inflight_is_reused() -> None:
+    backend = _FakeBackend()
+    batcher = MicroBatcher(backend.embed_batch, window_ms=1000, max_batch_size=2)
+    first = asyncio.gather(batcher.embed("x"), batcher.embed("yy"))
+    await asyncio.sleep(0)
+    # "x" is already in flight; it must not be requested again
+    again = await batcher.embed("x")
+    assert await first == [[1.0], [2.0]]
+    assert again == [1.0]
+    assert backend.calls == [["x", "yy"]]
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_every_waiter() -> None:
+    batcher = MicroBatcher(_FakeBackend(fail=True).embed_batch, window_ms=1)
+    results = await asyncio.gather(
+        batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
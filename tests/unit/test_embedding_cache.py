@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from l6e_forge.memory.embeddings.cache import CachedEmbeddingProvider
+from l6e_forge.memory.embeddings.mock import MockEmbeddingProvider
+
+
+class _CountingProvider(MockEmbeddingProvider):
+    def __init__(self) -> None:
+        super().__init__(dim=8)
+        self.model = "mock-8"
+        self.embedded: list[str] = []
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return super().embed_batch(texts)
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_skip_provider_and_dedupe() -> None:
+    inner = _CountingProvider()
+    cache = CachedEmbeddingProvider(inner)
+    first = await cache.aembed_batch(["alpha", "beta", "alpha"])
+    second = await cache.aembed("beta")
+    assert inner.embedded == ["alpha", "beta"]
+    assert second == first[1]
+    stats = cache.stats()
+    assert stats["misses"] == 2 and stats["hits"] == 1
+    # Sync path shares the same cache
+    assert cache.embed("alpha") == first[0]
+    assert inner.embedded == ["alpha", "beta"]
+
+
+def test_lru_evicts_by_bytes() -> None:
+    inner = _CountingProvider()
+    # Room for roughly two 8-dim float32 entries
+    cache = CachedEmbeddingProvider(inner, max_bytes=2 * (8 * 4 + 200))
+    cache.embed_batch(["a", "b", "c"])
+    assert cache.stats()["entries"] == 2
+    cache.embed("a")  # evicted, re-embedded
+    assert inner.embedded == ["a", "b", "c", "a"]
+
+
+def test_disk_tier_survives_restart(tmp_path: Path) -> None:
+    db = tmp_path / "cache" / "embeddings.sqlite3"
+    inner = _CountingProvider()
+    cache = CachedEmbeddingProvider(inner, disk_path=db)
+    vec = cache.embed("persist me")
+    cache.close()
+
+    inner2 = _CountingProvider()
+    cache2 = CachedEmbeddingProvider(inner2, disk_path=db)
+    assert cache2.embed("persist me") == pytest.approx(vec)
+    assert inner2.embedded == []
+    assert cache2.stats()["disk_hits"] == 1
+    cache2.close()
+
+
+def test_sync_path_without_loop_only_counts(monkeypatch: pytest.MonkeyPatch) -> None:
+    from l6e_forge.monitor.inmemory import InMemoryMonitoringService
+    from l6e_forge.runtime import monitoring
+
+    mon = InMemoryMonitoringService()
+    monkeypatch.setattr(monitoring, "_monitoring_singleton", mon)
+    cache = CachedEmbeddingProvider(_CountingProvider())
+    cache.embed_batch(["a", "b"])
+    cache.embed("a")
+    assert cache.stats()["misses"] == 2 and cache.stats()["hits"] == 1
+    assert mon.get_metrics("embedding_cache_misses") == []
+
+
+@pytest.mark.asyncio
+async def test_sync_embed_in_worker_thread_reports_on_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import asyncio
+    import threading
+
+    from l6e_forge.monitor.inmemory import InMemoryMonitoringService
+    from l6e_forge.runtime import monitoring
+
+    mon = InMemoryMonitoringService()
+    monkeypatch.setattr(monitoring, "_monitoring_singleton", mon)
+    recorded_on: set[int] = set()
+    record_metric = mon.record_metric
+
+    async def spy(name: str, value: float, tags: dict[str, str] | None = None) -> None:
+        recorded_on.add(threading.get_ident())
+        await record_metric(name, value, tags)
+
+    monkeypatch.setattr(mon, "record_metric", spy)
+    cache = CachedEmbeddingProvider(_CountingProvider())
+    await asyncio.to_thread(cache.embed_batch, ["a", "b"])
+    await asyncio.to_thread(cache.embed, "a")
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert recorded_on == {threading.get_ident()}
+    assert [m["value"] for m in mon.get_metrics("embedding_cache_misses")] == [2.0]
+    assert [m["value"] for m in mon.get_metrics("embedding_cache_hits")] == [1.0]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from l6e_forge.memory.embeddings.discovery import (
+    DiscoveredEmbeddingProvider,
+    load_embedding_settings,
+)
+from l6e_forge.memory.embeddings.mock import MockEmbeddingProvider
+from l6e_forge.runtime.http import HttpClientPool
+from l6e_forge.runtime.local import LocalRuntime
+
+ENDPOINTS = {"ollama": "http://ollama.test", "lmstudio": "http://lmstudio.test/v1"}
+
+
+class _Named(MockEmbeddingProvider):
+    def __init__(self, name: str) -> None:
+        super().__init__(dim=8)
+        self.name = name
+
+
+def _discovery(handler, **kwargs):
+    pool = HttpClientPool(transport=httpx.MockTransport(handler))
+    factories = {
+        "ollama": lambda: _Named("ollama"),
+        "lmstudio": lambda: _Named("lmstudio"),
+        "mock": lambda: _Named("mock"),
+    }
+    disc = DiscoveredEmbeddingProvider(factories, ENDPOINTS, http=pool, **kwargs)
+    return disc, pool
+
+
+@pytest.mark.asyncio
+async def test_probes_run_concurrently_and_pick_first_reachable() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        if request.url.host == "ollama.test":
+            return httpx.Response(503)
+        return httpx.Response(200, json={"data": []})
+
+    disc, pool = _discovery(handler)
+    start = time.perf_counter()
+    await disc.aembed("hello")
+    assert time.perf_counter() - start < 0.19
+    assert disc.selected == "lmstudio"
+    status = disc.status()
+    assert status["probes"]["ollama"]["error"] == "HTTP 503"
+    assert status["probes"]["lmstudio"]["reachable"] is True
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_override_skips_probing() -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200)
+
+    disc, pool = _discovery(handler, override="mock")
+    disc.start()
+    await disc.aembed_batch(["a", "b"])
+    assert disc.selected == "mock" and calls == 0
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_fallback_upgrades_after_ttl_but_real_choice_is_sticky() -> None:
+    up = False
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200 if up else 503)
+
+    disc, pool = _discovery(handler, ttl_s=0.0)
+    await disc.aembed("x")
+    assert disc.selected == "mock"
+    up = True
+    await disc.aembed("x")  # stale: schedules a background re-probe
+    await asyncio.sleep(0.05)
+    assert disc.selected == "ollama"
+    up = False
+    await disc.aembed("x")
+    await asyncio.sleep(0.05)
+    assert disc.selected == "ollama"
+    await pool.aclose()
+
+
+def test_settings_from_forge_toml_and_env(tmp_path, monkeypatch) -> None:
+    (tmp_path / "forge.toml").write_text(
+        '[memory]\nembedding_provider = "Ollama"\nprobe_ttl_seconds = 30\n'
+    )
+    monkeypatch.delenv("AF_EMBEDDING_PROVIDER", raising=False)
+    assert load_embedding_settings(tmp_path) == {"provider": "ollama", "ttl_s": 30.0}
+    monkeypatch.setenv("AF_EMBEDDING_PROVIDER", "mock")
+    assert load_embedding_settings(tmp_path)["provider"] == "mock"
+
+
+def test_memory_manager_cold_start_does_no_io() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("no probe expected while building the manager")
+
+    pool = HttpClientPool(transport=httpx.MockTransport(handler))
+    LocalRuntime(http=pool).get_memory_manager()  # warm module imports
+    rt = LocalRuntime(http=pool)
+    start = time.perf_counter()
+    rt.get_memory_manager()
+    assert time.perf_counter() - start < 0.1
+    assert rt.get_embedding_status()["selected"] is None
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from l6e_forge.runtime.http import HttpClientPool
+
+
+def _pool() -> HttpClientPool:
+    return HttpClientPool(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+
+
+@pytest.mark.asyncio
+async def test_async_clients_are_shared_per_origin() -> None:
+    pool = _pool()
+    a = pool.async_client("http://localhost:11434/api/chat")
+    b = pool.async_client("http://LOCALHOST:11434")
+    c = pool.async_client("http://localhost:6333")
+    assert a is b
+    assert a is not c
+    await pool.aclose()
+    assert a.is_closed and c.is_closed
+    # The pool is reusable after close
+    assert not pool.async_client("http://localhost:11434").is_closed
+    await pool.aclose()
+
+
+def test_async_clients_rebind_to_new_event_loop() -> None:
+    pool = _pool()
+
+    async def grab() -> httpx.AsyncClient:
+        client = pool.async_client("http://localhost:11434")
+        r = await client.get("http://localhost:11434/api/version")
+        assert r.status_code == 200
+        return client
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert first is not second
+    sync = pool.sync_client("http://localhost:11434")
+    assert sync is pool.sync_client("http://localhost:11434/api/tags")
+    pool.close()
+    assert sync.is_closed
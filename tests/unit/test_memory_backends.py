@@ -1,6 +1,11 @@
+import asyncio
+import time
+
+import numpy as np
 import pytest
 
 from l6e_forge.memory.backends.inmemory import InMemoryVectorStore
+from l6e_forge.memory.backends.ivf import IVFConfig
 
 
 @pytest.mark.asyncio
@@ -46,3 +51,222 @@ async def test_inmemory_explicit_collection_roundtrip() -> None:
     assert key == "k2"
     assert item.content == "world"
     assert item.metadata.get("y") == 2
+
+
+@pytest.mark.asyncio
+async def test_inmemory_topk_ordering_and_overwrite() -> None:
+    store = InMemoryVectorStore()
+    for i in range(200):
+        await store.upsert(
+            namespace="agentC:long",
+            key=f"k{i}",
+            embedding=[1.0, i / 200.0],
+            content=str(i),
+        )
+    # Overwrite in place keeps one row per key
+    await store.upsert(
+        namespace="agentC:long", key="k0", embedding=[0.0, 1.0], content="updated"
+    )
+    out = await store.query(
+        namespace="agentC:long", query_embedding=[0.0, 1.0], limit=3
+    )
+    assert [k for k, _s, _i in out] == ["k0", "k199", "k198"]
+    assert out[0][2].content == "updated"
+    assert out[0][1] == pytest.approx(1.0, abs=1e-6)
+    scores = [s for _k, s, _i in out]
+    assert scores == sorted(scores, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_inmemory_expired_items_are_compacted() -> None:
+    store = InMemoryVectorStore()
+    for i in range(100):
+        await store.upsert(
+            namespace="agentD:short",
+            key=f"tmp{i}",
+            embedding=[1.0, 0.0],
+            content="tmp",
+            ttl_seconds=-1,
+        )
+    await store.upsert(
+        namespace="agentD:short", key="keep", embedding=[1.0, 0.0], content="keep"
+    )
+    out = await store.query(
+        namespace="agentD:short", query_embedding=[1.0, 0.0], limit=10
+    )
+    assert [k for k, _s, _i in out] == ["keep"]
+    index = store._namespaces["agentD:short"]  # type: ignore[attr-defined]
+    assert len(index) == 1
+    assert index._size == 1  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_inmemory_reaper_reclaims_unqueried_namespaces() -> None:
+    store = InMemoryVectorStore(reap_interval_s=0.01)
+    for i in range(50):
+        await store.upsert("agentE:idle", f"k{i}", [1.0, 0.0], "tmp", ttl_seconds=0)
+    await store.upsert("agentE:mixed", "old", [1.0, 0.0], "old", ttl_seconds=0)
+    await store.upsert("agentE:mixed", "keep", [0.0, 1.0], "keep", ttl_seconds=3600)
+    # Re-upserting without a TTL makes the pending expiry entry stale
+    await store.upsert("agentE:idle", "k0", [1.0, 0.0], "pinned")
+    await asyncio.sleep(0.05)
+    assert store.stats()["reaped"] == 50
+    assert len(store._namespaces["agentE:idle"]) == 1  # type: ignore[attr-defined]
+    out = await store.query("agentE:mixed", [1.0, 0.0], limit=5)
+    assert [k for k, _s, _i in out] == ["keep"]
+    assert store.stats()["next_expiry"] is not None
+    await store.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_inmemory_snapshot_roundtrip_is_memory_mapped(tmp_path) -> None:
+    store = InMemoryVectorStore()
+    await store.upsert("agentF", "a", [1.0, 0.0], "alpha", metadata={"lang": "en"})
+    await store.upsert("agentF", "b", [0.0, 1.0], "beta", ttl_seconds=3600)
+    await store.upsert("agentG", "c", [0.6, 0.8, 0.0], "gamma", collection="docs")
+    await store.save_snapshot(tmp_path)
+    await store.upsert("agentF", "a", [0.0, 1.0], "newer")
+    await store.save_snapshot(tmp_path)  # replaces the previous generation
+    assert len(list(tmp_path.glob("*.npy"))) == 2
+
+    restored = InMemoryVectorStore()
+    assert await restored.load_snapshot(tmp_path) == 3
+    index = restored._namespaces["agentF"]  # type: ignore[attr-defined]
+    assert isinstance(index._matrix, np.memmap)  # type: ignore[attr-defined]
+    out = await restored.query("agentF", [0.0, 1.0], limit=2)
+    assert {k for k, _s, _i in out} == {"a", "b"}
+    assert out[0][2].content in ("newer", "beta")
+    assert restored.stats()["expiry_index"] == 1
+    # First write copies the mapped namespace instead of touching the file
+    await restored.upsert("agentF", "d", [1.0, 0.0], "delta", metadata={"x": 1})
+    out = await restored.query("agentF", [1.0, 0.0], limit=1)
+    assert out[0][0] == "d" and out[0][2].metadata == {"x": 1}
+    hits = await restored.query("agentG", [0.6, 0.8, 0.0], "docs", limit=1)
+    assert hits[0][0] == "c"
+    await restored.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_inmemory_ivf_index_matches_exact_scan_and_tracks_updates() -> None:
+    rng = np.random.default_rng(1)
+    centres = rng.normal(size=(40, 16))
+    data = centres[rng.integers(0, 40, 2000)] + 0.2 * rng.normal(size=(2000, 16))
+    exact = InMemoryVectorStore()
+    ann = InMemoryVectorStore(ann=IVFConfig(min_rows=500, nprobe=8))
+    for i, vec in enumerate(data.tolist()):
+        await exact.upsert("kb", f"k{i}", vec, "c")
+        await ann.upsert("kb", f"k{i}", vec, "c")
+    recalls = []
+    for q in data[:50].tolist():
+        want = {k for k, _s, _i in await exact.query("kb", q, limit=10)}
+        got = {k for k, _s, _i in await ann.query("kb", q, limit=10)}
+        recalls.append(len(want & got) / 10)
+    assert np.mean(recalls) >= 0.95
+    stats = ann.stats()["indexes"]["kb"]
+    assert stats["index"] == "ivf" and stats["ready"] and stats["tail"] == 0
+    # Moving an indexed vector and adding new ones lands them in the scanned tail
+    target = (-data[0]).tolist()
+    await ann.upsert("kb", "k1", target, "moved")
+    await ann.upsert("kb", "fresh", target, "fresh")
+    top = await ann.query("kb", target, limit=2)
+    assert {k for k, _s, _i in top} == {"k1", "fresh"}
+    keys = [k for k, _s, _i in await ann.query("kb", target, limit=500)]
+    assert len(keys) == len(set(keys))  # the stale k1 row is never returned
+    ann.configure_namespace("kb", ann=None)
+    assert ann.stats()["indexes"]["kb"]["index"] == "flat"
+
+
+@pytest.mark.asyncio
+async def test_inmemory_int8_quantization_keeps_ranking(tmp_path) -> None:
+    rng = np.random.default_rng(2)
+    data = rng.normal(size=(1000, 64))
+    full = InMemoryVectorStore()
+    small = InMemoryVectorStore(
+        quantization="int8", ann=IVFConfig(min_rows=200, nprobe=64)
+    )
+    for i, vec in enumerate(data.tolist()):
+        await full.upsert("kb", f"k{i}", vec, "c")
+        await small.upsert("kb", f"k{i}", vec, "c")
+    recalls = []
+    for q in rng.normal(size=(30, 64)).tolist():
+        want = {k for k, _s, _i in await full.query("kb", q, limit=10)}
+        got = {k for k, _s, _i in await small.query("kb", q, limit=10)}
+        recalls.append(len(want & got) / 10)
+    assert np.mean(recalls) >= 0.95
+    assert small.stats()["indexes"]["kb"]["bytes_per_vector"] == 68
+    assert full.stats()["indexes"]["kb"]["bytes_per_vector"] == 256
+    assert small.stats()["vector_bytes"] < full.stats()["vector_bytes"] / 3
+    # Snapshots always hold float32 and are re-encoded on load
+    await small.save_snapshot(tmp_path)
+    restored = InMemoryVectorStore(quantization="int8")
+    await restored.load_snapshot(tmp_path)
+    top = await restored.query("kb", data[7].tolist(), limit=1)
+    assert top[0][0] == "k7" and top[0][1] == pytest.approx(1.0, abs=1e-2)
+    with pytest.raises(ValueError):
+        InMemoryVectorStore(quantization="pq4")
+
+
+@pytest.mark.asyncio
+async def test_inmemory_query_many_matches_individual_queries() -> None:
+    store = InMemoryVectorStore()
+    await store.upsert("nsA", "a1", [1.0, 0.0, 0.0], "a1")
+    await store.upsert("nsA", "a2", [0.5, 0.5, 0.0], "a2")
+    await store.upsert("nsB", "b1", [0.0, 1.0, 0.0], "b1", collection="colB")
+    q = [1.0, 0.2, 0.0]
+    batched = await store.query_many(
+        [
+            ("nsA", "default", 1),
+            ("nsB", "colB", 5),
+            ("nsA", "default", 5),
+            ("nsX", "default", 3),
+        ],
+        q,
+    )
+    assert [[k for k, _s, _i in rows] for rows in batched] == [
+        ["a1"],
+        ["b1"],
+        ["a1", "a2"],
+        [],
+    ]
+    single = await store.query("nsA", q, limit=5)
+    assert [(k, s) for k, s, _i in single] == [(k, s) for k, s, _i in batched[2]]
+
+
+@pytest.mark.asyncio
+async def test_inmemory_metadata_filters_apply_before_top_k() -> None:
+    store = InMemoryVectorStore(ann=IVFConfig(min_rows=100, nprobe=2))
+    for i in range(400):
+        meta = {
+            "kind": "doc" if i % 40 == 0 else "chat",
+            "rank": i,
+            "tags": ["even" if i % 2 == 0 else "odd"],
+            "source": {"lang": "fr" if i % 3 == 0 else "en"},
+        }
+        await store.upsert("kb", f"k{i}", [1.0, i / 400.0], "c", metadata=meta)
+    # Ten rare docs; an unfiltered top-5 would contain none of them
+    out = await store.query("kb", [0.0, 1.0], limit=5, filters={"kind": "doc"})
+    assert [k for k, _s, _i in out] == ["k360", "k320", "k280", "k240", "k200"]
+    out = await store.query(
+        "kb",
+        [0.0, 1.0],
+        limit=50,
+        filters={"rank": {"gte": 10, "lt": 20}, "tags": "even", "source.lang": ["fr"]},
+    )
+    assert sorted(k for k, _s, _i in out) == ["k12", "k18"]
+    # Updates and deletes are reflected in the filter index
+    await store.upsert("kb", "k360", [1.0, 0.9], "c", metadata={"kind": "chat"})
+    await store.upsert(
+        "kb", "k320", [1.0, 0.8], "c", metadata={"kind": "doc"}, ttl_seconds=1
+    )
+    store.reap_expired(now=time.time() + 5)
+    out = await store.query("kb", [0.0, 1.0], limit=2, filters={"kind": {"eq": "doc"}})
+    assert [k for k, _s, _i in out] == ["k280", "k240"]
+    batched = await store.query_many(
+        [("kb", "default", 3), ("missing", "default", 3)],
+        [0.0, 1.0],
+        filters={"kind": "doc"},
+    )
+    assert [k for k, _s, _i in batched[0]] == ["k280", "k240", "k200"]
+    assert batched[1] == []
+    with pytest.raises(ValueError):
+        await store.query("kb", [0.0, 1.0], filters={"rank": {"near": 3}})
@@ -41,3 +41,33 @@ async def test_manager_explicit_collection_passthrough() -> None:
         namespace="agentX:short", query="vector", limit=5, collection="colA"
     )
     assert any(r.key == "m1" for r in out)
+
+
+@pytest.mark.asyncio
+async def test_store_vectors_bulk_batches_and_reports_progress() -> None:
+    class CountingEmbedder(MockEmbeddingProvider):
+        def __init__(self) -> None:
+            super().__init__(dim=16)
+            self.batch_sizes: list[int] = []
+
+        def embed_batch(self, texts: list[str]) -> list[list[float]]:
+            self.batch_sizes.append(len(texts))
+            return super().embed_batch(texts)
+
+    embedder = CountingEmbedder()
+    mm = MemoryManager(InMemoryVectorStore(), embedder=embedder)
+    docs = ((f"d{i}", f"doc number {i}", {"i": i}) for i in range(10))
+    progress: list[int] = []
+    report = await mm.store_vectors_bulk(
+        "bulk",
+        docs,
+        batch_size=4,
+        on_progress=lambda b: progress.append(b.processed_count),
+    )
+    assert embedder.batch_sizes == [4, 4, 2]
+    assert progress == [4, 8, 10]
+    assert report.status == "completed"
+    assert report.entry_count == 10 and report.failed_count == 0
+    assert report.items_per_second > 0
+    hits = await mm.search_vectors("bulk", "number 7", limit=10)
+    assert {h.key for h in hits} == {f"d{i}" for i in range(10)}
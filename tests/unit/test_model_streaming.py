@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+import uuid
+from pathlib import Path
+
+import httpx
+import pytest
+
+from l6e_forge.models.managers.lmstudio import LMStudioModelManager
+from l6e_forge.models.managers.ollama import OllamaModelManager
+from l6e_forge.runtime.http import HttpClientPool
+from l6e_forge.runtime.local import LocalRuntime
+from l6e_forge.types.core import AgentResponse, Message
+from l6e_forge.types.model import ModelSpec, StreamingChunk
+
+
+def _spec(name: str, provider: str) -> ModelSpec:
+    return ModelSpec(
+        model_id=name, provider=provider, model_name=name, memory_requirement_gb=0.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_ollama_stream_chat_parses_ndjson() -> None:
+    seen: dict = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.update(json.loads(request.content))
+        lines = [
+            {"message": {"role": "assistant", "content": "Hel"}, "done": False},
+            {"message": {"role": "assistant", "content": "lo"}, "done": False},
+            {"message": {"role": "assistant", "content": ""}, "done": True},
+        ]
+        body = "\n".join(json.dumps(line) for line in lines) + "\n"
+        return httpx.Response(200, text=body)
+
+    pool = HttpClientPool(transport=httpx.MockTransport(handler))
+    mgr = OllamaModelManager(endpoint="http://ollama.test", http=pool)
+    model_id = await mgr.load_model(_spec("llama3", "ollama"))
+    chunks = [
+        c
+        async for c in mgr.stream_chat(
+            model_id, [Message(content="hi", role="user")], timeout=5.0
+        )
+    ]
+    assert seen["stream"] is True
+    assert "timeout" not in seen
+    assert [c.content for c in chunks] == ["Hel", "lo", ""]
+    assert [c.chunk_id for c in chunks] == [0, 1, 2]
+    assert chunks[-1].is_complete and not chunks[0].is_complete
+    assert "".join([p async for p in mgr.stream_complete(model_id, "hi")]) == "Hello"
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_ollama_stream_chat_surfaces_errors() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, text='{"error":"model not found"}')
+
+    pool = HttpClientPool(transport=httpx.MockTransport(handler))
+    mgr = OllamaModelManager(endpoint="http://ollama.test", http=pool)
+    model_id = await mgr.load_model(_spec("missing", "ollama"))
+    with pytest.raises(RuntimeError, match="HTTP 404"):
+        async for _ in mgr.stream_chat(model_id, [Message(content="hi", role="user")]):
+            pass
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_lmstudio_stream_chat_parses_sse() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        events = [
+            {"id": "r1", "choices": [{"delta": {"role": "assistant"}}]},
+            {"id": "r1", "choices": [{"delta": {"content": "Hi"}}]},
+            {"id": "r1", "choices": [{"delta": {"content": " there"}}]},
+        ]
+        body = "".join(f"data: {json.dumps(e)}\n\n" for e in events)
+        return httpx.Response(200, text=body + "data: [DONE]\n\n")
+
+    pool = HttpClientPool(transport=httpx.MockTransport(handler))
+    mgr = LMStudioModelManager(endpoint="http://lmstudio.test/v1", http=pool)
+    model_id = await mgr.load_model(_spec("qwen", "lmstudio"))
+    chunks = [
+        c async for c in mgr.stream_chat(model_id, [Message(content="hi", role="user")])
+    ]
+    assert "".join(c.content for c in chunks) == "Hi there"
+    assert chunks[-1].is_complete
+    assert sum(1 for c in chunks if c.is_complete) == 1
+    await pool.aclose()
+
+
+class _BlockingAgent:
+    async def handle_message(self, message, context) -> AgentResponse:
+        return AgentResponse(
+            content=f"echo {message.content}", agent_id="a", response_time=0.0
+        )
+
+
+class _StreamingAgent(_BlockingAgent):
+    async def handle_message_stream(self, message, context):
+        for i, part in enumerate(["a", "b"]):
+            yield StreamingChunk(content=part, request_id="r", chunk_id=i)
+
+
+def _runtime_with(agent) -> tuple[LocalRuntime, uuid.UUID]:
+    rt = LocalRuntime()
+    aid = uuid.uuid4()
+    rt._id_to_agent[aid] = agent
+    rt._id_to_name[aid] = "test"
+    rt._agent_paths[aid] = Path(".")
+    return rt, aid
+
+
+@pytest.mark.asyncio
+async def test_route_message_stream_falls_back_to_handle_message() -> None:
+    rt, aid = _runtime_with(_BlockingAgent())
+    msg = Message(content="x", role="user")
+    chunks = [c async for c in rt.route_message_stream(msg, target=aid)]
+    assert len(chunks) == 1
+    assert chunks[0].content == "echo x" and chunks[0].is_complete
+
+
+@pytest.mark.asyncio
+async def test_route_message_stream_uses_agent_stream_and_completes() -> None:
+    rt, aid = _runtime_with(_StreamingAgent())
+    msg = Message(content="x", role="user")
+    chunks = [c async for c in rt.route_message_stream(msg, target=aid)]
+    assert [c.content for c in chunks] == ["a", "b", ""]
+    assert chunks[-1].is_complete and chunks[-1].chunk_id == 2
@@ -0,0 +1,117 @@
+import math
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from l6e_forge.monitor.inmemory import InMemoryMonitoringService
+from l6e_forge.monitor.metrics import DDSketch, MetricsEngine
+from l6e_forge.monitor.series import MetricColumns, downsample
+
+
+def test_ddsketch_quantiles_are_within_relative_accuracy() -> None:
+    rng = random.Random(0)
+    values = [rng.lognormvariate(3.0, 1.0) for _ in range(20_000)]
+    sketch = DDSketch(relative_accuracy=0.01)
+    for v in values:
+        sketch.add(v)
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[math.ceil(q * len(ordered)) - 1]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.011)
+    assert len(sketch.bins) < 1000
+
+
+def test_ddsketch_nearest_rank_p95() -> None:
+    sketch = DDSketch(relative_accuracy=0.001)
+    for v in range(1, 11):
+        sketch.add(float(v))
+    # ceil(0.95 * 10) = 10th smallest; the old int(n * 0.95) - 1 index gave 9
+    assert sketch.quantile(0.95) == pytest.approx(10.0, rel=1e-3)
+    assert sketch.quantile(0.5) == pytest.approx(5.0, rel=1e-3)
+    assert DDSketch().quantile(0.5) == 0.0
+
+
+def test_metrics_engine_windows_roll_over() -> None:
+    now = [1_000_000.0]
+    engine = MetricsEngine(clock=lambda: now[0])
+    for v in (10.0, 20.0, 30.0):
+        engine.record("latency", v, {"agent": "a"})
+    now[0] += 120
+    engine.record("latency", 100.0, {"agent": "b"})
+    summary = engine.summary("latency")
+    assert summary["count"] == 4
+    assert summary["windows"]["1m"]["count"] == 1
+    assert summary["windows"]["5m"]["count"] == 4
+    assert summary["windows"]["1m"]["p50"] == pytest.approx(100.0, rel=0.01)
+    now[0] += 7200
+    assert engine.summary("latency")["windows"]["1h"]["count"] == 0
+    by_agent = engine.group_by("latency", "agent")
+    assert {k: v["count"] for k, v in by_agent.items()} == {"a": 3, "b": 1}
+
+
+@pytest.mark.asyncio
+async def test_inmemory_monitor_perf_uses_sketches() -> None:
+    mon = InMemoryMonitoringService(max_metrics_per_name=5)
+    for i in range(1, 101):
+        await mon.record_metric(
+            "response_time_ms", float(i), tags={"agent": "a" if i % 2 else "b"}
+        )
+    perf = mon.get_perf_summary()
+    # Summaries cover every point, not just the raw points kept for get_metrics
+    assert perf["count"] == 100
+    assert perf["avg_ms"] == pytest.approx(50.5)
+    assert perf["p95_ms"] == pytest.approx(95.0, rel=0.01)
+    assert perf["windows"]["1m"]["count"] == 100
+    by_agent = mon.get_perf_by_agent()
+    assert by_agent["a"]["count"] == 50 and by_agent["b"]["count"] == 50
+    points = mon.get_metrics("response_time_ms")
+    assert [p["value"] for p in points] == [96.0, 97.0, 98.0, 99.0, 100.0]
+    assert points[0]["tags"] == {"agent": "b"}
+    now = datetime.now()
+    recent = (now - timedelta(minutes=1), now)
+    assert len(mon.get_metrics("response_time_ms", recent)) == 5
+    stale = (now - timedelta(hours=2), now - timedelta(hours=1))
+    assert mon.get_metrics("response_time_ms", stale) == []
+    empty = InMemoryMonitoringService().get_perf_summary()
+    assert empty["count"] == 0 and empty["p95_ms"] == 0.0
+
+
+def test_metric_columns_keep_last_points_sorted() -> None:
+    cols = MetricColumns(capacity=100)
+    for i in range(1000):
+        cols.append(i * 1_000, float(i), i % 3)
+    assert len(cols) == 100
+    ts, values, tags = cols.select()
+    assert values.tolist() == [float(i) for i in range(900, 1000)]
+    ts, values, tags = cols.select(950_000, 959_000)
+    assert values.tolist() == [float(i) for i in range(950, 960)]
+    buckets = downsample(ts, values, 950_000, 5_000)
+    assert buckets == [
+        {"ts_ns": 950_000, "count": 5, "min": 950.0, "max": 954.0, "avg": 952.0},
+        {"ts_ns": 955_000, "count": 5, "min": 955.0, "max": 959.0, "avg": 957.0},
+    ]
+    # A clock step backwards is clamped so the column stays sorted
+    cols.append(5, 1.0, 0)
+    assert cols.select()[0][-1] == 999_000
+    assert cols.nbytes <= 125 * 20
+
+
+@pytest.mark.asyncio
+async def test_inmemory_monitor_metric_series_downsamples() -> None:
+    mon = InMemoryMonitoringService()
+    for i in range(10):
+        agent = "a" if i < 6 else "b"
+        await mon.record_metric("latency", float(i), tags={"agent": agent})
+    end = datetime.now() + timedelta(seconds=1)
+    start = end - timedelta(minutes=10)
+    (bucket,) = mon.get_metric_series("latency", start=start, end=end, buckets=1)
+    assert bucket["count"] == 10 and bucket["min"] == 0.0 and bucket["max"] == 9.0
+    assert bucket["avg"] == pytest.approx(4.5)
+    datetime.fromisoformat(bucket["timestamp"])
+    (only_b,) = mon.get_metric_series(
+        "latency", start=start, end=end, buckets=1, tags={"agent": "b"}
+    )
+    assert only_b["count"] == 4
+    assert mon.get_metric_series("latency", tags={"agent": "zzz"}) == []
+    assert mon.get_metric_series("missing") == []
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from l6e_forge.monitor.inmemory import InMemoryMonitoringService
+from l6e_forge.monitor.subscription import Subscription
+
+
+def _metric(name: str, value: float, **tags: str) -> dict:
+    return {"type": "metric", "data": {"name": name, "value": value, "tags": tags}}
+
+
+def _event(n: int) -> dict:
+    return {"type": "event", "data": {"n": n}}
+
+
+def test_subscription_keeps_every_point_while_there_is_room() -> None:
+    q = Subscription(maxsize=10, policy="coalesce")
+    q.put_nowait(_metric("a", 1))
+    q.put_nowait(_metric("a", 2))
+    assert q.coalesced == 0 and q.dropped == 0
+    assert [q.get_nowait() for _ in range(q.qsize())] == [
+        _metric("a", 1),
+        _metric("a", 2),
+    ]
+
+
+def test_subscription_coalesces_metrics_by_series_when_full() -> None:
+    q = Subscription(maxsize=3, policy="coalesce")
+    q.put_nowait(_metric("a", 1))
+    q.put_nowait(_event(1))
+    q.put_nowait(_metric("a", 2))
+    q.put_nowait(_metric("b", 1))  # full, no queued "b": drops the oldest (a=1)
+    q.put_nowait(_metric("a", 3))  # full: replaces the queued a=2
+    q.put_nowait(_metric("a", 4, tier="disk"))  # other tags: drops event 1
+    assert q.coalesced == 1 and q.dropped == 2
+    assert [q.get_nowait() for _ in range(q.qsize())] == [
+        _metric("a", 3),
+        _metric("b", 1),
+        _metric("a", 4, tier="disk"),
+    ]
+    # Once delivered, a series starts a fresh entry
+    q.put_nowait(_metric("b", 5))
+    assert q.get_nowait() == _metric("b", 5)
+
+
+def test_subscription_drop_policies() -> None:
+    oldest = Subscription(maxsize=2, policy="drop_oldest")
+    newest = Subscription(maxsize=2, policy="drop_newest")
+    for n in range(4):
+        oldest.put_nowait(_event(n))
+        newest.put_nowait(_event(n))
+    assert [oldest.get_nowait()["data"]["n"] for _ in range(2)] == [2, 3]
+    assert [newest.get_nowait()["data"]["n"] for _ in range(2)] == [0, 1]
+    assert oldest.dropped == newest.dropped == 2
+    with pytest.raises(ValueError):
+        Subscription(policy="block")  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_stays_bounded() -> None:
+    mon = InMemoryMonitoringService(subscriber_queue_size=10)
+    stalled = await mon.subscribe()
+    events_only = await mon.subscribe(maxsize=5, policy="drop_oldest")
+    for i in range(1000):
+        await mon.record_metric("response_time_ms", float(i), tags={"agent": "a"})
+        await mon.record_metric("tokens", float(i))
+    await mon.record_event("done", {})
+    # Once full, later points coalesce into the newest queued one per series;
+    # the event then drops the oldest point
+    assert stalled.qsize() == 10
+    queued = [stalled.get_nowait() for _ in range(stalled.qsize())]
+    assert [m["data"]["value"] for m in queued[-3:-1]] == [999.0, 999.0]
+    assert queued[-1]["data"]["event_type"] == "done"
+    assert events_only.qsize() == 5
+    stats = mon.subscriber_stats()
+    assert stats["coalesced_total"] == 2 * 995
+    assert stats["dropped_total"] == 1 + (2001 - 5)
+    await mon.unsubscribe(events_only)
+    await mon.unsubscribe(events_only)
+    assert len(mon.subscriber_stats()["subscribers"]) == 1
+    assert mon.subscriber_stats()["dropped_total"] == 1 + (2001 - 5)
+    # A waiting consumer is woken by the next broadcast
+    waiter = asyncio.create_task(stalled.get())
+    while not stalled.empty():
+        stalled.get_nowait()
+    await asyncio.sleep(0)
+    await mon.record_event("wake", {})
+    assert (await asyncio.wait_for(waiter, timeout=1))["data"]["event_type"] == "wake"
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from l6e_forge.memory.embeddings.ollama import OllamaEmbeddingProvider
+from l6e_forge.runtime.http import HttpClientPool
+
+
+def _provider(handler, **kwargs) -> OllamaEmbeddingProvider:  # noqa: ANN001
+    pool = HttpClientPool(transport=httpx.MockTransport(handler))
+    return OllamaEmbeddingProvider(endpoint="http://ollama.test", http=pool, **kwargs)
+
+
+def _echo_lengths(requests: list[dict]):  # noqa: ANN202
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/embed"
+        body = json.loads(request.content)
+        requests.append(body)
+        return httpx.Response(
+            200, json={"embeddings": [[float(len(t)), 1.0] for t in body["input"]]}
+        )
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_batch_is_split_by_byte_budget_and_order_is_kept() -> None:
+    seen: list[dict] = []
+    provider = _provider(_echo_lengths(seen), max_request_bytes=10)
+    texts = ["aaaa", "bbbb", "cccc", "dd", "eeeeeeeeeeee"]
+    out = await provider.aembed_batch(texts)
+    assert [v[0] for v in out] == [4.0, 4.0, 4.0, 2.0, 12.0]
+    assert [b["input"] for b in seen] == [
+        ["aaaa", "bbbb"],
+        ["cccc", "dd"],
+        ["eeeeeeeeeeee"],
+    ]
+    # Sync path uses the same endpoint and chunking
+    seen.clear()
+    assert [v[0] for v in provider.embed_batch(texts)] == [4.0, 4.0, 4.0, 2.0, 12.0]
+    assert sorted(len(b["input"]) for b in seen) == [1, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_errors_raise_instead_of_zero_vectors() -> None:
+    def failing(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, text='model "nomic-embed-text" not found')
+
+    provider = _provider(failing)
+    with pytest.raises(RuntimeError, match="HTTP 404"):
+        await provider.aembed_batch(["hello"])
+    with pytest.raises(RuntimeError, match="HTTP 404"):
+        provider.embed("hello")
+
+    def short(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"embeddings": [[0.1, 0.2]]})
+
+    with pytest.raises(RuntimeError, match="1 embeddings for 2 inputs"):
+        await _provider(short).aembed_batch(["a", "b"])
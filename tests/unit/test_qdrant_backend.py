@@ -13,3 +13,105 @@ async def test_qdrant_split_collection_namespace() -> None:
     col2, ns2 = qb._split_collection_namespace("agentX:ns")  # type: ignore[attr-defined]
     assert col2 == "default"
     assert ns2 == "agentX:ns"
+
+
+@pytest.mark.asyncio
+async def test_qdrant_query_many_uses_batch_endpoint() -> None:
+    import json
+
+    import httpx
+
+    from l6e_forge.runtime.http import HttpClientPool
+
+    calls: list[tuple[str, dict]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json={"result": {}})
+        body = json.loads(request.content)
+        calls.append((str(request.url), body))
+        result = [
+            [{"id": f"{s['filter']['must'][0]['match']['value']}-1", "score": 0.9}]
+            for s in body["searches"]
+        ]
+        return httpx.Response(200, json={"result": result})
+
+    pool = HttpClientPool(transport=httpx.MockTransport(handler))
+    qb = QdrantVectorStore(endpoint="http://qdrant.test", http=pool)
+    out = await qb.query_many(
+        [
+            ("agentA:ns", "default", 3),
+            ("agentB:ns", "default", 2),
+            ("other::agentC", "default", 1),
+        ],
+        [0.1, 0.2],
+    )
+    await pool.aclose()
+    assert [url for url, _ in calls] == [
+        "http://qdrant.test/collections/default/points/search/batch",
+        "http://qdrant.test/collections/other/points/search/batch",
+    ]
+    assert [len(body["searches"]) for _, body in calls] == [2, 1]
+    assert [[pid for pid, _s, _i in rows] for rows in out] == [
+        ["agentA:ns-1"],
+        ["agentB:ns-1"],
+        ["agentC-1"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_qdrant_query_sends_metadata_filters() -> None:
+    import json
+
+    import httpx
+
+    from l6e_forge.runtime.http import HttpClientPool
+
+    bodies: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json={"result": {}})
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"result": []})
+
+    pool = HttpClientPool(transport=httpx.MockTransport(handler))
+    qb = QdrantVectorStore(endpoint="http://qdrant.test", http=pool)
+    await qb.query(
+        "agentA:ns",
+        [0.1, 0.2],
+        limit=3,
+        filters={"kind": "doc", "tags": ["a", "b"], "rank": {"gte": 2, "lt": 5}},
+    )
+    await pool.aclose()
+    assert bodies[0]["filter"]["must"] == [
+        {"key": "namespace", "match": {"value": "agentA:ns"}},
+        {"key": "metadata.kind", "match": {"value": "doc"}},
+        {"key": "metadata.tags", "match": {"any": ["a", "b"]}},
+        {"key": "metadata.rank", "range": {"gte": 2.0, "lt": 5.0}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_qdrant_bulk_ingest_waits_only_on_last_batch() -> None:
+    import httpx
+
+    from l6e_forge.memory.embeddings.mock import MockEmbeddingProvider
+    from l6e_forge.memory.managers.memory import MemoryManager
+    from l6e_forge.runtime.http import HttpClientPool
+
+    waits: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "PUT" and request.url.path.endswith("/points"):
+            waits.append(request.url.params.get("wait"))
+        return httpx.Response(200, json={"result": {}})
+
+    pool = HttpClientPool(transport=httpx.MockTransport(handler))
+    qb = QdrantVectorStore(endpoint="http://qdrant.test", http=pool)
+    mm = MemoryManager(qb, embedder=MockEmbeddingProvider(dim=8))
+    docs = ((f"d{i}", f"doc {i}", None) for i in range(5))
+    report = await mm.store_vectors_bulk("bulk", docs, batch_size=2)
+    await pool.aclose()
+    assert waits == ["false", "false", "true"]
+    assert report.entry_count == 5 and report.processed_count == 5
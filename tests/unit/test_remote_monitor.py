@@ -0,0 +1,96 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from l6e_forge.monitor.inmemory import InMemoryMonitoringService
+from l6e_forge.monitor.remote import RemoteMonitoringService
+from l6e_forge.runtime.http import HttpClientPool
+from l6e_forge.web.monitor.app import create_app
+
+
+@pytest.mark.asyncio
+async def test_remote_monitor_batches_writes_in_background() -> None:
+    calls: list[tuple[str, dict]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.url.path, json.loads(request.content)))
+        return httpx.Response(200, json={"ok": True})
+
+    pool = HttpClientPool(transport=httpx.MockTransport(handler))
+    mon = RemoteMonitoringService(
+        "http://monitor.test", http=pool, batch_size=3, flush_interval=0.01
+    )
+    await mon.record_metric("response_time_ms", 12.5, tags={"agent": "a"})
+    mon.set_agent_status("a1", "agent-a", "ready")
+    mon.add_chat_log("c1", "user", "hi", agent_id="a1")
+    await mon.record_event("chat.message", {"direction": "in"})
+    # Nothing is sent on the caller's path
+    assert calls == []
+    for _ in range(100):
+        if sum(len(body["items"]) for _path, body in calls) == 4:
+            break
+        await asyncio.sleep(0.01)
+    assert {path for path, _body in calls} == {"/ingest/batch"}
+    items = [item for _path, body in calls for item in body["items"]]
+    assert [i["kind"] for i in items] == ["metric", "agent_status", "chat", "event"]
+    assert items[0] == {
+        "kind": "metric",
+        "name": "response_time_ms",
+        "value": 12.5,
+        "tags": {"agent": "a"},
+    }
+    assert mon.exporter_stats()["sent"] == 4
+    await mon.aclose()
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_remote_monitor_drops_oldest_when_queue_is_full() -> None:
+    bodies: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(503)
+
+    pool = HttpClientPool(transport=httpx.MockTransport(handler))
+    mon = RemoteMonitoringService(
+        "http://monitor.test", http=pool, max_queue=5, batch_size=100, flush_interval=60
+    )
+    for i in range(8):
+        await mon.record_metric("m", float(i))
+    await mon.flush()
+    assert [item["value"] for item in bodies[0]["items"]] == [3.0, 4.0, 5.0, 6.0, 7.0]
+    stats = mon.exporter_stats()
+    assert stats["dropped"] == 3 and stats["failed"] == 5 and stats["queued"] == 0
+    await mon.aclose()
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_monitor_app_ingests_batches() -> None:
+    monitor = InMemoryMonitoringService()
+    transport = httpx.ASGITransport(app=create_app(monitor))
+    async with httpx.AsyncClient(transport=transport, base_url="http://m") as client:
+        r = await client.post(
+            "/ingest/batch",
+            json={
+                "items": [
+                    {"kind": "metric", "name": "response_time_ms", "value": 5},
+                    {"kind": "agent_status", "agent_id": "a1", "name": "a"},
+                    {
+                        "kind": "chat",
+                        "conversation_id": "c",
+                        "role": "user",
+                        "content": "x",
+                    },
+                    {"kind": "bogus"},
+                ]
+            },
+        )
+    body = r.json()
+    assert body["accepted"] == 3 and [e["index"] for e in body["errors"]] == [3]
+    assert monitor.get_perf_summary()["count"] == 1
+    assert [a["agent_id"] for a in monitor.get_agent_status()] == ["a1"]
+    assert monitor.get_chat_logs()[0]["content"] == "x"
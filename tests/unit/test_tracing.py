@@ -0,0 +1,111 @@
+import asyncio
+from typing import Any, Iterator
+
+import httpx
+import pytest
+
+from l6e_forge.memory.backends.inmemory import InMemoryVectorStore
+from l6e_forge.memory.embeddings.mock import MockEmbeddingProvider
+from l6e_forge.memory.managers.memory import MemoryManager
+from l6e_forge.monitor.inmemory import InMemoryMonitoringService
+from l6e_forge.monitor.tracing import current_span, set_span_exporter, span
+from l6e_forge.web.monitor.app import create_app
+
+
+@pytest.fixture
+def spans() -> Iterator[list[dict[str, Any]]]:
+    collected: list[dict[str, Any]] = []
+    set_span_exporter(collected.append)
+    yield collected
+    set_span_exporter(None)
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_per_task(spans) -> None:
+    async def request(name: str) -> None:
+        with span(name):
+            await asyncio.sleep(0)
+            with span(f"{name}.child"):
+                await asyncio.sleep(0)
+
+    await asyncio.gather(request("a"), request("b"))
+    assert current_span() is None
+    by_name = {s["name"]: s for s in spans}
+    for name in ("a", "b"):
+        root, child = by_name[name], by_name[f"{name}.child"]
+        assert root["parent_id"] is None
+        assert child["parent_id"] == root["span_id"]
+        assert child["trace_id"] == root["trace_id"]
+    assert by_name["a"]["trace_id"] != by_name["b"]["trace_id"]
+
+
+def test_span_records_errors(spans) -> None:
+    with pytest.raises(ValueError):
+        with span("boom"):
+            raise ValueError("bad")
+    assert spans[0]["status"] == "error" and "bad" in spans[0]["error"]
+
+
+@pytest.mark.asyncio
+async def test_memory_calls_become_child_spans(spans) -> None:
+    mm = MemoryManager(InMemoryVectorStore(), embedder=MockEmbeddingProvider(dim=8))
+    await mm.store_vector("ns", "k1", "hello world")
+    spans.clear()
+    with span("request") as root:
+        await mm.search_vectors("ns", "hello", limit=1)
+    names = {s["name"] for s in spans if s["parent_id"] == root.span_id}
+    assert {"memory.embed", "memory.vector_query"} <= names
+    assert all(s["trace_id"] == root.trace_id for s in spans)
+
+
+@pytest.mark.asyncio
+async def test_monitor_stores_traces_for_waterfall() -> None:
+    mon = InMemoryMonitoringService()
+    set_span_exporter(mon.record_span)
+    try:
+        with span("request") as root:
+            with span("step"):
+                with span("inner"):
+                    pass
+    finally:
+        set_span_exporter(None)
+    [summary] = mon.get_traces()
+    assert summary["trace_id"] == root.trace_id
+    assert summary["name"] == "request" and summary["span_count"] == 3
+    trace = mon.get_trace(root.trace_id)
+    assert trace is not None
+    assert [(s["name"], s["depth"]) for s in trace["spans"]] == [
+        ("request", 0),
+        ("step", 1),
+        ("inner", 2),
+    ]
+    assert trace["spans"][0]["offset_ms"] == 0
+    assert mon.get_trace("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_monitor_app_ingests_spans() -> None:
+    mon = InMemoryMonitoringService()
+    span_dict: dict[str, Any] = {
+        "trace_id": "t1",
+        "span_id": "s1",
+        "parent_id": None,
+        "name": "request",
+        "start_ns": 1_000_000,
+        "duration_ms": 2.5,
+        "status": "ok",
+        "error": None,
+        "attributes": {},
+    }
+    transport = httpx.ASGITransport(app=create_app(mon))
+    async with httpx.AsyncClient(transport=transport, base_url="http://m") as client:
+        r = await client.post(
+            "/ingest/batch", json={"items": [{"kind": "span", **span_dict}]}
+        )
+        assert r.json()["accepted"] == 1
+        traces = (await client.get("/api/traces")).json()
+        detail = await client.get("/api/traces/t1")
+        missing = await client.get("/api/traces/nope")
+    assert traces[0]["duration_ms"] == 2.5
+    assert detail.json()["spans"][0]["name"] == "request"
+    assert missing.status_code == 404
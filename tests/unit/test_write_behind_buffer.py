@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from l6e_forge.memory.conversation.buffer import WriteBehindBuffer
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sync_writes_share_one_batch() -> None:
+    batches: list[list[int]] = []
+
+    async def flush(items: list[int]) -> None:
+        batches.append(items)
+
+    buf: WriteBehindBuffer[int] = WriteBehindBuffer(flush, flush_interval_ms=10)
+    await asyncio.gather(*(buf.put(i) for i in range(20)))
+    assert batches == [list(range(20))]
+    stats = buf.stats()
+    assert stats["batches"] == 1 and stats["last_batch_size"] == 20
+    assert stats["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_size_threshold_flushes_before_the_timer() -> None:
+    batches: list[list[int]] = []
+
+    async def flush(items: list[int]) -> None:
+        batches.append(items)
+
+    buf: WriteBehindBuffer[int] = WriteBehindBuffer(
+        flush, max_batch_size=4, flush_interval_ms=10_000
+    )
+    await asyncio.wait_for(asyncio.gather(*(buf.put(i) for i in range(8))), 1.0)
+    assert batches == [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+
+@pytest.mark.asyncio
+async def test_async_ack_returns_immediately_and_unflushed_is_visible() -> None:
+    release = asyncio.Event()
+    written: list[str] = []
+
+    async def flush(items: list[str]) -> None:
+        await release.wait()
+        written.extend(items)
+
+    buf: WriteBehindBuffer[str] = WriteBehindBuffer(flush, flush_interval_ms=0)
+    await buf.put("a", wait=False)
+    assert buf.unflushed() == ["a"]
+    await asyncio.sleep(0.01)  # now in flight
+    assert buf.unflushed() == ["a"] and buf.stats()["in_flight"] == 1
+    release.set()
+    await buf.aclose()
+    assert written == ["a"] and buf.unflushed() == []
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_raises_for_sync_writers_and_counts_drops() -> None:
+    async def flush(items: list[int]) -> None:
+        raise RuntimeError("db down")
+
+    buf: WriteBehindBuffer[int] = WriteBehindBuffer(flush, flush_interval_ms=0)
+    await buf.put(1, wait=False)
+    with pytest.raises(RuntimeError, match="db down"):
+        await buf.put(2)
+    await buf.aclose()
+    stats = buf.stats()
+    assert stats["failed_batches"] >= 1 and stats["dropped"] == 1